@@ -206,7 +206,7 @@ export function Todos() {
       )}
 
       {/* Pagination */}
-      {data && data.total_count > 0 ? (
+      {data?.total_count ? (
         <div className="mt-6 mb-10 flex justify-between items-center">
           <div className="text-sm text-gray-700">
             Showing {((page - 1) * pageSize) + 1} to {Math.min(page * pageSize, data.total_count)} of {data.total_count} items
@@ -221,7 +221,7 @@ export function Todos() {
             </button>
             <button
               onClick={() => handleFilterChange('page', String(page + 1))}
-              disabled={page * pageSize >= data.total_count}
+              disabled={!data.has_more}
               className="px-3 py-1 rounded-md border border-gray-300 disabled:opacity-50"
             >
               Next
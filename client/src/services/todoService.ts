@@ -24,6 +24,8 @@ export const todoService = {
     params.append('page_size', String(pagination.page_size));
     if (pagination.order_by) params.append('order_by', pagination.order_by);
     if (pagination.order_direction) params.append('order_direction', pagination.order_direction);
+    if (pagination.cursor) params.append('cursor', pagination.cursor);
+    if (pagination.include_total === false) params.append('include_total', 'false');
 
     const response = await api.get(`/todos?${params.toString()}`);
     return response.data;
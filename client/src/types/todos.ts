@@ -11,6 +11,7 @@ export interface Todo {
   created_at: string;
   updated_at: string;
   subtasks: Todo[];
+  highlights?: [number, number][] | null;
 }
 
 export interface TodoCreate {
@@ -39,6 +40,8 @@ export interface PaginationParams {
   page_size: number;
   order_by?: string;
   order_direction?: 'asc' | 'desc';
+  cursor?: string;
+  include_total?: boolean;
 }
 
 export interface TodoReorder {
@@ -53,7 +56,9 @@ export interface TodoReorderRequest {
 
 export interface PaginatedResponse<T> {
   items: T[];
-  total_count: number;
-  page: number;
+  total_count: number | null;
+  page: number | null;
   page_size: number;
+  has_more: boolean;
+  next_cursor: string | null;
 } 
\ No newline at end of file
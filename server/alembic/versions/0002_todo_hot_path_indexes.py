@@ -0,0 +1,47 @@
+"""todo hot path indexes
+
+Composite indexes matching the ``TodoService.list_todos`` filter/order
+combinations, a ``parent_id`` index for subtask fetches and a ``user_id``
+index on refresh tokens.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_todos_user_id_parent_id_order", "todos", ["user_id", "parent_id", "order", "id"]
+    )
+    op.create_index(
+        "ix_todos_user_id_parent_id_created_at", "todos", ["user_id", "parent_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_todos_user_id_status_created_at", "todos", ["user_id", "status", "created_at"]
+    )
+    op.create_index(
+        "ix_todos_user_id_is_bookmarked_created_at", "todos", ["user_id", "is_bookmarked", "created_at"]
+    )
+    op.create_index("ix_todos_parent_id", "todos", ["parent_id"])
+    op.create_index("ix_refresh_tokens_user_id", "refresh_tokens", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_user_id", table_name="refresh_tokens")
+    op.drop_index("ix_todos_parent_id", table_name="todos")
+    op.drop_index("ix_todos_user_id_is_bookmarked_created_at", table_name="todos")
+    op.drop_index("ix_todos_user_id_status_created_at", table_name="todos")
+    op.drop_index("ix_todos_user_id_parent_id_created_at", table_name="todos")
+    op.drop_index("ix_todos_user_id_parent_id_order", table_name="todos")
@@ -0,0 +1,35 @@
+"""todo title trigram index
+
+Enables ``pg_trgm`` and adds a GIN trigram index on ``todos.title`` so
+``ILIKE '%term%'`` searches and ``word_similarity`` ranking use an index.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_todos_title_trgm",
+        "todos",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todos_title_trgm", table_name="todos")
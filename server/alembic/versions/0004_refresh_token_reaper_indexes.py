@@ -0,0 +1,36 @@
+"""refresh token reaper indexes
+
+Partial index on active refresh tokens per user for "log out all
+sessions", and an ``expires_at`` index for the background reaper.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_refresh_tokens_active_user_id",
+        "refresh_tokens",
+        ["user_id"],
+        postgresql_where=sa.text("NOT is_revoked"),
+    )
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_active_user_id", table_name="refresh_tokens")
@@ -0,0 +1,43 @@
+"""cascade deletes
+
+Declares ``todos.parent_id`` and ``refresh_tokens.user_id`` with
+``ON DELETE CASCADE`` so subtasks and sessions are removed by the
+database instead of being loaded and deleted row by row.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 00:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("todos_parent_id_fkey", "todos", type_="foreignkey")
+    op.create_foreign_key(
+        "todos_parent_id_fkey", "todos", "todos", ["parent_id"], ["id"], ondelete="CASCADE"
+    )
+    op.drop_constraint("refresh_tokens_user_id_fkey", "refresh_tokens", type_="foreignkey")
+    op.create_foreign_key(
+        "refresh_tokens_user_id_fkey", "refresh_tokens", "users", ["user_id"], ["id"], ondelete="CASCADE"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("refresh_tokens_user_id_fkey", "refresh_tokens", type_="foreignkey")
+    op.create_foreign_key(
+        "refresh_tokens_user_id_fkey", "refresh_tokens", "users", ["user_id"], ["id"]
+    )
+    op.drop_constraint("todos_parent_id_fkey", "todos", type_="foreignkey")
+    op.create_foreign_key(
+        "todos_parent_id_fkey", "todos", "todos", ["parent_id"], ["id"]
+    )
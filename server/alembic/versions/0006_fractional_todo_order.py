@@ -0,0 +1,54 @@
+"""fractional todo order
+
+Stores ``todos.order`` as double precision so a todo can be moved
+between two siblings by rewriting only its own value, and respaces every
+sibling list so existing todos (all created with order 0) no longer tie.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 00:00:05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Default TODO_ORDER_SPACING at the time of this migration
+ORDER_SPACING = 1024.0
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "todos", "order",
+        existing_type=sa.Integer(),
+        type_=sa.Float(),
+        existing_nullable=False,
+    )
+    # Keep each list's current order (ties broken by ID) with even gaps
+    op.execute(sa.text(
+        'UPDATE todos SET "order" = ranked.position * :spacing '
+        "FROM ("
+        "SELECT id, row_number() OVER ("
+        'PARTITION BY user_id, parent_id ORDER BY "order", id'
+        ") AS position FROM todos"
+        ") AS ranked "
+        "WHERE todos.id = ranked.id"
+    ).bindparams(spacing=ORDER_SPACING))
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "todos", "order",
+        existing_type=sa.Float(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using='round("order")::integer',
+    )
@@ -0,0 +1,47 @@
+"""todo delta sync
+
+Adds the ``(user_id, modified_at)`` index that delta sync and list ETags
+probe, and the ``todo_tombstones`` table recording deleted todos.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 00:00:06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_todos_user_id_modified_at", "todos", ["user_id", "modified_at", "id"])
+
+    op.create_table(
+        "todo_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("todo_id", sa.Integer(), nullable=False),
+        sa.Column("parent_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_todo_tombstones_user_id_deleted_at", "todo_tombstones", ["user_id", "deleted_at"]
+    )
+    op.create_index("ix_todo_tombstones_deleted_at", "todo_tombstones", ["deleted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todo_tombstones_deleted_at", table_name="todo_tombstones")
+    op.drop_index("ix_todo_tombstones_user_id_deleted_at", table_name="todo_tombstones")
+    op.drop_table("todo_tombstones")
+    op.drop_index("ix_todos_user_id_modified_at", table_name="todos")
@@ -0,0 +1,62 @@
+"""todo list versions
+
+Adds ``todo_list_versions``, a per-user write counter behind list ETags,
+and the statement-level triggers on ``todos`` that bump it inside every
+writing transaction.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 00:00:07
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (operation, transition table) of each trigger
+TRIGGERS = (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD"))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "todo_list_versions",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_todo_list_versions() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO todo_list_versions (user_id, version)
+            SELECT DISTINCT changed_todos.user_id, 1
+            FROM changed_todos JOIN users ON users.id = changed_todos.user_id
+            ON CONFLICT (user_id) DO UPDATE SET version = todo_list_versions.version + 1;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    for operation, transition in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER todos_bump_list_version_{operation} AFTER {operation.upper()} ON todos "
+            f"REFERENCING {transition} TABLE AS changed_todos "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_todo_list_versions()"
+        )
+
+
+def downgrade() -> None:
+    for operation, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS todos_bump_list_version_{operation} ON todos")
+    op.execute("DROP FUNCTION IF EXISTS bump_todo_list_versions()")
+    op.drop_table("todo_list_versions")
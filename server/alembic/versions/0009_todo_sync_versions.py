@@ -0,0 +1,129 @@
+"""todo sync versions
+
+Stamps todos and tombstones with the ``todo_list_versions`` version of the
+transaction that wrote them, so delta sync tokens are versions rather than
+timestamps. The version is bumped once per transaction and user by row-level
+triggers, which replace the statement-level insert and update triggers of
+0008. Existing rows keep version 0; clients holding an older timestamp token
+are asked to reload once.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 00:00:08
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Statement-level triggers of 0008 replaced by row-level stamping
+REPLACED_TRIGGERS = (("insert", "NEW"), ("update", "NEW"))
+
+
+def upgrade() -> None:
+    for table in ("todos", "todo_tombstones"):
+        op.add_column(table, sa.Column("sync_version", sa.BigInteger(), server_default="0", nullable=False))
+    op.create_index("ix_todos_user_id_sync_version", "todos", ["user_id", "sync_version"])
+    op.create_index(
+        "ix_todo_tombstones_user_id_sync_version", "todo_tombstones", ["user_id", "sync_version"]
+    )
+    op.drop_index("ix_todo_tombstones_user_id_deleted_at", table_name="todo_tombstones")
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION todo_sync_version(owner_id integer) RETURNS bigint
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            setting_name text := 'todo_sync.user_' || owner_id;
+            next_version bigint := nullif(current_setting(setting_name, true), '')::bigint;
+        BEGIN
+            IF next_version IS NULL THEN
+                INSERT INTO todo_list_versions (user_id, version) VALUES (owner_id, 1)
+                ON CONFLICT (user_id) DO UPDATE SET version = todo_list_versions.version + 1
+                RETURNING version INTO next_version;
+                PERFORM set_config(setting_name, next_version::text, true);
+            END IF;
+            RETURN next_version;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION stamp_todo_sync_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.sync_version := todo_sync_version(NEW.user_id);
+            RETURN NEW;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_todo_list_versions() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM todo_sync_version(owners.user_id)
+            FROM (
+                SELECT DISTINCT changed_todos.user_id
+                FROM changed_todos JOIN users ON users.id = changed_todos.user_id
+            ) AS owners;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    for operation, _ in REPLACED_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS todos_bump_list_version_{operation} ON todos")
+    op.execute(
+        "CREATE TRIGGER todos_stamp_sync_version BEFORE INSERT OR UPDATE ON todos "
+        "FOR EACH ROW EXECUTE FUNCTION stamp_todo_sync_version()"
+    )
+    op.execute(
+        "CREATE TRIGGER todo_tombstones_stamp_sync_version BEFORE INSERT ON todo_tombstones "
+        "FOR EACH ROW EXECUTE FUNCTION stamp_todo_sync_version()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS todo_tombstones_stamp_sync_version ON todo_tombstones")
+    op.execute("DROP TRIGGER IF EXISTS todos_stamp_sync_version ON todos")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_todo_list_versions() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO todo_list_versions (user_id, version)
+            SELECT DISTINCT changed_todos.user_id, 1
+            FROM changed_todos JOIN users ON users.id = changed_todos.user_id
+            ON CONFLICT (user_id) DO UPDATE SET version = todo_list_versions.version + 1;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    for operation, transition in REPLACED_TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER todos_bump_list_version_{operation} AFTER {operation.upper()} ON todos "
+            f"REFERENCING {transition} TABLE AS changed_todos "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_todo_list_versions()"
+        )
+    op.execute("DROP FUNCTION IF EXISTS stamp_todo_sync_version()")
+    op.execute("DROP FUNCTION IF EXISTS todo_sync_version(integer)")
+
+    op.create_index(
+        "ix_todo_tombstones_user_id_deleted_at", "todo_tombstones", ["user_id", "deleted_at"]
+    )
+    op.drop_index("ix_todo_tombstones_user_id_sync_version", table_name="todo_tombstones")
+    op.drop_index("ix_todos_user_id_sync_version", table_name="todos")
+    for table in ("todos", "todo_tombstones"):
+        op.drop_column(table, "sync_version")
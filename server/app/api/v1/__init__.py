@@ -1,3 +1,3 @@
-from app.api.v1 import auth, todos
+from app.api.v1 import auth, internal, todos
 
-__all__ = ["auth", "todos"]
\ No newline at end of file
+__all__ = ["auth", "internal", "todos"]
\ No newline at end of file
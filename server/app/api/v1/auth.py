@@ -1,19 +1,31 @@
 import asyncio
-from typing import Any
+from typing import Any, Optional
 import uuid
 from fastapi import APIRouter, Depends, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, update
 
-from app.core.exceptions import (BaseAppException, ValidationException, UnauthorizedException)
+from app.core.deps import get_current_active_user
+from app.core.exceptions import (
+    PG_UNIQUE_VIOLATION,
+    BaseAppException,
+    ValidationException,
+    UnauthorizedException,
+    extract_constraint_name,
+    extract_unique_violation_details
+)
 
+from app.core.hashing import hashing_service
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
-    verify_password,
+    hash_refresh_token,
+    is_legacy_refresh_token_hash,
+    verify_refresh_token_hash,
     verify_token
 )
 from app.db.database import get_db
@@ -25,6 +37,92 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Unique indexes on ``users`` and the field each one guards
+USER_UNIQUE_CONSTRAINT_FIELDS = {
+    "ix_users_username": "username",
+    "ix_users_email": "email",
+}
+
+def _revoke_refresh_token_cte(jti: uuid.UUID):
+    """Build an ``UPDATE ... RETURNING user_id, token_hash`` CTE that revokes an active token.
+
+    Matching on ``NOT is_revoked`` makes the update the only check-and-set:
+    concurrent requests with the same token serialize on the row lock and only
+    the first one gets a row back. The stored digest is returned so the caller
+    can compare it in constant time.
+    """
+    return (
+        update(RefreshToken)
+        .where(RefreshToken.jti == jti, RefreshToken.is_revoked == False)
+        .values(is_revoked=True)
+        .returning(RefreshToken.user_id, RefreshToken.token_hash)
+        .cte("revoked")
+    )
+
+async def _revoke_refresh_token(db: AsyncSession, token: str, jti: uuid.UUID) -> Optional[User]:
+    """Revoke an active refresh token and return its user in one round trip.
+
+    The stored digest is checked with ``hmac.compare_digest`` after the row
+    is revoked; on a mismatch the revocation is rolled back. Rows written
+    before refresh tokens were HMAC-digested hold a bcrypt hash; those are
+    verified with bcrypt and rewritten as an HMAC digest. The caller commits.
+    """
+    revoked = _revoke_refresh_token_cte(jti)
+    result = await db.execute(
+        select(User, revoked.c.token_hash).join(revoked, User.id == revoked.c.user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    user, token_hash = row
+    if is_legacy_refresh_token_hash(token_hash):
+        if not await hashing_service.verify(token, token_hash):
+            await db.rollback()
+            return None
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.jti == jti)
+            .values(token_hash=hash_refresh_token(token))
+        )
+    elif not verify_refresh_token_hash(token, token_hash):
+        await db.rollback()
+        return None
+    return user
+
+def _get_refresh_token_jti(payload: Optional[dict]) -> uuid.UUID:
+    """Extract the jti of a decoded refresh token, rejecting malformed tokens."""
+    if not payload or not payload.get("sub") or not payload.get("jti"):
+        raise UnauthorizedException(
+            message="Invalid refresh token"
+        )
+    try:
+        return uuid.UUID(payload["jti"])
+    except (ValueError, TypeError, AttributeError):
+        raise UnauthorizedException(
+            message="Invalid refresh token"
+        )
+
+def _handle_unique_violation(error: IntegrityError) -> None:
+    """Map a unique violation on ``users`` to a user-facing validation error.
+
+    Raises:
+        ValidationException: If the username or email is already registered
+    """
+    orig = getattr(error, 'orig', None)
+    pgcode = getattr(orig, 'sqlstate', None) or getattr(orig, 'pgcode', None)
+    if pgcode != PG_UNIQUE_VIOLATION:
+        return
+
+    field_name = USER_UNIQUE_CONSTRAINT_FIELDS.get(extract_constraint_name(str(orig)))
+    if field_name is None:
+        field_name = extract_unique_violation_details(str(orig))
+
+    if field_name == "username":
+        raise ValidationException(message="Username already registered")
+    if field_name == "email":
+        raise ValidationException(message="Email already registered")
+
 @router.post("/register", response_model=UserResponse)
 async def register(
     *,
@@ -32,34 +130,28 @@ async def register(
     user_in: UserCreate
 ) -> Any:
     try:
-        # Check if username exists
-        result = await db.execute(select(User).where(User.username == user_in.username))
-        if result.first():
-            raise ValidationException(
-                message="Username already registered"
-            )
-        
-        # Check if email exists
-        result = await db.execute(select(User).where(User.email == user_in.email))
-        if result.first():
-            raise ValidationException(
-                message="Email already registered"
+        hashed_password = await hashing_service.hash(user_in.password)
+
+        # Let the unique indexes reject duplicates instead of checking first
+        result = await db.execute(
+            insert(User)
+            .values(
+                username=user_in.username,
+                email=user_in.email,
+                name=user_in.name,
+                hashed_password=hashed_password
             )
-        
-        # Create new user
-        user = User(
-            username=user_in.username,
-            email=user_in.email,
-            name=user_in.name,
-            hashed_password=get_password_hash(user_in.password)
+            .returning(User)
         )
-        db.add(user)
+        user = result.scalar_one()
         await db.commit()
-        await db.refresh(user)
         
         return user
-    except ValidationException as e:
-        raise e
+    except IntegrityError as e:
+        await db.rollback()
+        _handle_unique_violation(e)
+        logger.error(f"Error creating user: {e}", exc_info=True)
+        raise BaseAppException("Could not create user. Please try again later.") from e
     except Exception as e:
         logger.error(f"Error creating user: {e}", exc_info=True)
         raise BaseAppException("Could not create user. Please try again later.") from e
@@ -75,7 +167,7 @@ async def login(
         result = await db.execute(select(User).where(User.username == form_data.username))
         user = result.scalar_one_or_none()
         
-        if not user or not verify_password(form_data.password, user.hashed_password):
+        if not user or not await hashing_service.verify(form_data.password, user.hashed_password):
             raise UnauthorizedException(
                 message="Incorrect username or password"
             )
@@ -93,7 +185,7 @@ async def login(
         # Store refresh token in database
         refresh_token_obj = RefreshToken(
             jti=refresh_token_jti,
-            token_hash=get_password_hash(refresh_token),
+            token_hash=hash_refresh_token(refresh_token),
             user_id=user.id,
             expires_at=refresh_token_expires_at
         )
@@ -127,34 +219,13 @@ async def refresh_token(
                 message="Invalid refresh token"
             )
         
-        payload = verify_token(token)
-        if not payload:
-            raise UnauthorizedException(
-                message="Invalid refresh token"
-            )
-        
-        user_id = payload.get("sub")
-        jti = payload.get("jti")
+        jti = _get_refresh_token_jti(verify_token(token))
 
-        if not user_id or not jti:
-            raise UnauthorizedException(
-                message="Invalid refresh token"
-            )
-        
-        # Get refresh token from database
-        result = await db.execute(select(RefreshToken).where(RefreshToken.jti == jti, RefreshToken.is_revoked == False))
-        refresh_token_obj = result.scalar_one_or_none()
-
-        if not refresh_token_obj or not verify_password(token, refresh_token_obj.token_hash):
-            raise UnauthorizedException(
-                message="Invalid refresh token"
-            )
-
-        user = await db.execute(select(User).where(User.id == int(user_id)))
-        user = user.scalar_one_or_none()
+        # Revoke the old refresh token and load its user in one statement
+        user = await _revoke_refresh_token(db, token, jti)
         if not user:
             raise UnauthorizedException(
-                message="User not found"
+                message="Invalid refresh token"
             )
         
         if not user.is_active:
@@ -167,14 +238,10 @@ async def refresh_token(
         refresh_token_jti = uuid.uuid4()
         new_refresh_token, new_refresh_token_expires_at = create_refresh_token(data={"sub": str(user.id), "jti": str(refresh_token_jti)})
 
-        # Revoke old refresh token
-        refresh_token_obj.is_revoked = True
-        await db.commit()
-
-        # Store refresh token in database
+        # Store the new refresh token in the same transaction as the revocation
         refresh_token_obj = RefreshToken(
             jti=refresh_token_jti,
-            token_hash=get_password_hash(new_refresh_token),
+            token_hash=hash_refresh_token(new_refresh_token),
             user_id=user.id,
             expires_at=new_refresh_token_expires_at
         )
@@ -204,32 +271,39 @@ async def logout(
 ) -> None:
     try:
         token = request.cookies.get("refresh_token")
-
-        payload = verify_token(token)
-        if not payload:
-            raise UnauthorizedException(
-                message="Invalid refresh token"
-            )
-        
-        jti = payload.get("jti")
-        if not jti:
+        if not token:
             raise UnauthorizedException(
                 message="Invalid refresh token"
             )
-        
-        # Get refresh token from database
-        result = await db.execute(select(RefreshToken).where(RefreshToken.jti == jti, RefreshToken.is_revoked == False))
-        refresh_token_obj = result.scalar_one_or_none()
-        
-        if not refresh_token_obj or not verify_password(token, refresh_token_obj.token_hash):
+
+        jti = _get_refresh_token_jti(verify_token(token))
+        if not await _revoke_refresh_token(db, token, jti):
             raise UnauthorizedException(
                 message="Invalid refresh token"
             )
-        
-        refresh_token_obj.is_revoked = True
         await db.commit()
         
         response.delete_cookie("refresh_token")
     except Exception as e:
         logger.error(f"Error logging out: {e}", exc_info=True)
-        raise BaseAppException("Could not log out. Please try again later.") from e
\ No newline at end of file
+        raise BaseAppException("Could not log out. Please try again later.") from e
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> None:
+    try:
+        # Revoke every active session of the user with a single statement
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == current_user.id, RefreshToken.is_revoked == False)
+            .values(is_revoked=True)
+        )
+        await db.commit()
+
+        response.delete_cookie("refresh_token")
+    except Exception as e:
+        logger.error(f"Error logging out all sessions: {e}", exc_info=True)
+        raise BaseAppException("Could not log out. Please try again later.") from e
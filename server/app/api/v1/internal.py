@@ -0,0 +1,20 @@
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.core.hashing import hashing_service
+from app.core.pubsub import change_hub
+from app.db.database import engine, replica_engine
+from app.db.pool import get_pool_stats
+
+router = APIRouter()
+
+@router.get("/metrics")
+async def get_metrics() -> Any:
+    """Report connection pool and password hashing pool usage for this worker."""
+    return {
+        "database_pool": get_pool_stats(engine.pool),
+        "replica_pool": get_pool_stats(replica_engine.pool) if replica_engine else None,
+        "hashing": hashing_service.stats(),
+        "change_events": change_hub.stats(),
+    }
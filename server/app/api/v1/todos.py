@@ -1,20 +1,42 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, status
+import asyncio
+import json
+from typing import Any, AsyncIterator, List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Header, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_active_user
+from app.core.config import settings
+from app.core.deps import get_current_active_user, get_read_db
 from app.db.database import get_db
 from app.models.users import User
 from app.schemas.todos import (
+    TodoBulkCreateRequest,
+    TodoBulkCreateResponse,
+    TodoBulkDeleteRequest,
+    TodoBulkResult,
+    TodoBulkUpdateRequest,
+    TodoChangesResponse,
     TodoCreate,
     TodoReorderRequest,
     TodoUpdate,
     TodoResponse,
     TodoFilter,
+    TodoImportResponse,
+    TodoMoveRequest,
     PaginationParams
 )
+from app.core.exceptions import ValidationException
 from app.core.logging import get_logger
-from app.services.todos import TodoService
+from app.core.pubsub import change_hub
+from app.core.responses import (
+    CONDITIONAL_CACHE_HEADERS,
+    ModelJSONResponse,
+    etag_matches,
+    not_modified_response
+)
+from app.services.todo_export import EXPORT_FORMATS, stream_todo_export
+from app.services.todo_import import TodoImportService
+from app.services.todos import TodoService, rebalance_todo_order
 
 logger = get_logger(__name__)
 
@@ -28,28 +50,145 @@ async def create_todo(
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     todo_service = TodoService(db)
-    return await todo_service.create_todo(todo_in, current_user)
+    return ModelJSONResponse(await todo_service.create_todo(todo_in, current_user))
+
+@router.post("/bulk", response_model=TodoBulkCreateResponse)
+async def create_todos_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    bulk_request: TodoBulkCreateRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    todo_service = TodoService(db)
+    return ModelJSONResponse(await todo_service.create_todos_bulk(bulk_request, current_user))
+
+@router.patch("/bulk", response_model=TodoBulkResult)
+async def update_todos_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    bulk_request: TodoBulkUpdateRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    todo_service = TodoService(db)
+    return await todo_service.update_todos_bulk(bulk_request, current_user)
+
+@router.delete("/bulk", response_model=TodoBulkResult)
+async def delete_todos_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    bulk_request: TodoBulkDeleteRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    todo_service = TodoService(db)
+    return await todo_service.delete_todos_bulk(bulk_request, current_user)
+
+@router.post("/import", response_model=TodoImportResponse)
+async def import_todos(
+    *,
+    db: AsyncSession = Depends(get_db),
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    dry_run: bool = False,
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    # Infer the format from the file name unless given
+    import_format = format or ("csv" if (file.filename or "").lower().endswith(".csv") else "ndjson")
+    if import_format not in EXPORT_FORMATS:
+        raise ValidationException(message=f"Unsupported import format, use one of: {', '.join(EXPORT_FORMATS)}")
+    todo_service = TodoImportService(db)
+    return ModelJSONResponse(await todo_service.import_todos(file.file, import_format, dry_run, current_user))
 
 @router.get("")
 async def list_todos(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
     filters: TodoFilter = Depends(),
-    pagination: PaginationParams = Depends()
+    pagination: PaginationParams = Depends(),
+    if_none_match: Optional[str] = Header(None)
+) -> Any:
+    todo_service = TodoService(db)
+    # Answer unchanged polls before running the page query
+    etag = await todo_service.get_list_etag(current_user, filters, pagination)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    return ModelJSONResponse(
+        await todo_service.list_todos(current_user, filters, pagination),
+        headers={"ETag": etag, **CONDITIONAL_CACHE_HEADERS}
+    )
+
+@router.get("/changes", response_model=TodoChangesResponse)
+async def list_todo_changes(
+    *,
+    # Always the primary, so a sync right after a write includes it
+    db: AsyncSession = Depends(get_db),
+    since: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     todo_service = TodoService(db)
-    return await todo_service.list_todos(current_user, filters, pagination)
+    return ModelJSONResponse(await todo_service.list_changes(current_user, since))
+
+async def _todo_event_stream(request: Request, user_id: int) -> AsyncIterator[str]:
+    """Format a user's change events as Server-Sent Events until the client leaves."""
+    async with change_hub.subscribe(user_id) as subscription:
+        yield ": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=settings.TODO_EVENTS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+@router.get("/events")
+async def stream_todo_events(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    # Return the auth lookup's connection to the pool; streams stay open for hours
+    await db.close()
+    return StreamingResponse(
+        _todo_event_stream(request, current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/export")
+async def export_todos(
+    *,
+    db: AsyncSession = Depends(get_db),
+    format: str = "ndjson",
+    nested: bool = True,
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    if format not in EXPORT_FORMATS:
+        raise ValidationException(message=f"Unsupported export format, use one of: {', '.join(EXPORT_FORMATS)}")
+    # The export streams from its own session; release the auth lookup's connection
+    await db.close()
+    return StreamingResponse(
+        stream_todo_export(current_user.id, format, nested),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="todos.{format}"'}
+    )
 
 @router.get("/{todo_id}", response_model=TodoResponse)
 async def get_todo(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     todo_id: int,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    if_none_match: Optional[str] = Header(None)
 ) -> Any:
     todo_service = TodoService(db)
-    return await todo_service.get_todo(todo_id, current_user)
+    etag = await todo_service.get_todo_etag(todo_id, current_user)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    headers = {"ETag": etag, **CONDITIONAL_CACHE_HEADERS} if etag else None
+    return ModelJSONResponse(await todo_service.get_todo(todo_id, current_user), headers=headers)
 
 @router.patch("/{todo_id}", response_model=TodoResponse)
 async def update_todo(
@@ -60,7 +199,7 @@ async def update_todo(
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     todo_service = TodoService(db)
-    return await todo_service.update_todo(todo_id, todo_in, current_user)
+    return ModelJSONResponse(await todo_service.update_todo(todo_id, todo_in, current_user))
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_todo(
@@ -80,4 +219,19 @@ async def reorder_todos(
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     todo_service = TodoService(db)
-    return await todo_service.reorder_todos(reorder_request, current_user)
\ No newline at end of file
+    return ModelJSONResponse(await todo_service.reorder_todos(reorder_request, current_user))
+
+@router.post("/{todo_id}/move", response_model=TodoResponse)
+async def move_todo(
+    *,
+    db: AsyncSession = Depends(get_db),
+    todo_id: int,
+    move_request: TodoMoveRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    todo_service = TodoService(db)
+    todo, needs_rebalance = await todo_service.move_todo(todo_id, move_request, current_user)
+    if needs_rebalance:
+        background_tasks.add_task(rebalance_todo_order, current_user.id, todo.parent_id)
+    return ModelJSONResponse(todo)
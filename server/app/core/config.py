@@ -16,12 +16,92 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: str = "5432"
     DATABASE_URL: Optional[str] = None
+    # Optional read replica for read-only routes; a user's reads stay on the
+    # primary for READ_YOUR_WRITES_WINDOW_SECONDS after they commit a write,
+    # through a cookie set on the write's response
+    DATABASE_REPLICA_URL: Optional[str] = None
+    READ_YOUR_WRITES_WINDOW_SECONDS: float = 5.0
+    READ_YOUR_WRITES_CACHE_SIZE: int = 10000
+    # "create_all" creates missing tables on startup (development);
+    # "check_migrations" only verifies the database is at the Alembic head
+    DB_STARTUP_MODE: str = "create_all"
+    DB_ECHO: bool = False  # Log every SQL statement
+    # Connection pool, per worker process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced, -1 to disable
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP_CONNECTIONS: Optional[int] = None  # Opened on startup, defaults to DB_POOL_SIZE
+    # asyncpg prepared statement cache per connection; set to 0 behind
+    # PgBouncer in transaction pooling mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Unauthenticated /api/v1/internal/metrics; enable only where the API is not public
+    INTERNAL_METRICS_ENABLED: bool = False
     
     # JWT
     SECRET_KEY: str = "your-secret-key-here"  # Change this in production!
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_TOKEN_HASH_KEY: Optional[str] = None  # Defaults to SECRET_KEY
+    REFRESH_TOKEN_REAPER_ENABLED: bool = True
+    REFRESH_TOKEN_REAPER_INTERVAL_SECONDS: int = 3600
+    REFRESH_TOKEN_REAPER_BATCH_SIZE: int = 1000
+    REFRESH_TOKEN_REAPER_MAX_BATCHES: int = 100  # Per run
+    # Build the current user from access token claims plus a cached
+    # active-status lookup instead of loading the user on every request.
+    # The cache is per process and only invalidated when is_active is set
+    # through the ORM in that process: other workers, and deactivation by
+    # plain SQL, keep accepting the user for up to AUTH_CACHE_TTL_SECONDS.
+    AUTH_CLAIMS_FAST_PATH: bool = False
+    AUTH_CACHE_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    
+    # Password hashing pool ("thread" or "process")
+    HASHING_EXECUTOR: str = "thread"
+    HASHING_MAX_WORKERS: int = 4
+    HASHING_MAX_CONCURRENCY: Optional[int] = None  # Defaults to HASHING_MAX_WORKERS
+    
+    # Todo listing
+    TODO_COUNT_CACHE_SIZE: int = 1024  # Users whose total counts are kept
+    TODO_COUNT_CACHE_FILTERS_PER_USER: int = 32
+    TODO_COUNT_CACHE_TTL_SECONDS: int = 30
+    TODO_BULK_MAX_ITEMS: int = 1000
+    # Fractional ordering: spacing assigned when a sibling list is renumbered,
+    # gap below which a renumber is scheduled in the background, and gap below
+    # which a move renumbers synchronously before placing the todo
+    TODO_ORDER_SPACING: float = 1024.0
+    TODO_ORDER_REBALANCE_GAP: float = 1e-3
+    TODO_ORDER_MIN_GAP: float = 1e-9
+    # Delta sync: changes returned before a client must reload instead,
+    # and how long deleted todos are remembered
+    TODO_SYNC_MAX_CHANGES: int = 1000
+    TODO_TOMBSTONE_RETENTION_DAYS: int = 30
+    TODO_TOMBSTONE_REAPER_ENABLED: bool = True
+    TODO_TOMBSTONE_REAPER_INTERVAL_SECONDS: int = 3600
+    TODO_TOMBSTONE_REAPER_BATCH_SIZE: int = 1000
+    TODO_TOMBSTONE_REAPER_MAX_BATCHES: int = 100  # Per run
+    TODO_EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round trip
+    TODO_IMPORT_BATCH_SIZE: int = 1000  # Rows per multi-row INSERT
+    TODO_IMPORT_MAX_ROWS: int = 100000
+    TODO_IMPORT_MAX_ERRORS: int = 1000  # Row errors listed in the report; all are counted
+    # Live change events: "memory" (single process) or "postgres"
+    # (LISTEN/NOTIFY across workers), events buffered per stream before it
+    # is told to resync, IDs per event before it says "resync" instead, and
+    # the keep-alive interval of event streams
+    TODO_EVENTS_BACKEND: str = "memory"
+    TODO_EVENTS_CHANNEL: str = "todo_changes"
+    TODO_EVENTS_QUEUE_SIZE: int = 100
+    TODO_EVENTS_MAX_IDS: int = 500
+    TODO_EVENTS_HEARTBEAT_SECONDS: int = 15
+    # "auto", "trigram" (PostgreSQL pg_trgm) or "simple"
+    SEARCH_BACKEND: str = "auto"
+    
+    # Request instrumentation
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_REQUEST_THRESHOLD_MS: int = 1000  # Measured to the start of the response
+    SLOW_REQUEST_MAX_STATEMENTS: int = 50  # SQL statements kept per request for the slow log
     
     # Debug
     DEBUG: bool = True
@@ -1,27 +1,70 @@
+import time
 from typing import AsyncGenerator, Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, inspect
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.instrumentation import timed
+from app.core.read_your_writes import is_pinned_by_client
 from app.core.security import verify_token
-from app.db.database import get_db
+from app.db.database import ReplicaSessionLocal, get_db, is_pinned_to_primary
 from app.models.users import User
 from app.schemas.auth import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> User:
+# Fast path caches: raw access token -> decoded payload, user ID -> is_active
+_token_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+_active_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+
+def invalidate_user_auth_cache(user_id: int) -> None:
+    """Forget the cached active status of a user so the next request re-reads it"""
+    _active_cache.pop(user_id)
+
+@event.listens_for(User.is_active, "set")
+def _on_user_active_changed(target: User, value: bool, oldvalue, initiator) -> None:
+    # Only stored users matter; principals built from token claims are transient
+    if inspect(target).has_identity:
+        invalidate_user_auth_cache(target.id)
+
+def _decode_access_token(token: str) -> Optional[dict]:
+    """Decode a token, reusing the cached payload until the token expires"""
+    payload = _token_cache.get(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = verify_token(token)
+    if payload is not None:
+        _token_cache.set(token, payload)
+    return payload
+
+async def _is_user_active(db: AsyncSession, user_id: int) -> Optional[bool]:
+    """Return whether the user is active (None if missing), using the cache"""
+    is_active = _active_cache.get(user_id)
+    if is_active is None:
+        result = await db.execute(select(User.is_active).where(User.id == user_id))
+        is_active = result.scalar_one_or_none()
+        if is_active is None:
+            return None
+        _active_cache.set(user_id, is_active)
+    return is_active
+
+async def _authenticate(db: AsyncSession, token: str) -> User:
+    """Resolve the access token to an active user or raise 401/400"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    payload = verify_token(token)
+    if settings.AUTH_CLAIMS_FAST_PATH:
+        payload = _decode_access_token(token)
+    else:
+        payload = verify_token(token)
     if payload is None:
         raise credentials_exception
     
@@ -29,9 +72,23 @@ async def get_current_user(
     if token_data.sub is None:
         raise credentials_exception
     
-    user = await db.get(User, token_data.sub)
-    if user is None:
-        raise credentials_exception
+    claims = payload.get("user")
+    if settings.AUTH_CLAIMS_FAST_PATH and claims:
+        # Build the principal from the token; only the active flag is looked up
+        is_active = await _is_user_active(db, token_data.sub)
+        if is_active is None:
+            raise credentials_exception
+        user = User(
+            id=token_data.sub,
+            username=claims.get("username"),
+            email=claims.get("email"),
+            name=claims.get("name"),
+            is_active=is_active
+        )
+    else:
+        user = await db.get(User, token_data.sub)
+        if user is None:
+            raise credentials_exception
     
     if not user.is_active:
         raise HTTPException(
@@ -39,8 +96,17 @@ async def get_current_user(
             detail="Inactive user"
         )
     
+    # Commits on this session pin the user's reads to the primary
+    db.info["user_id"] = user.id
     return user
 
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    with timed("auth"):
+        return await _authenticate(db, token)
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -49,4 +115,30 @@ async def get_current_active_user(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    return current_user 
\ No newline at end of file
+    return current_user 
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only routes.
+
+    Uses the read replica when one is configured, unless the user committed a
+    write within the read-your-writes window, as shown by the client's pin
+    cookie or by this worker's own record; then the request's primary session
+    is reused so the user sees their own changes.
+    """
+    if (
+        ReplicaSessionLocal is None
+        or is_pinned_by_client(request)
+        or is_pinned_to_primary(current_user.id)
+    ):
+        yield db
+        return
+
+    async with ReplicaSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.security import get_password_hash, verify_password
+
+logger = get_logger(__name__)
+
+
+class HashingService:
+    """Runs bcrypt hashing and verification on a bounded worker pool.
+
+    bcrypt deliberately takes hundreds of milliseconds; running it inside an
+    async handler blocks every other request on the worker. Calls are capped
+    at ``max_concurrency`` in flight, the rest wait in an asyncio queue whose
+    depth is reported by ``stats()``.
+    """
+
+    def __init__(self, executor_type: str = "thread", max_workers: int = 4, max_concurrency: Optional[int] = None):
+        """Initialize the service; the pool itself is created on first use.
+
+        Args:
+            executor_type (str): "thread" or "process"
+            max_workers (int): Number of pool workers
+            max_concurrency (Optional[int]): Maximum calls in flight, defaults to ``max_workers``
+        """
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency or max_workers
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._max_waiting = 0
+        self._total_wait_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hashing")
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        self._max_waiting = max(self._max_waiting, self._waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._total_wait_seconds += time.perf_counter() - queued_at
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop."""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash off the event loop."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and throughput counters."""
+        return {
+            "executor_type": self.executor_type,
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "waiting": self._waiting,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "max_waiting": self._max_waiting,
+            "avg_wait_ms": (self._total_wait_seconds / self._completed * 1000) if self._completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            logger.info(f"Shutting down hashing executor: {self.stats()}")
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+hashing_service = HashingService(
+    executor_type=settings.HASHING_EXECUTOR,
+    max_workers=settings.HASHING_MAX_WORKERS,
+    max_concurrency=settings.HASHING_MAX_CONCURRENCY
+)
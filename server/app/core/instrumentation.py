@@ -0,0 +1,180 @@
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import get_logger, request_id_var
+
+logger = get_logger(__name__)
+
+# Client-supplied request IDs are accepted only if they look like one
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+MAX_LOGGED_STATEMENT_LENGTH = 500
+
+
+class RequestMetrics:
+    """Timings collected while one request is handled."""
+
+    def __init__(self, request_id: str):
+        self.request_id = request_id
+        self.started_at = time.perf_counter()
+        self.response_started_at: Optional[float] = None
+        self.db_count = 0
+        self.db_seconds = 0.0
+        self.statements: List[Tuple[str, float]] = []
+        self.timings: Dict[str, float] = {}
+
+    def record_statement(self, statement: str, seconds: float) -> None:
+        """Count one executed SQL statement, keeping the first few for the slow log."""
+        self.db_count += 1
+        self.db_seconds += seconds
+        if len(self.statements) < settings.SLOW_REQUEST_MAX_STATEMENTS:
+            self.statements.append((statement, seconds))
+
+    def elapsed_seconds(self) -> float:
+        """Seconds until the response started, or until now if it has not."""
+        return (self.response_started_at or time.perf_counter()) - self.started_at
+
+    def server_timing(self) -> str:
+        """Format the timings as a ``Server-Timing`` header value."""
+        metrics = [f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_count} queries"']
+        metrics.extend(f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.timings.items())
+        metrics.append(f"total;dur={self.elapsed_seconds() * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+_current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the time spent in the block to the current request's ``name`` timing.
+
+    Args:
+        name (str): Server-Timing metric name, e.g. "auth" or "serialize"
+    """
+    metrics = _current_metrics.get()
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.timings[name] = metrics.timings.get(name, 0.0) + time.perf_counter() - started_at
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attribute every SQL statement run on ``engine`` to the current request.
+
+    Args:
+        engine (AsyncEngine): Engine to instrument
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        started_at = conn.info["query_started_at"].pop()
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.record_statement(statement, time.perf_counter() - started_at)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+
+def _get_request_id(scope: Scope) -> str:
+    """Reuse a well-formed ``X-Request-ID`` from the client or create one."""
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            request_id = value.decode("latin-1")
+            if REQUEST_ID_PATTERN.match(request_id):
+                return request_id
+    return uuid.uuid4().hex
+
+
+class RequestInstrumentationMiddleware:
+    """Assign request IDs, time requests and their SQL, and log the result.
+
+    Sets ``request.state.request_id``, returns it as ``X-Request-ID`` and adds
+    a ``Server-Timing`` header with the DB time, statement count and any
+    ``timed`` sections. Requests whose response took longer than
+    ``SLOW_REQUEST_THRESHOLD_MS`` to start are logged with their statements;
+    time spent streaming the body afterwards does not count.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _get_request_id(scope)
+        scope.setdefault("state", {})["request_id"] = request_id
+        metrics = RequestMetrics(request_id)
+        metrics_token = _current_metrics.set(metrics)
+        request_id_token = request_id_var.set(request_id)
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                metrics.response_started_at = time.perf_counter()
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-ID", request_id)
+                if settings.SERVER_TIMING_ENABLED:
+                    headers.append("Server-Timing", metrics.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _log_request(scope, status_code, metrics)
+            request_id_var.reset(request_id_token)
+            _current_metrics.reset(metrics_token)
+
+
+def _log_request(scope: Scope, status_code: int, metrics: RequestMetrics) -> None:
+    """Log a summary of the request, with its statements if it was slow."""
+    elapsed_ms = metrics.elapsed_seconds() * 1000
+    summary: Dict[str, Any] = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "status_code": status_code,
+        "duration_ms": round(elapsed_ms, 1),
+        "db_count": metrics.db_count,
+        "db_ms": round(metrics.db_seconds * 1000, 1),
+        **{f"{name}_ms": round(seconds * 1000, 1) for name, seconds in metrics.timings.items()},
+    }
+    message = (
+        f"{summary['method']} {summary['path']} {status_code} {elapsed_ms:.1f}ms "
+        f"(db: {metrics.db_count} queries, {summary['db_ms']}ms)"
+    )
+
+    if elapsed_ms < settings.SLOW_REQUEST_THRESHOLD_MS:
+        logger.info(message, extra=summary)
+        return
+
+    statements = "\n".join(
+        f"  {seconds * 1000:.1f}ms {' '.join(statement.split())[:MAX_LOGGED_STATEMENT_LENGTH]}"
+        for statement, seconds in metrics.statements
+    )
+    if metrics.db_count > len(metrics.statements):
+        statements += f"\n  ... {metrics.db_count - len(metrics.statements)} more"
+    logger.warning(f"Slow request: {message}\n{statements}", extra=summary)
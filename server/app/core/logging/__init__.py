@@ -1,3 +1,3 @@
-from .logger import get_logger, setup_logging
+from .logger import get_logger, request_id_var, setup_logging
 
-__all__ = ["get_logger", "setup_logging"]
\ No newline at end of file
+__all__ = ["get_logger", "request_id_var", "setup_logging"]
\ No newline at end of file
@@ -1,10 +1,14 @@
 import logging
 import sys
 import os
+from contextvars import ContextVar
 from logging.handlers import RotatingFileHandler
 
 # Default log format
-DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s"
+
+# ID of the HTTP request being handled, set by the request middleware
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
 
 # Log level mapping
 LOG_LEVELS = {
@@ -16,6 +20,15 @@ LOG_LEVELS = {
 }
 
 
+class RequestIdFilter(logging.Filter):
+    """Add the current request ID to every record as ``request_id``"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
 def setup_logging(
     log_level: str = "info",
     log_file: str = None,
@@ -47,11 +60,13 @@ def setup_logging(
     
     # Create formatter
     formatter = logging.Formatter(log_format)
+    request_id_filter = RequestIdFilter()
     
     # Add console handler if requested
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
+        console_handler.addFilter(request_id_filter)
         root_logger.addHandler(console_handler)
     
     # Add file handler if log_file is provided
@@ -67,6 +82,7 @@ def setup_logging(
             backupCount=backup_count
         )
         file_handler.setFormatter(formatter)
+        file_handler.addFilter(request_id_filter)
         root_logger.addHandler(file_handler)
     
     # Log the setup completion
@@ -0,0 +1,280 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+import asyncpg
+from sqlalchemy import event as orm_event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Handler the backend calls for every message it receives: (user_id, event)
+MessageHandler = Callable[[int, Dict[str, Any]], None]
+
+# Sent to a subscriber in place of the events it was too slow to receive
+RESYNC_EVENT: Dict[str, Any] = {"type": "resync"}
+
+
+class PubSubBackend(ABC):
+    """Transport that carries per-user events between processes."""
+
+    @abstractmethod
+    async def start(self, handler: MessageHandler) -> None:
+        """Begin delivering received messages to ``handler``."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop receiving messages and release resources."""
+
+    @abstractmethod
+    async def publish(self, session: AsyncSession, user_id: int, event: Dict[str, Any]) -> None:
+        """Send ``event`` to every process subscribed to ``user_id`` once ``session`` commits.
+
+        Nothing is delivered if the session's transaction rolls back.
+        """
+
+
+class InMemoryBackend(PubSubBackend):
+    """Delivers events within the current process only.
+
+    Events are held in the session's ``info`` until its transaction ends;
+    they are handed to the handler on commit and discarded otherwise.
+    """
+
+    # Key in ``Session.info`` of the events waiting for the transaction to end
+    PENDING_KEY = "pubsub_pending_events"
+
+    def __init__(self):
+        self._handler: Optional[MessageHandler] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    def _deliver(self, session: Any) -> None:
+        pending: List[Any] = session.info.pop(self.PENDING_KEY, [])
+        for user_id, event in pending:
+            if self._handler is None:
+                return
+            try:
+                self._handler(user_id, event)
+            except Exception as e:
+                logger.error(f"Error delivering change event: {e}", exc_info=True)
+
+    def _discard(self, session: Any, transaction: Any) -> None:
+        # Runs after ``_deliver`` on commit; anything left was rolled back or closed
+        if transaction.parent is None:
+            session.info.pop(self.PENDING_KEY, None)
+
+    async def publish(self, session: AsyncSession, user_id: int, event: Dict[str, Any]) -> None:
+        sync_session = session.sync_session
+        if not sync_session.in_transaction():
+            # Begin one so the event waits for the next commit like a NOTIFY would
+            await session.connection()
+        if self.PENDING_KEY not in sync_session.info:
+            sync_session.info[self.PENDING_KEY] = []
+            if not orm_event.contains(sync_session, "after_commit", self._deliver):
+                orm_event.listen(sync_session, "after_commit", self._deliver)
+                orm_event.listen(sync_session, "after_transaction_end", self._discard)
+        sync_session.info[self.PENDING_KEY].append((user_id, event))
+
+
+class PostgresNotifyBackend(PubSubBackend):
+    """Fans events out to every worker through PostgreSQL ``LISTEN/NOTIFY``.
+
+    Listens on one dedicated asyncpg connection per process, outside the
+    SQLAlchemy pool. Events are sent with ``pg_notify`` on the writer's own
+    connection inside its transaction, so PostgreSQL delivers them only on
+    commit and concurrent writers never queue behind a shared connection.
+    Payloads must stay below PostgreSQL's 8000 byte NOTIFY limit.
+    """
+
+    def __init__(self, dsn: str, channel: str):
+        """Initialize the backend.
+
+        Args:
+            dsn (str): asyncpg connection string
+            channel (str): NOTIFY channel shared by all workers
+        """
+        self.dsn = dsn
+        self.channel = channel
+        self._handler: Optional[MessageHandler] = None
+        self._connection: Any = None
+        # Serializes connecting, reconnecting and closing the listener
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        self._connection = await asyncpg.connect(self.dsn)
+        await self._connection.add_listener(self.channel, self._on_notify)
+        self._connection.add_termination_listener(self._on_terminated)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            self._handler(message["user_id"], message["event"])
+        except Exception as e:
+            logger.error(f"Dropping malformed change notification: {e}")
+
+    def _on_terminated(self, connection: Any) -> None:
+        if self._handler is not None:
+            logger.warning("Change notification connection lost, reconnecting")
+            self._connection = None
+            asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 1.0
+        while self._handler is not None and self._connection is None:
+            try:
+                async with self._lock:
+                    await self._connect()
+                logger.info("Change notification connection restored")
+            except Exception as e:
+                logger.error(f"Could not reconnect change notifications: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handler = handler
+        async with self._lock:
+            await self._connect()
+
+    async def stop(self) -> None:
+        self._handler = None
+        async with self._lock:
+            if self._connection is not None:
+                connection, self._connection = self._connection, None
+                await connection.close()
+
+    async def publish(self, session: AsyncSession, user_id: int, event: Dict[str, Any]) -> None:
+        payload = json.dumps({"user_id": user_id, "event": event}, separators=(",", ":"))
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": self.channel, "payload": payload}
+        )
+
+
+class Subscription:
+    """One consumer's bounded queue of events for a single user."""
+
+    def __init__(self, user_id: int, maxsize: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def put(self, event: Dict[str, Any]) -> None:
+        """Queue an event; a full queue is replaced by a single resync event.
+
+        A consumer that fell this far behind cannot apply the events it missed
+        anyway, so it is told to resync instead of holding the publisher up.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.dropped += 1
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the next event."""
+        return await self.queue.get()
+
+
+class ChangeHub:
+    """Per-user pub/sub hub in front of a pluggable backend.
+
+    Publishers never block on subscribers: each subscriber has a bounded
+    queue, and one that overflows is sent a single resync event.
+    """
+
+    def __init__(self, backend: PubSubBackend, queue_size: int = 100):
+        """Initialize the hub.
+
+        Args:
+            backend (PubSubBackend): Transport used to reach every process
+            queue_size (int): Maximum events buffered per subscriber
+        """
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+        self._started = False
+
+    async def start(self) -> None:
+        """Start receiving events from the backend."""
+        if not self._started:
+            await self.backend.start(self._dispatch)
+            self._started = True
+
+    async def stop(self) -> None:
+        """Stop the backend; open subscriptions receive no further events."""
+        if self._started:
+            self._started = False
+            await self.backend.stop()
+
+    def _dispatch(self, user_id: int, event: Dict[str, Any]) -> None:
+        for subscription in self._subscriptions.get(user_id, ()):
+            subscription.put(event)
+
+    async def publish(self, session: AsyncSession, user_id: int, event: Dict[str, Any]) -> None:
+        """Publish an event to every subscriber of a user, in every process.
+
+        Call it inside the write's transaction, before the commit: the event
+        is delivered when ``session`` commits and dropped if it rolls back.
+        Failures are raised, since on PostgreSQL they abort the transaction.
+
+        Args:
+            session (AsyncSession): Session whose transaction made the change
+            user_id (int): ID of the user whose todos changed
+            event (Dict[str, Any]): JSON-serializable event
+        """
+        if not self._started:
+            return
+        await self.backend.publish(session, user_id, event)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[Subscription]:
+        """Receive a user's events for as long as the context is open.
+
+        Args:
+            user_id (int): ID of the user to follow
+
+        Yields:
+            Subscription: Queue of events
+        """
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscriptions.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[user_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return subscriber counts."""
+        return {
+            "backend": type(self.backend).__name__,
+            "users": len(self._subscriptions),
+            "subscriptions": sum(len(subscribers) for subscribers in self._subscriptions.values()),
+        }
+
+
+def _create_backend() -> PubSubBackend:
+    """Return the backend selected by ``settings.TODO_EVENTS_BACKEND``."""
+    if settings.TODO_EVENTS_BACKEND == "postgres":
+        dsn = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+        return PostgresNotifyBackend(dsn, settings.TODO_EVENTS_CHANNEL)
+    return InMemoryBackend()
+
+
+change_hub = ChangeHub(_create_backend(), queue_size=settings.TODO_EVENTS_QUEUE_SIZE)
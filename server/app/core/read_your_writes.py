@@ -0,0 +1,77 @@
+import time
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import Dict, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Cookie pinning a client's reads to the primary; holds the Unix time the pin expires
+READ_YOUR_WRITES_COOKIE = "read_primary_until"
+
+# Per-request flag set when the request commits a write; None outside the middleware
+_request_writes: ContextVar[Optional[Dict[str, bool]]] = ContextVar("request_writes", default=None)
+
+
+def note_committed_write() -> None:
+    """Record that the current request committed a write."""
+    state = _request_writes.get()
+    if state is not None:
+        state["committed"] = True
+
+
+def is_pinned_by_client(connection: HTTPConnection) -> bool:
+    """Return whether the client presented an unexpired read-your-writes pin.
+
+    Args:
+        connection (HTTPConnection): Current request
+
+    Returns:
+        bool: True if the client's reads must go to the primary
+    """
+    pinned_until = connection.cookies.get(READ_YOUR_WRITES_COOKIE)
+    try:
+        return pinned_until is not None and float(pinned_until) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client's reads to the primary after it writes, on every worker.
+
+    Responses to requests that committed a write set a cookie that expires
+    after ``READ_YOUR_WRITES_WINDOW_SECONDS``; ``get_read_db`` honours it on
+    whichever worker serves the next request. The cookie carries no secret:
+    a client forging it only sends its own reads to the primary.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = {"committed": False}
+        token = _request_writes.set(state)
+
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and state["committed"]:
+                window = settings.READ_YOUR_WRITES_WINDOW_SECONDS
+                cookie: SimpleCookie = SimpleCookie()
+                cookie[READ_YOUR_WRITES_COOKIE] = str(round(time.time() + window, 3))
+                cookie[READ_YOUR_WRITES_COOKIE]["max-age"] = max(int(window), 1)
+                cookie[READ_YOUR_WRITES_COOKIE]["path"] = "/"
+                cookie[READ_YOUR_WRITES_COOKIE]["httponly"] = True
+                cookie[READ_YOUR_WRITES_COOKIE]["samesite"] = "Strict"
+                MutableHeaders(scope=message).append("set-cookie", cookie.output(header="").strip())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_pin)
+        finally:
+            _request_writes.reset(token)
@@ -0,0 +1,76 @@
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi import status
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from app.core.instrumentation import timed
+
+# Let clients cache conditional responses but always revalidate them
+CONDITIONAL_CACHE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the types orjson does not know natively."""
+    if isinstance(obj, BaseModel):
+        # Fields only; fine for plain response models without serializers or aliases
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response encoded with orjson that also accepts pydantic models.
+
+    Returning it from a route skips FastAPI's ``response_model`` validation
+    and ``jsonable_encoder`` pass, so the content must already have the shape
+    of the declared response model, e.g. built with ``model_construct``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from values that change whenever the representation does.
+
+    Args:
+        *parts (Any): JSON-serializable values identifying the representation
+
+    Returns:
+        str: Quoted ETag header value
+    """
+    digest = hashlib.sha256(orjson.dumps(parts, default=_default, option=orjson.OPT_UTC_Z)).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``.
+
+    Args:
+        if_none_match (Optional[str]): Raw header value
+        etag (str): Current ETag of the resource
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified_response(etag: str) -> Response:
+    """Build a 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **CONDITIONAL_CACHE_HEADERS})
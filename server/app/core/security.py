@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
@@ -7,12 +9,27 @@ from app.models.users import User
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+REFRESH_TOKEN_HASH_PREFIX = "hmac-sha256$"
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+def hash_refresh_token(token: str) -> str:
+    # Refresh tokens are high-entropy signed JWTs, so a keyed digest is enough;
+    # a slow password hash only burns CPU on the hottest auth path
+    key = (settings.REFRESH_TOKEN_HASH_KEY or settings.SECRET_KEY).encode()
+    digest = hmac.new(key, token.encode(), hashlib.sha256).hexdigest()
+    return f"{REFRESH_TOKEN_HASH_PREFIX}{digest}"
+
+def is_legacy_refresh_token_hash(token_hash: str) -> bool:
+    return not token_hash.startswith(REFRESH_TOKEN_HASH_PREFIX)
+
+def verify_refresh_token_hash(token: str, token_hash: str) -> bool:
+    return hmac.compare_digest(hash_refresh_token(token), token_hash)
+
 def create_access_token(user: User, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = {
         "sub": str(user.id),
@@ -1,15 +1,79 @@
-from typing import AsyncIterator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 from sqlmodel import SQLModel
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.instrumentation import instrument_engine
+from app.core.logging import get_logger
+from app.core.read_your_writes import note_committed_write
+from app.db.pool import get_pool_stats, metered_pool_class
 
-# Create async engine for SQLAlchemy
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+logger = get_logger(__name__)
+
+ALEMBIC_INI_PATH = Path(__file__).parents[2] / "alembic.ini"
+
+def _get_connect_args(database_url: str) -> Dict[str, Any]:
+    """Driver-specific connection arguments"""
+    if database_url.startswith("postgresql+asyncpg"):
+        return {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return {}
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    """Create an async engine with the configured pool settings and request instrumentation"""
+    db_engine = create_async_engine(
+        database_url,
+        echo=settings.DB_ECHO,
+        poolclass=metered_pool_class(),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_get_connect_args(database_url)
+    )
+    instrument_engine(db_engine)
+    return db_engine
+
+# Create async engines for SQLAlchemy; reads fall back to the primary
+# when no replica is configured
+engine = _create_engine(settings.DATABASE_URL)
+replica_engine = _create_engine(settings.DATABASE_REPLICA_URL) if settings.DATABASE_REPLICA_URL else None
 AsyncSessionLocal = sessionmaker(
     engine, expire_on_commit=False, class_=AsyncSession
 )
+ReplicaSessionLocal = sessionmaker(
+    replica_engine, expire_on_commit=False, class_=AsyncSession
+) if replica_engine else None
+
+# Users who committed a write recently: user ID -> True
+_recent_writers = TTLCache(maxsize=settings.READ_YOUR_WRITES_CACHE_SIZE, ttl=settings.READ_YOUR_WRITES_WINDOW_SECONDS)
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    # Sessions are tagged with the authenticated user by get_current_user
+    user_id = session.info.get("user_id")
+    if user_id is not None:
+        mark_recent_write(user_id)
+        note_committed_write()
+
+def mark_recent_write(user_id: int) -> None:
+    """Pin the user's reads on this worker to the primary for the read-your-writes window"""
+    _recent_writers.set(user_id, True)
+
+def is_pinned_to_primary(user_id: int) -> bool:
+    """Return whether this worker saw the user write within the read-your-writes window"""
+    return _recent_writers.get(user_id, False)
 
 # DB Session dependency
 async def get_db() -> AsyncIterator[AsyncSession]:
@@ -21,11 +85,54 @@ async def get_db() -> AsyncIterator[AsyncSession]:
 
 # Helper function to initialize database tables
 async def init_db():
-    """Initialize all defined database tables if they don't exist"""
+    """Prepare the database according to ``settings.DB_STARTUP_MODE``"""
+    if settings.DB_STARTUP_MODE == "check_migrations":
+        await check_db_revision()
+        return
+
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(SQLModel.metadata.create_all)
 
+# Helper function to verify the schema is migrated
+async def check_db_revision():
+    """Raise if the database is not at the latest Alembic revision"""
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI_PATH)))
+    head_revision = script.get_current_head()
+
+    def get_current_revision(sync_conn) -> Optional[str]:
+        return MigrationContext.configure(sync_conn).get_current_revision()
+
+    async with engine.connect() as conn:
+        current_revision = await conn.run_sync(get_current_revision)
+
+    if current_revision != head_revision:
+        raise RuntimeError(
+            f"Database schema is at revision {current_revision!r}, expected {head_revision!r}. "
+            "Run 'alembic upgrade head' before starting the application."
+        )
+    logger.info(f"Database schema is at revision {current_revision}")
+
+# Helper function to open pool connections ahead of the first requests
+async def warm_up_pool():
+    """Open ``settings.DB_POOL_WARMUP_CONNECTIONS`` connections per engine and return them to the pool"""
+    count = settings.DB_POOL_WARMUP_CONNECTIONS
+    if count is None:
+        count = settings.DB_POOL_SIZE
+    count = min(count, settings.DB_POOL_SIZE)
+    if count <= 0:
+        return
+
+    for db_engine in filter(None, (engine, replica_engine)):
+        # Hold all connections at once so the pool has to open distinct ones
+        connections = await asyncio.gather(*(db_engine.connect().start() for _ in range(count)))
+        await asyncio.gather(*(conn.close() for conn in connections))
+        logger.info(f"Database pool warmed up: {get_pool_stats(db_engine.pool)}")
+
 # Helper function to close database connection
 async def close_db():
-    """Close database connection"""
-    await engine.dispose()
\ No newline at end of file
+    """Close database connections"""
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
\ No newline at end of file
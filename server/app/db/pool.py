@@ -0,0 +1,85 @@
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolMetrics:
+    """Checkout counters shared by every pool an engine creates.
+
+    Kept on the pool class rather than the instance because
+    ``engine.dispose()`` replaces the pool with a fresh one of the same class.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        """Record one checkout attempt and how long it waited."""
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return checkout counts and wait times in milliseconds."""
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (self.total_wait_seconds / self.checkouts * 1000) if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that times how long each checkout takes.
+
+    The measured time covers waiting for a free connection, opening a new
+    one when the pool is below its limit, and the pre-ping if enabled. Use
+    ``metered_pool_class`` to get a subclass with its own counters per engine.
+    """
+
+    metrics = PoolMetrics()
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - started_at, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started_at)
+        return connection
+
+
+def metered_pool_class() -> Type[MeteredAsyncQueuePool]:
+    """Return a ``MeteredAsyncQueuePool`` subclass with fresh counters for one engine."""
+    return type("MeteredAsyncQueuePool", (MeteredAsyncQueuePool,), {"metrics": PoolMetrics()})
+
+
+def get_pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Describe the current state of a connection pool.
+
+    Args:
+        pool (Pool): Pool of the engine to describe
+
+    Returns:
+        Dict[str, Any]: Pool size, checked-out and idle connections and checkout wait times
+    """
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "timeout_seconds": pool.timeout(),
+        })
+    if isinstance(pool, MeteredAsyncQueuePool):
+        stats.update(pool.metrics.stats())
+    return stats
@@ -1,13 +1,20 @@
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
 from app.core.exceptions import BaseAppException
-from app.db.database import init_db, close_db
-from app.api.v1 import auth, todos
+from app.core.hashing import hashing_service
+from app.core.instrumentation import RequestInstrumentationMiddleware
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.core.pubsub import change_hub
+from app.db.database import init_db, close_db, warm_up_pool
+from app.services.refresh_tokens import run_refresh_token_reaper
+from app.services.todo_tombstones import run_todo_tombstone_reaper
+from app.api.v1 import auth, internal, todos
 
 # Set up central logging
 log_file = os.path.join(settings.LOG_DIR, f"{settings.PROJECT_NAME.lower()}.log") if settings.LOG_DIR else None
@@ -25,10 +32,23 @@ async def lifespan(app: FastAPI):
     # Initialize database tables on startup
     logger.info("Application startup: Initializing database")
     await init_db()
+    await warm_up_pool()
+    await change_hub.start()
+    reaper_tasks = []
+    if settings.REFRESH_TOKEN_REAPER_ENABLED:
+        reaper_tasks.append(asyncio.create_task(run_refresh_token_reaper()))
+    if settings.TODO_TOMBSTONE_REAPER_ENABLED:
+        reaper_tasks.append(asyncio.create_task(run_todo_tombstone_reaper()))
     yield
+    for reaper_task in reaper_tasks:
+        reaper_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper_task
+    await change_hub.stop()
     # Cleanup database resources on shutdown
     logger.info("Application shutdown: Closing database connections")
     await close_db()
+    hashing_service.shutdown()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -45,8 +65,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Request-ID"],
 )
 
+# Pin clients' reads to the primary after they write, across workers
+if settings.DATABASE_REPLICA_URL:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Added last so it wraps CORS and every other middleware
+app.add_middleware(RequestInstrumentationMiddleware)
+
 # Add global exception handlers
 @app.exception_handler(BaseAppException)
 async def app_exception_handler(request: Request, exc: BaseAppException):
@@ -68,5 +96,7 @@ async def app_exception_handler(request: Request, exc: BaseAppException):
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(todos.router, prefix="/api/v1/todos", tags=["Todos"])
+if settings.INTERNAL_METRICS_ENABLED:
+    app.include_router(internal.router, prefix="/api/v1/internal", tags=["Internal"], include_in_schema=False)
 
 logger.info(f"Application {settings.PROJECT_NAME} initialized successfully")
\ No newline at end of file
@@ -1,4 +1,4 @@
 from .users import User
-from .todos import Todo, TodoStatus
+from .todos import Todo, TodoListVersion, TodoStatus, TodoTombstone
 
-__all__ = ["User", "Todo", "TodoStatus"]
+__all__ = ["User", "Todo", "TodoListVersion", "TodoStatus", "TodoTombstone"]
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 from sqlmodel import Field, Relationship, SQLModel
 from enum import Enum
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import DDL, BigInteger, Column, DateTime, Index, event, func
 
 class TodoStatus(str, Enum):
     PENDING = "pending"
@@ -11,22 +11,49 @@ class TodoStatus(str, Enum):
 
 class Todo(SQLModel, table=True):
     __tablename__ = "todos"
+    __table_args__ = (
+        # Root/subtask listings ordered by position or by creation time
+        Index("ix_todos_user_id_parent_id_order", "user_id", "parent_id", "order", "id"),
+        Index("ix_todos_user_id_parent_id_created_at", "user_id", "parent_id", "created_at", "id"),
+        # Listings filtered by status or bookmark
+        Index("ix_todos_user_id_status_created_at", "user_id", "status", "created_at"),
+        Index("ix_todos_user_id_is_bookmarked_created_at", "user_id", "is_bookmarked", "created_at"),
+        # Subtask fetches by parent
+        Index("ix_todos_parent_id", "parent_id"),
+        # Listings ordered by modification time
+        Index("ix_todos_user_id_modified_at", "user_id", "modified_at", "id"),
+        # Delta sync: todos changed since a version
+        Index("ix_todos_user_id_sync_version", "user_id", "sync_version"),
+        # Substring search on titles (requires the pg_trgm extension)
+        Index(
+            "ix_todos_title_trgm", "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     status: TodoStatus = Field(default=TodoStatus.PENDING)
     is_bookmarked: bool = Field(default=False)
-    order: int = Field(default=0)
+    # Fractional position among siblings: moving a todo between two others
+    # only rewrites its own value (see TodoService.move_todo)
+    order: float = Field(default=0)
     created_at: datetime = Field(
         sa_column=Column(DateTime(timezone=True), server_default=func.now())
     )
     modified_at: datetime = Field(
         sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     )
+    # TodoListVersion of the transaction that last wrote the todo, set by triggers
+    sync_version: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default="0")
+    )
     
     # Foreign Keys
     user_id: int = Field(foreign_key="users.id")
-    parent_id: Optional[int] = Field(default=None, foreign_key="todos.id")
+    parent_id: Optional[int] = Field(default=None, foreign_key="todos.id", ondelete="CASCADE")
 
     # Relationships
     user: "User" = Relationship(back_populates="todos")
@@ -34,7 +61,9 @@ class Todo(SQLModel, table=True):
         back_populates="parent",
         sa_relationship_kwargs={
             "primaryjoin": "Todo.id==Todo.parent_id",
-            "cascade": "all, delete-orphan"
+            "cascade": "all, delete-orphan",
+            # Subtasks are removed by ON DELETE CASCADE, not loaded and deleted one by one
+            "passive_deletes": True
         }
     )
     parent: Optional["Todo"] = Relationship(
@@ -43,4 +72,137 @@ class Todo(SQLModel, table=True):
             "primaryjoin": "Todo.parent_id==Todo.id",
             "remote_side": "Todo.id"
         }
-    ) 
\ No newline at end of file
+    )
+
+class TodoTombstone(SQLModel, table=True):
+    """Record of a deleted todo, kept so delta sync can report the deletion"""
+    __tablename__ = "todo_tombstones"
+    __table_args__ = (
+        Index("ix_todo_tombstones_user_id_sync_version", "user_id", "sync_version"),
+        # Retention purge
+        Index("ix_todo_tombstones_deleted_at", "deleted_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Not a foreign key: the todo no longer exists
+    todo_id: int
+    parent_id: Optional[int] = None
+    user_id: int = Field(foreign_key="users.id", ondelete="CASCADE")
+    deleted_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    # TodoListVersion of the deleting transaction, set by a trigger
+    sync_version: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default="0")
+    )
+
+class TodoListVersion(SQLModel, table=True):
+    """Per-user counter of writes to ``todos``, behind list ETags and sync tokens.
+
+    Triggers bump it once per writing transaction, on its first write to the
+    user's todos, and stamp every todo and tombstone the transaction writes
+    with the new value, so every write path, cascades included, moves it
+    without an extra round trip. The bump holds the row lock until commit, so
+    concurrent writers of one user are numbered in commit order. A user
+    without a row has version 0.
+    """
+    __tablename__ = "todo_list_versions"
+
+    user_id: int = Field(primary_key=True, foreign_key="users.id", ondelete="CASCADE")
+    version: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default="0")
+    )
+
+# Trigger DDL per dialect, run after ``create_all`` and mirrored by migrations
+# 0008 and 0009. The join on users skips todos removed by a cascading user delete.
+TODO_LIST_VERSION_DDL = {
+    "postgresql": [
+        # The transaction's version for a user: bumped on first use, then
+        # remembered in a transaction-local setting
+        """
+        CREATE OR REPLACE FUNCTION todo_sync_version(owner_id integer) RETURNS bigint
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            setting_name text := 'todo_sync.user_' || owner_id;
+            next_version bigint := nullif(current_setting(setting_name, true), '')::bigint;
+        BEGIN
+            IF next_version IS NULL THEN
+                INSERT INTO todo_list_versions (user_id, version) VALUES (owner_id, 1)
+                ON CONFLICT (user_id) DO UPDATE SET version = todo_list_versions.version + 1
+                RETURNING version INTO next_version;
+                PERFORM set_config(setting_name, next_version::text, true);
+            END IF;
+            RETURN next_version;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION stamp_todo_sync_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.sync_version := todo_sync_version(NEW.user_id);
+            RETURN NEW;
+        END
+        $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION bump_todo_list_versions() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM todo_sync_version(owners.user_id)
+            FROM (
+                SELECT DISTINCT changed_todos.user_id
+                FROM changed_todos JOIN users ON users.id = changed_todos.user_id
+            ) AS owners;
+            RETURN NULL;
+        END
+        $$
+        """,
+        "DROP TRIGGER IF EXISTS todos_stamp_sync_version ON todos",
+        "CREATE TRIGGER todos_stamp_sync_version BEFORE INSERT OR UPDATE ON todos "
+        "FOR EACH ROW EXECUTE FUNCTION stamp_todo_sync_version()",
+        "DROP TRIGGER IF EXISTS todo_tombstones_stamp_sync_version ON todo_tombstones",
+        "CREATE TRIGGER todo_tombstones_stamp_sync_version BEFORE INSERT ON todo_tombstones "
+        "FOR EACH ROW EXECUTE FUNCTION stamp_todo_sync_version()",
+        "DROP TRIGGER IF EXISTS todos_bump_list_version_delete ON todos",
+        "CREATE TRIGGER todos_bump_list_version_delete AFTER DELETE ON todos "
+        "REFERENCING OLD TABLE AS changed_todos "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_todo_list_versions()",
+    ],
+    # SQLite (development and tests) has row-level triggers only and a single
+    # writer, so each row simply takes the next version
+    "sqlite": [
+        *[
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_stamp_sync_version_{operation} AFTER {operation.upper()} ON {table}
+            {condition}
+            BEGIN
+                INSERT INTO todo_list_versions (user_id, version) VALUES (NEW.user_id, 1)
+                ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+                UPDATE {table} SET sync_version = (
+                    SELECT version FROM todo_list_versions WHERE user_id = NEW.user_id
+                ) WHERE id = NEW.id;
+            END
+            """
+            for table, operation, condition in (
+                ("todos", "insert", ""),
+                # Skips the trigger's own stamping update
+                ("todos", "update", "WHEN NEW.sync_version IS OLD.sync_version"),
+                ("todo_tombstones", "insert", ""),
+            )
+        ],
+        """
+        CREATE TRIGGER IF NOT EXISTS todos_bump_list_version_delete AFTER DELETE ON todos
+        BEGIN
+            INSERT INTO todo_list_versions (user_id, version) VALUES (OLD.user_id, 1)
+            ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+        END
+        """,
+    ],
+}
+
+for dialect_name, statements in TODO_LIST_VERSION_DDL.items():
+    for statement in statements:
+        event.listen(SQLModel.metadata, "after_create", DDL(statement).execute_if(dialect=dialect_name))
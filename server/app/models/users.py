@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import Column, DateTime, Text, func
+from sqlalchemy import Column, DateTime, Index, Text, func, text
 from sqlmodel import Field, Relationship, SQLModel
 from pydantic import EmailStr
 import uuid
@@ -23,17 +23,30 @@ class User(SQLModel, table=True):
 
     # Relationships
     todos: List["Todo"] = Relationship(back_populates="user")
-    refresh_tokens: List["RefreshToken"] = Relationship(back_populates="user")
+    refresh_tokens: List["RefreshToken"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"passive_deletes": True}
+    )
 
 class RefreshToken(SQLModel, table=True):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Active tokens of a user, for "log out all sessions"
+        Index(
+            "ix_refresh_tokens_active_user_id", "user_id",
+            postgresql_where=text("NOT is_revoked"),
+            sqlite_where=text("NOT is_revoked")
+        ),
+        # Expired token purges
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
 
     jti: uuid.UUID = Field(primary_key=True)
     Field(
         sa_column=Column(Text, nullable=False)
     )
     token_hash: str = Field(sa_column=Column(Text, nullable=False))
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", ondelete="CASCADE", index=True)
     expires_at: datetime = Field(
         sa_column=Column(DateTime(timezone=True))
     )
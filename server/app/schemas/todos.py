@@ -1,23 +1,24 @@
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
 from app.models.todos import TodoStatus
 
 class TodoBase(BaseModel):
     title: str
     status: TodoStatus = TodoStatus.PENDING
     is_bookmarked: bool = False
-    order: int = 0
+    order: float = 0
     parent_id: Optional[int] = None
 
 class TodoCreate(TodoBase):
-    pass
+    # None places the todo after its last sibling
+    order: Optional[float] = None
 
 class TodoUpdate(BaseModel):
     title: Optional[str] = None
     status: Optional[TodoStatus] = None
     is_bookmarked: Optional[bool] = None
-    order: Optional[int] = None
+    order: Optional[float] = None
     parent_id: Optional[int] = None
 
 class TodoResponse(TodoBase):
@@ -26,6 +27,7 @@ class TodoResponse(TodoBase):
     created_at: datetime
     modified_at: datetime
     subtasks: List['TodoResponse'] = []
+    highlights: Optional[List[Tuple[int, int]]] = None
 
     class Config:
         from_attributes = True
@@ -33,22 +35,87 @@ class TodoResponse(TodoBase):
 # Update forward references
 TodoResponse.model_rebuild()
 
+class TodoBulkCreateRequest(BaseModel):
+    items: List[TodoCreate]
+
+class TodoBulkError(BaseModel):
+    index: int
+    message: str
+
+class TodoBulkCreateResponse(BaseModel):
+    items: List[TodoResponse]
+    errors: List[TodoBulkError] = []
+
 class TodoFilter(BaseModel):
     status: Optional[TodoStatus] = None
     is_bookmarked: Optional[bool] = None
     search: Optional[str] = None
     parent_id: Optional[int] = None
 
+class TodoBulkSelection(BaseModel):
+    ids: Optional[List[int]] = None
+    filters: Optional[TodoFilter] = None
+
+class TodoBulkUpdateRequest(TodoBulkSelection):
+    update: TodoUpdate
+
+class TodoBulkDeleteRequest(TodoBulkSelection):
+    pass
+
+class TodoBulkResult(BaseModel):
+    ids: List[int]
+
 class PaginationParams(BaseModel):
     page: int = 1
     page_size: int = 10
     order_by: str = "created_at"
-    order_direction: str = "desc" 
+    order_direction: str = "desc"
+    cursor: Optional[str] = None
+    include_total: bool = True
 
 class TodoOrderUpdate(BaseModel):
     todo_id: int
-    new_order: int
+    new_order: float
 
 class TodoReorderRequest(BaseModel):
     reorders: List[TodoOrderUpdate]
-    parent_id: Optional[int] = None 
\ No newline at end of file
+    parent_id: Optional[int] = None
+
+class TodoMoveRequest(BaseModel):
+    before_id: Optional[int] = None
+    after_id: Optional[int] = None
+
+class TodoDeleted(BaseModel):
+    id: int
+    parent_id: Optional[int] = None
+    deleted_at: datetime
+
+class TodoChangesResponse(BaseModel):
+    changes: List[TodoResponse]
+    deleted: List[TodoDeleted]
+    sync_token: str
+    # The client must reload the full list, then sync from sync_token
+    reset_required: bool = False
+
+class TodoImportRow(BaseModel):
+    # Client-side references: ``id`` names the row, ``parent_id`` points at
+    # the ``id`` of an earlier root row in the same upload
+    id: Optional[str] = None
+    parent_id: Optional[str] = None
+    title: str
+    status: TodoStatus = TodoStatus.PENDING
+    is_bookmarked: bool = False
+    # None places the todo after its last sibling
+    order: Optional[float] = None
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+class TodoImportError(BaseModel):
+    row: int
+    message: str
+
+class TodoImportResponse(BaseModel):
+    created: int
+    error_count: int
+    errors: List[TodoImportError] = []
+    dry_run: bool = False
@@ -0,0 +1,58 @@
+import asyncio
+from sqlalchemy import delete, func, or_
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.database import AsyncSessionLocal
+from app.models.users import RefreshToken
+
+logger = get_logger(__name__)
+
+async def purge_refresh_tokens(batch_size: int, max_batches: int) -> int:
+    """Delete expired or revoked refresh tokens in bounded batches.
+
+    Each batch is its own short transaction so the reaper never holds locks
+    on a large part of the table.
+
+    Args:
+        batch_size (int): Maximum rows deleted per transaction
+        max_batches (int): Maximum batches per run
+
+    Returns:
+        int: Number of rows deleted
+    """
+    deleted = 0
+    for _ in range(max_batches):
+        async with AsyncSessionLocal() as db:
+            stale_jtis = (
+                select(RefreshToken.jti)
+                .where(or_(RefreshToken.is_revoked == True, RefreshToken.expires_at < func.now()))
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await db.execute(delete(RefreshToken).where(RefreshToken.jti.in_(stale_jtis)))
+            await db.commit()
+
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+    return deleted
+
+async def run_refresh_token_reaper() -> None:
+    """Periodically purge stale refresh tokens until cancelled."""
+    interval = settings.REFRESH_TOKEN_REAPER_INTERVAL_SECONDS
+    logger.info(f"Refresh token reaper started (interval={interval}s)")
+    while True:
+        try:
+            deleted = await purge_refresh_tokens(
+                batch_size=settings.REFRESH_TOKEN_REAPER_BATCH_SIZE,
+                max_batches=settings.REFRESH_TOKEN_REAPER_MAX_BATCHES
+            )
+            if deleted:
+                logger.info(f"Refresh token reaper deleted {deleted} expired or revoked tokens")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error purging refresh tokens: {e}", exc_info=True)
+        await asyncio.sleep(interval)
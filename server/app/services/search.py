@@ -0,0 +1,101 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
+
+from sqlalchemy import Float, case, cast, func, literal
+
+from app.core.config import settings
+
+
+class SearchBackend(ABC):
+    """Interface for matching and ranking todos by a free-text search term."""
+
+    @abstractmethod
+    def match(self, todo: Any, term: str) -> Any:
+        """Return a WHERE clause selecting todos whose title matches ``term``.
+
+        Args:
+            todo (Any): ``Todo`` entity or alias to search
+            term (str): Stripped, non-empty search term
+
+        Returns:
+            Any: SQL boolean expression
+        """
+
+    @abstractmethod
+    def rank(self, todo: Any, term: str) -> Any:
+        """Return a SQL expression scoring how well a title matches ``term``; higher is better.
+
+        Args:
+            todo (Any): ``Todo`` entity or alias to search
+            term (str): Stripped, non-empty search term
+
+        Returns:
+            Any: SQL numeric expression
+        """
+
+    def highlights(self, text: str, term: str) -> List[Tuple[int, int]]:
+        """Find the ``(start, end)`` character offsets of ``term`` and its words in ``text``.
+
+        Args:
+            text (str): Text to highlight, usually a todo title
+            term (str): Stripped, non-empty search term
+
+        Returns:
+            List[Tuple[int, int]]: Sorted, non-overlapping offsets
+        """
+        words = {term.lower(), *term.lower().split()}
+        pattern = re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)), re.IGNORECASE)
+        return [match.span() for match in pattern.finditer(text)]
+
+
+class TrigramSearchBackend(SearchBackend):
+    """PostgreSQL search backed by a ``pg_trgm`` GIN index on ``todos.title``.
+
+    ``ILIKE '%term%'`` is served by the ``gin_trgm_ops`` index, so matching cost
+    depends on the number of hits rather than the size of the account.
+    """
+
+    def match(self, todo: Any, term: str) -> Any:
+        return todo.title.ilike(f"%{_escape_like(term)}%", escape="\\")
+
+    def rank(self, todo: Any, term: str) -> Any:
+        return func.word_similarity(term, todo.title)
+
+
+class SimpleSearchBackend(SearchBackend):
+    """Portable fallback for databases without ``pg_trgm`` such as SQLite.
+
+    Matches case-insensitive substrings and ranks exact titles above prefixes
+    above other matches.
+    """
+
+    def match(self, todo: Any, term: str) -> Any:
+        return func.lower(todo.title).contains(term.lower(), autoescape=True)
+
+    def rank(self, todo: Any, term: str) -> Any:
+        title = func.lower(todo.title)
+        term = term.lower()
+        return case(
+            (title == term, literal(3.0)),
+            (title.startswith(term, autoescape=True), literal(2.0)),
+            else_=cast(literal(1.0), Float)
+        )
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so the term is matched literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def get_search_backend() -> SearchBackend:
+    """Return the search backend selected by ``settings.SEARCH_BACKEND``.
+
+    ``auto`` picks the trigram backend on PostgreSQL and the simple one elsewhere.
+    """
+    backend = settings.SEARCH_BACKEND
+    if backend == "auto":
+        backend = "trigram" if settings.DATABASE_URL.startswith("postgresql") else "simple"
+    if backend == "trigram":
+        return TrigramSearchBackend()
+    return SimpleSearchBackend()
@@ -0,0 +1,238 @@
+import csv
+import io
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+import orjson
+from sqlalchemy import insert
+from pydantic import ValidationError
+
+from app.models.todos import Todo
+from app.models.users import User
+from app.schemas.todos import TodoImportError, TodoImportResponse, TodoImportRow
+from app.core.exceptions import BaseAppException, ValidationException
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.todos import TodoService
+
+logger = get_logger(__name__)
+
+def _iter_import_records(file: BinaryIO, import_format: str) -> Iterator[Tuple[int, Any]]:
+    """Read an upload one record at a time.
+
+    The upload is already spooled to a local temporary file, so it is read
+    synchronously in small pieces rather than loaded whole.
+
+    Args:
+        file (BinaryIO): Uploaded file
+        import_format (str): "ndjson" or "csv"
+
+    Yields:
+        Tuple[int, Any]: Row (line) number and either the record as a dict or
+            an error message if it could not be parsed
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if import_format == "csv":
+            reader = csv.DictReader(text)
+            for record in reader:
+                # Empty cells mean "use the default"
+                yield reader.line_num, {key: value for key, value in record.items() if key and value != ""}
+            return
+
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                yield line_number, "Invalid JSON"
+                continue
+            yield line_number, record if isinstance(record, dict) else "Expected a JSON object"
+    except UnicodeDecodeError:
+        yield 0, "File is not valid UTF-8"
+    finally:
+        # Leave closing the upload to its owner
+        text.detach()
+
+def _expand_import_record(row_number: int, record: Dict[str, Any]) -> List[Tuple[Any, TodoImportRow]]:
+    """Validate a record, splitting nested NDJSON ``subtasks`` into rows of their own.
+
+    Args:
+        row_number (int): Row number of the record, used to name unnamed parents
+        record (Dict[str, Any]): Parsed record
+
+    Returns:
+        List[Tuple[Any, TodoImportRow]]: ``(reference, row)`` pairs, the record first
+
+    Raises:
+        ValueError: If the record or one of its subtasks is invalid
+    """
+    subtasks = record.pop("subtasks", None) or []
+    try:
+        row = TodoImportRow.model_validate(record)
+        if subtasks and row.parent_id is not None:
+            raise ValueError("Cannot add subtask to a subtask")
+        # Nested subtasks need a reference to their parent even if it has no id
+        ref = row.id if row.id is not None else (("row", row_number) if subtasks else None)
+        rows = [(ref, row)]
+        for subtask in subtasks:
+            if not isinstance(subtask, dict) or subtask.get("subtasks"):
+                raise ValueError("Subtasks must be objects without subtasks of their own")
+            subtask_row = TodoImportRow.model_validate({**subtask, "parent_id": None})
+            rows.append((subtask_row.id, subtask_row.model_copy(update={"parent_id": ref})))
+        return rows
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"{field}: {error['msg']}" if field else error["msg"]) from e
+
+
+class TodoImportService(TodoService):
+    """Bulk import of todos from NDJSON or CSV uploads."""
+
+    async def import_todos(
+        self,
+        file: BinaryIO,
+        import_format: str,
+        dry_run: bool,
+        current_user: User
+    ) -> TodoImportResponse:
+        """Import todos from an NDJSON or CSV upload in batched multi-row INSERTs.
+
+        Rows may carry a client-side ``id`` and a ``parent_id`` naming the
+        ``id`` of an earlier root row in the same file, so exports can be
+        imported as they are; nested NDJSON ``subtasks`` are accepted too.
+        Every ``TODO_IMPORT_BATCH_SIZE`` valid rows are inserted, roots first so
+        their new IDs resolve the subtasks' references, and only the references
+        and the current batch are kept in memory. Rows without an ``order`` are
+        appended to their sibling list in file order. Invalid records are skipped
+        and reported, together with any nested subtasks; the valid ones are
+        committed together at the end.
+
+        Args:
+            file (BinaryIO): Uploaded file
+            import_format (str): "ndjson" or "csv"
+            dry_run (bool): Validate and report without inserting anything
+            current_user (User): Current authenticated user
+
+        Returns:
+            TodoImportResponse: Number of rows created (or that would be) and row errors
+
+        Raises:
+            ValidationException: If the upload has more than ``TODO_IMPORT_MAX_ROWS`` rows
+            BaseAppException: If the import fails
+        """
+        # Reference -> new ID of root rows (None until inserted or in a dry run);
+        # references of subtasks are kept only to report misuse
+        root_ids: Dict[Any, Optional[int]] = {}
+        subtask_refs: set = set()
+        # Last order value per list, keyed by None for roots and by the parent's
+        # reference for subtasks; rows without an order are appended to their list
+        last_orders: Dict[Any, float] = {}
+        batch: List[Tuple[Any, TodoImportRow]] = []
+        new_ids: List[int] = []
+        errors: List[TodoImportError] = []
+        error_count = 0
+        created = 0
+        row_count = 0
+
+        def add_error(row_number: int, message: str) -> None:
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < settings.TODO_IMPORT_MAX_ERRORS:
+                errors.append(TodoImportError(row=row_number, message=message))
+
+        def record_error(rows: List[Tuple[Any, TodoImportRow]]) -> Optional[str]:
+            # Check every row of a record before accepting any, so a rejected
+            # parent never leaves its nested subtasks behind
+            record_refs: set = set()
+            for ref, row in rows:
+                if ref is not None and (ref in root_ids or ref in subtask_refs or ref in record_refs):
+                    return f"Duplicate id {ref!r}"
+                if row.parent_id is not None:
+                    if row.parent_id in subtask_refs:
+                        return "Cannot add subtask to a subtask"
+                    if row.parent_id not in root_ids and row.parent_id not in record_refs:
+                        return "Parent not found; parents must come before their subtasks"
+                if ref is not None:
+                    record_refs.add(ref)
+            return None
+
+        def to_values(row: TodoImportRow, parent_id: Optional[int]) -> Dict[str, Any]:
+            order = row.order
+            if order is None:
+                order = last_orders.get(row.parent_id, 0.0) + settings.TODO_ORDER_SPACING
+                last_orders[row.parent_id] = order
+            return {
+                "title": row.title,
+                "status": row.status,
+                "is_bookmarked": row.is_bookmarked,
+                "order": order,
+                "parent_id": parent_id,
+                "user_id": current_user.id,
+            }
+
+        async def insert_rows(rows: List[Dict[str, Any]]) -> List[int]:
+            result = await self.db.scalars(insert(Todo).returning(Todo.id, sort_by_parameter_order=True), rows)
+            ids = list(result.all())
+            new_ids.extend(ids[:settings.TODO_EVENTS_MAX_IDS + 1 - len(new_ids)])
+            return ids
+
+        async def flush() -> None:
+            nonlocal created
+            if not dry_run:
+                roots = [(ref, row) for ref, row in batch if row.parent_id is None]
+                if None not in last_orders and any(row.order is None for _, row in roots):
+                    last_orders.update(await self._get_last_orders(current_user.id, {None}))
+                if roots:
+                    ids = await insert_rows([to_values(row, None) for _, row in roots])
+                    for (ref, _), todo_id in zip(roots, ids):
+                        if ref is not None:
+                            root_ids[ref] = todo_id
+                subtasks = [to_values(row, root_ids[row.parent_id]) for _, row in batch if row.parent_id is not None]
+                if subtasks:
+                    await insert_rows(subtasks)
+            created += len(batch)
+            batch.clear()
+
+        try:
+            for row_number, record in _iter_import_records(file, import_format):
+                if isinstance(record, str):
+                    add_error(row_number, record)
+                    continue
+                try:
+                    rows = _expand_import_record(row_number, record)
+                except ValueError as e:
+                    add_error(row_number, str(e))
+                    continue
+
+                error = record_error(rows)
+                if error is not None:
+                    add_error(row_number, error)
+                    continue
+
+                for ref, row in rows:
+                    row_count += 1
+                    if row_count > settings.TODO_IMPORT_MAX_ROWS:
+                        raise ValidationException(message=f"At most {settings.TODO_IMPORT_MAX_ROWS} todos can be imported at once")
+                    if ref is not None:
+                        if row.parent_id is None:
+                            root_ids[ref] = None
+                        else:
+                            subtask_refs.add(ref)
+
+                    batch.append((ref, row))
+                    if len(batch) >= settings.TODO_IMPORT_BATCH_SIZE:
+                        await flush()
+            await flush()
+
+            if not dry_run and created:
+                await self._publish_changes(current_user.id, "changed", new_ids)
+                await self.db.commit()
+                self._invalidate_total_count(current_user.id)
+
+            return TodoImportResponse(created=created, error_count=error_count, errors=errors, dry_run=dry_run)
+        except ValidationException:
+            raise
+        except Exception as e:
+            logger.error(f"Error importing todos: {e}", exc_info=True)
+            raise BaseAppException("Could not import todos. Please try again later.") from e
@@ -0,0 +1,59 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.database import AsyncSessionLocal
+from app.models.todos import TodoTombstone
+
+logger = get_logger(__name__)
+
+async def purge_todo_tombstones(retention_days: int, batch_size: int, max_batches: int) -> int:
+    """Delete tombstones older than the delta sync retention in bounded batches.
+
+    Args:
+        retention_days (int): Age in days after which tombstones are deleted
+        batch_size (int): Maximum rows deleted per transaction
+        max_batches (int): Maximum batches per run
+
+    Returns:
+        int: Number of rows deleted
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    deleted = 0
+    for _ in range(max_batches):
+        async with AsyncSessionLocal() as db:
+            stale_ids = (
+                select(TodoTombstone.id)
+                .where(TodoTombstone.deleted_at < cutoff)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await db.execute(delete(TodoTombstone).where(TodoTombstone.id.in_(stale_ids)))
+            await db.commit()
+
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+    return deleted
+
+async def run_todo_tombstone_reaper() -> None:
+    """Periodically purge expired todo tombstones until cancelled."""
+    interval = settings.TODO_TOMBSTONE_REAPER_INTERVAL_SECONDS
+    logger.info(f"Todo tombstone reaper started (interval={interval}s)")
+    while True:
+        try:
+            deleted = await purge_todo_tombstones(
+                retention_days=settings.TODO_TOMBSTONE_RETENTION_DAYS,
+                batch_size=settings.TODO_TOMBSTONE_REAPER_BATCH_SIZE,
+                max_batches=settings.TODO_TOMBSTONE_REAPER_MAX_BATCHES
+            )
+            if deleted:
+                logger.info(f"Todo tombstone reaper deleted {deleted} expired tombstones")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error purging todo tombstones: {e}", exc_info=True)
+        await asyncio.sleep(interval)
@@ -1,19 +1,33 @@
-from collections import defaultdict
-from typing import Any, List, Tuple, Optional, Dict
-from sqlalchemy import func
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, List, Set, Tuple, Optional, Dict
+from sqlalchemy import Float, Integer, Select, and_, column, delete, exists, func, insert, literal, or_, tuple_, update, values
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import and_, select, desc, asc
+from sqlalchemy.orm import aliased
+from sqlmodel import select, desc, asc
 
-from app.models.todos import Todo
+from app.models.todos import Todo, TodoListVersion, TodoStatus, TodoTombstone
 from app.models.users import User
 from app.schemas.todos import (
+    TodoBulkCreateRequest,
+    TodoBulkCreateResponse,
+    TodoBulkError,
+    TodoBulkResult,
+    TodoBulkSelection,
+    TodoBulkUpdateRequest,
+    TodoBulkDeleteRequest,
+    TodoChangesResponse,
     TodoCreate,
+    TodoDeleted,
     TodoReorderRequest,
     TodoUpdate,
     TodoResponse,
     TodoFilter,
+    TodoMoveRequest,
     PaginationParams
 )
 from app.core.exceptions import (
@@ -23,10 +37,58 @@ from app.core.exceptions import (
     ValidationException,
     extract_constraint_name
 )
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.pubsub import change_hub
+from app.core.responses import make_etag
+from app.db.database import AsyncSessionLocal
+from app.services.search import get_search_backend
 
 logger = get_logger(__name__)
 
+# Columns a listing may be ordered (and cursor-paginated) by, mapped to the
+# function that turns a JSON-decoded cursor value back into a column value
+CURSOR_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "id": int,
+    "title": str,
+    "status": TodoStatus,
+    "is_bookmarked": bool,
+    "order": float,
+    "created_at": datetime.fromisoformat,
+    "modified_at": datetime.fromisoformat,
+}
+
+# Pseudo-column ordering search results by rank
+RELEVANCE_ORDER = "relevance"
+
+# TodoResponse fields copied straight from Todo columns
+TODO_RESPONSE_COLUMNS = (
+    "id", "user_id", "title", "status", "is_bookmarked", "order", "parent_id", "created_at", "modified_at"
+)
+
+# Per-user cache of root todo counts, keyed by user ID and holding a dict of
+# filter key -> count. Write paths drop the user's entry after committing.
+_total_count_cache = TTLCache(
+    maxsize=settings.TODO_COUNT_CACHE_SIZE,
+    ttl=settings.TODO_COUNT_CACHE_TTL_SECONDS
+)
+
+def _to_response(todo: Todo) -> TodoResponse:
+    """Build a response from a loaded todo without re-validating its fields.
+
+    Args:
+        todo (Todo): Todo loaded from the database
+
+    Returns:
+        TodoResponse: Response with no subtasks or highlights attached
+    """
+    return TodoResponse.model_construct(
+        **{field: getattr(todo, field) for field in TODO_RESPONSE_COLUMNS},
+        subtasks=[],
+        highlights=None
+    )
+
 class TodoService:
     """Service class for handling Todo-related operations."""
 
@@ -37,6 +99,7 @@ class TodoService:
             db (AsyncSession): SQLAlchemy async session
         """
         self.db = db
+        self.search = get_search_backend()
 
     async def _get_todo_by_id(self, todo_id: int, user_id: int) -> Optional[Todo]:
         """Get a todo by ID and verify user ownership.
@@ -69,6 +132,90 @@ class TodoService:
         if parent.parent_id:
             raise ValidationException(message="Cannot add subtask to a subtask")
 
+    def _valid_parent_clause(self, parent_id: int, user_id: int) -> Any:
+        """Build an EXISTS clause that holds when ``parent_id`` may take subtasks.
+
+        Lets writes validate the parent inside their own statement instead of a
+        separate lookup; ``_validate_parent_todo`` explains a failure afterwards.
+
+        Args:
+            parent_id (int): ID of the parent todo
+            user_id (int): ID of the user who must own the parent todo
+
+        Returns:
+            Any: SQL boolean expression
+        """
+        parent = aliased(Todo, name="parent")
+        return exists().where(
+            parent.id == parent_id,
+            parent.user_id == user_id,
+            parent.parent_id.is_(None)
+        )
+
+    def _sibling_clause(self, user_id: int, parent_id: Optional[int]) -> Any:
+        """Build the filter for one sibling list.
+
+        The branch is picked here rather than with ``IS NOT DISTINCT FROM``,
+        which PostgreSQL cannot match against the
+        ``(user_id, parent_id, order, id)`` index.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+            parent_id (Optional[int]): Parent of the list, None for root todos
+
+        Returns:
+            Any: SQL boolean expression
+        """
+        if parent_id is None:
+            return and_(Todo.user_id == user_id, Todo.parent_id.is_(None))
+        return and_(Todo.user_id == user_id, Todo.parent_id == parent_id)
+
+    def _append_order_clause(self, user_id: int, parent_id: Optional[int]) -> Any:
+        """Build a scalar subquery for the order value after the last sibling.
+
+        Lets a single INSERT place a new todo at the end of its list, spaced
+        ``TODO_ORDER_SPACING`` after the current last sibling.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+            parent_id (Optional[int]): Parent of the list, None for root todos
+
+        Returns:
+            Any: SQL expression for the new order value
+        """
+        return (
+            select(func.coalesce(func.max(Todo.order), 0) + settings.TODO_ORDER_SPACING)
+            .where(self._sibling_clause(user_id, parent_id))
+            .correlate(None)
+            .scalar_subquery()
+        )
+
+    async def _get_last_orders(self, user_id: int, parent_ids: Set[Optional[int]]) -> Dict[Optional[int], float]:
+        """Look up the order of the last todo in several sibling lists with one query.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+            parent_ids (Set[Optional[int]]): Parents of the lists, None for root todos
+
+        Returns:
+            Dict[Optional[int], float]: Last order value per parent, 0 for empty lists
+        """
+        last_orders: Dict[Optional[int], float] = {parent_id: 0.0 for parent_id in parent_ids}
+        subtask_parent_ids = [parent_id for parent_id in parent_ids if parent_id is not None]
+        list_clauses = [Todo.parent_id.in_(subtask_parent_ids)] if subtask_parent_ids else []
+        if None in parent_ids:
+            list_clauses.append(Todo.parent_id.is_(None))
+        if not list_clauses:
+            return last_orders
+
+        result = await self.db.execute(
+            select(Todo.parent_id, func.max(Todo.order))
+            .where(Todo.user_id == user_id, or_(*list_clauses))
+            .group_by(Todo.parent_id)
+        )
+        last_orders.update({parent_id: last_order for parent_id, last_order in result.all()})
+        return last_orders
+
     def _handle_foreign_key_violation(self, error: IntegrityError, entity_id: int) -> None:
         """Handle foreign key violation errors.
 
@@ -100,32 +247,252 @@ class TodoService:
             logger.warning(f"Foreign key violation: {entity_name} with ID '{entity_id}' does not exist")
             raise ValidationException(f"{entity_name} with ID '{entity_id}' does not exist.")
 
-    def _nest_subtasks(self, todo_pairs: List[Tuple[Todo, Todo]]) -> List[TodoResponse]:
-        """Convert flat todo pairs into nested structure.
+    def _nest_subtasks(self, parents: List[Todo], subtasks: List[Todo]) -> List[TodoResponse]:
+        """Attach subtasks to their parents in a single pass.
 
         Args:
-            todo_pairs (List[Tuple[Todo, Todo]]): List of (parent, subtask) pairs
+            parents (List[Todo]): Root todos of the page, in page order
+            subtasks (List[Todo]): Subtasks of those root todos
 
         Returns:
             List[TodoResponse]: List of todos with nested subtasks
         """
-        todos_dict: Dict[int, TodoResponse] = {}
-        subtasks_map: Dict[int, List[Todo]] = defaultdict(list)
+        todos_dict: Dict[int, TodoResponse] = {
+            parent.id: _to_response(parent) for parent in parents
+        }
 
-        for parent, sub in todo_pairs:
-            parent_response = TodoResponse(**parent.model_dump())
-            if parent.id not in todos_dict:
-                todos_dict[parent.id] = parent_response
-            if sub:
-                subtasks_map[parent.id].append(sub)
-        
-        for parent_id, subtasks in subtasks_map.items():
-            todos_dict[parent_id].subtasks.extend(subtasks)
+        for sub in subtasks:
+            todos_dict[sub.parent_id].subtasks.append(_to_response(sub))
 
         return list(todos_dict.values())
 
+    async def _get_subtasks(self, parent_ids: List[int]) -> List[Todo]:
+        """Load the subtasks of several parents with one ``IN`` query.
+
+        Args:
+            parent_ids (List[int]): IDs of the parent todos
+
+        Returns:
+            List[Todo]: Subtasks ordered by their ``order`` within each parent
+        """
+        if not parent_ids:
+            return []
+        query = (
+            select(Todo)
+            .where(Todo.parent_id.in_(parent_ids))
+            .order_by(Todo.parent_id, asc(Todo.order), asc(Todo.id))
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    def _apply_filters(self, db_query: Select, todo: Any, filters: TodoFilter, user_id: int) -> Select:
+        """Restrict a query to the user's root todos matching the filters.
+
+        Args:
+            db_query (Select): Query to restrict
+            todo (Any): ``Todo`` entity or alias the filters apply to
+            filters (TodoFilter): Filter criteria
+            user_id (int): ID of the user who owns the todos
+
+        Returns:
+            Select: The filtered query
+        """
+        db_query = db_query.where((todo.user_id == user_id) & (todo.parent_id.is_(None)))
+
+        if filters.status:
+            db_query = db_query.where(todo.status == filters.status)
+        if filters.is_bookmarked is not None:
+            db_query = db_query.where(todo.is_bookmarked == filters.is_bookmarked)
+        if filters.parent_id is not None:
+            db_query = db_query.where(todo.parent_id == filters.parent_id)
+        search_term = self._get_search_term(filters)
+        if search_term:
+            db_query = db_query.where(self.search.match(todo, search_term))
+
+        return db_query
+
+    def _get_order_column(self, todo: Any, order_by: str) -> Any:
+        """Resolve a sortable column, falling back to ``order`` for unknown names.
+
+        Args:
+            todo (Any): ``Todo`` entity or alias to resolve the column on
+            order_by (str): Requested column name
+
+        Returns:
+            Any: The column to order by
+        """
+        if order_by not in CURSOR_DECODERS:
+            return todo.order
+        return getattr(todo, order_by)
+
+    def _get_search_term(self, filters: TodoFilter) -> Optional[str]:
+        """Return the stripped search term, or None when not searching.
+
+        Args:
+            filters (TodoFilter): Filter criteria
+
+        Returns:
+            Optional[str]: The search term
+        """
+        if filters.search and filters.search.strip():
+            return filters.search.strip()
+        return None
+
+    def _get_ordering(
+        self,
+        todo: Any,
+        pagination: PaginationParams,
+        search_term: Optional[str] = None
+    ) -> List[Any]:
+        """Build the ORDER BY clauses, using ``id`` as a unique tie-breaker.
+
+        ``order_by="relevance"`` orders by search rank when a search term is
+        given, with ``desc`` putting the best matches first.
+
+        Args:
+            todo (Any): ``Todo`` entity or alias to order
+            pagination (PaginationParams): Pagination parameters
+            search_term (Optional[str]): Active search term, if any
+
+        Returns:
+            List[Any]: Ordering clauses
+        """
+        direction = desc if pagination.order_direction == "desc" else asc
+        if pagination.order_by == RELEVANCE_ORDER and search_term:
+            return [direction(self.search.rank(todo, search_term)), direction(todo.id)]
+        return [direction(self._get_order_column(todo, pagination.order_by)), direction(todo.id)]
+
+    def _encode_cursor(self, todo: TodoResponse, order_by: str) -> str:
+        """Encode the (order column, id) position of a todo as an opaque cursor.
+
+        Args:
+            todo (TodoResponse): Last todo of the current page
+            order_by (str): Column the page is ordered by
+
+        Returns:
+            str: URL-safe cursor string
+        """
+        if order_by not in CURSOR_DECODERS:
+            order_by = "order"
+        value = getattr(todo, order_by)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, Enum):
+            value = value.value
+        raw = json.dumps([order_by, value, todo.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def _decode_cursor(self, cursor: str, order_by: str) -> Tuple[Any, int]:
+        """Decode an opaque cursor back into its (order value, id) position.
+
+        Args:
+            cursor (str): Cursor produced by ``_encode_cursor``
+            order_by (str): Column the page is ordered by
+
+        Returns:
+            Tuple[Any, int]: The order column value and todo ID
+
+        Raises:
+            ValidationException: If the cursor is malformed or was issued for another ordering
+        """
+        if order_by not in CURSOR_DECODERS:
+            order_by = "order"
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            cursor_order_by, value, todo_id = json.loads(base64.urlsafe_b64decode(padded))
+            if cursor_order_by != order_by or not isinstance(todo_id, int):
+                raise ValueError("cursor does not match ordering")
+            return CURSOR_DECODERS[order_by](value), todo_id
+        except (ValueError, TypeError, binascii.Error) as e:
+            raise ValidationException(message="Invalid cursor") from e
+
+    def _cursor_literal(self, value: Any, order_column: Any) -> Any:
+        """Bind a decoded cursor value so it compares equal to the stored one.
+
+        SQLite stores ``CURRENT_TIMESTAMP`` defaults as ``YYYY-MM-DD HH:MM:SS``
+        text while SQLAlchemy binds datetimes with ``.ffffff`` appended, which
+        would sort the cursor row after itself. Timestamps are bound there as
+        naive UTC text without a fractional part unless they have one.
+
+        Args:
+            value (Any): Order column value decoded from the cursor
+            order_column (Any): Column the page is ordered by
+
+        Returns:
+            Any: SQL literal for the value
+        """
+        if isinstance(value, datetime) and self.db.bind.dialect.name == "sqlite":
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return literal(value.isoformat(sep=" "))
+        return literal(value, order_column.type)
+
+    async def _get_total_count(self, db_query: Select, filters: TodoFilter, user_id: int) -> int:
+        """Count the root todos matched by ``db_query``, using the per-user cache.
+
+        Args:
+            db_query (Select): Filtered, unpaginated listing query
+            filters (TodoFilter): Filter criteria the query was built from
+            user_id (int): ID of the user who owns the todos
+
+        Returns:
+            int: Number of matching root todos
+        """
+        filter_key = (
+            filters.status,
+            filters.is_bookmarked,
+            filters.parent_id,
+            self._get_search_term(filters)
+        )
+        counts: Optional[Dict[Tuple[Any, ...], int]] = _total_count_cache.get(user_id)
+        if counts is not None and filter_key in counts:
+            return counts[filter_key]
+
+        count_query = select(func.count()).select_from(db_query.subquery())
+        result = await self.db.execute(count_query)
+        total_records = result.scalar_one()
+
+        if counts is None:
+            counts = {}
+            _total_count_cache.set(user_id, counts)
+        elif len(counts) >= settings.TODO_COUNT_CACHE_FILTERS_PER_USER:
+            del counts[next(iter(counts))]
+        counts[filter_key] = total_records
+
+        return total_records
+
+    def _invalidate_total_count(self, user_id: int) -> None:
+        """Drop the cached listing counts of a user after their todos changed.
+
+        Args:
+            user_id (int): ID of the user whose todos changed
+        """
+        _total_count_cache.pop(user_id)
+
+    async def _publish_changes(self, user_id: int, event_type: str, todo_ids: List[int]) -> None:
+        """Notify the user's live change streams when the current write commits.
+
+        Call it before ``commit()``; the event travels in the write's own
+        transaction and is dropped if that rolls back.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+            event_type (str): "changed" or "deleted"
+            todo_ids (List[int]): IDs of the affected todos; too many are sent
+                as ``None``, which asks subscribers to resync
+        """
+        if not todo_ids:
+            return
+        ids = todo_ids if len(todo_ids) <= settings.TODO_EVENTS_MAX_IDS else None
+        await change_hub.publish(self.db, user_id, {"type": event_type, "ids": ids})
+
     async def create_todo(self, todo_in: TodoCreate, current_user: User) -> TodoResponse:
-        """Create a new todo.
+        """Create a new todo with a single INSERT ... RETURNING statement.
+
+        The parent, if any, is validated inside the same statement, and a todo
+        without an explicit order is placed after its last sibling by a
+        subquery; server defaults such as ``created_at`` come back through
+        RETURNING.
 
         Args:
             todo_in (TodoCreate): Todo creation data
@@ -139,18 +506,33 @@ class TodoService:
             BaseAppException: If creation fails
         """
         try:
+            todo_data = {**todo_in.model_dump(), "user_id": current_user.id}
+            if todo_in.order is None:
+                todo_data["order"] = self._append_order_clause(current_user.id, todo_in.parent_id)
             if todo_in.parent_id:
+                # INSERT ... SELECT ... WHERE EXISTS (valid parent) RETURNING *
+                source = select(
+                    *[
+                        (value if field == "order" and todo_in.order is None
+                         else literal(value, Todo.__table__.c[field].type)).label(field)
+                        for field, value in todo_data.items()
+                    ]
+                ).where(self._valid_parent_clause(todo_in.parent_id, current_user.id))
+                db_query = insert(Todo).from_select(list(todo_data), source)
+            else:
+                db_query = insert(Todo).values(**todo_data)
+
+            result = await self.db.scalars(db_query.returning(Todo))
+            todo = result.one_or_none()
+            if todo is None:
                 await self._validate_parent_todo(todo_in.parent_id, current_user.id)
+                raise ValidationException(message="Parent todo not found")
 
-            todo = Todo(
-                **todo_in.model_dump(),
-                user_id=current_user.id
-            )
-            self.db.add(todo)
+            await self._publish_changes(current_user.id, "changed", [todo.id])
             await self.db.commit()
-            await self.db.refresh(todo)
+            self._invalidate_total_count(current_user.id)
 
-            return TodoResponse(**todo.model_dump())
+            return _to_response(todo)
         
         except IntegrityError as e:
             self._handle_foreign_key_violation(e, todo_in.parent_id)
@@ -161,6 +543,87 @@ class TodoService:
             logger.error(f"Error creating todo: {e}", exc_info=True)
             raise BaseAppException("Could not create todo. Please try again later.") from e
 
+    async def create_todos_bulk(
+        self,
+        bulk_request: TodoBulkCreateRequest,
+        current_user: User
+    ) -> TodoBulkCreateResponse:
+        """Create many todos with one parent lookup and one multi-row INSERT.
+
+        Items whose parent is missing, not owned by the user or itself a
+        subtask are reported in ``errors`` by their index; all other items are
+        inserted together in a single transaction. Items without an explicit
+        order are appended to their sibling list in request order.
+
+        Args:
+            bulk_request (TodoBulkCreateRequest): Todos to create
+            current_user (User): Current authenticated user
+
+        Returns:
+            TodoBulkCreateResponse: Created todos in request order and per-item errors
+
+        Raises:
+            ValidationException: If too many items are submitted
+            BaseAppException: If creation fails
+        """
+        if len(bulk_request.items) > settings.TODO_BULK_MAX_ITEMS:
+            raise ValidationException(message=f"At most {settings.TODO_BULK_MAX_ITEMS} todos can be created at once")
+
+        try:
+            # Validate every referenced parent with a single query
+            parent_ids = {item.parent_id for item in bulk_request.items if item.parent_id}
+            parents: Dict[int, Optional[int]] = {}
+            if parent_ids:
+                result = await self.db.execute(
+                    select(Todo.id, Todo.parent_id).where(
+                        Todo.id.in_(parent_ids),
+                        Todo.user_id == current_user.id
+                    )
+                )
+                parents = {todo_id: parent_id for todo_id, parent_id in result.all()}
+
+            rows: List[Dict[str, Any]] = []
+            errors: List[TodoBulkError] = []
+            for index, item in enumerate(bulk_request.items):
+                if item.parent_id:
+                    if item.parent_id not in parents:
+                        errors.append(TodoBulkError(index=index, message="Parent todo not found"))
+                        continue
+                    if parents[item.parent_id] is not None:
+                        errors.append(TodoBulkError(index=index, message="Cannot add subtask to a subtask"))
+                        continue
+                rows.append({**item.model_dump(), "user_id": current_user.id})
+
+            last_orders = await self._get_last_orders(
+                current_user.id, {row["parent_id"] for row in rows if row["order"] is None}
+            )
+            for row in rows:
+                if row["order"] is None:
+                    last_orders[row["parent_id"]] += settings.TODO_ORDER_SPACING
+                    row["order"] = last_orders[row["parent_id"]]
+
+            todos: List[Todo] = []
+            if rows:
+                result = await self.db.scalars(
+                    insert(Todo).returning(Todo, sort_by_parameter_order=True),
+                    rows
+                )
+                todos = list(result.all())
+                await self._publish_changes(current_user.id, "changed", [todo.id for todo in todos])
+                await self.db.commit()
+                self._invalidate_total_count(current_user.id)
+
+            return TodoBulkCreateResponse(
+                items=[_to_response(todo) for todo in todos],
+                errors=errors
+            )
+        except IntegrityError as e:
+            self._handle_foreign_key_violation(e, None)
+            raise
+        except Exception as e:
+            logger.error(f"Error creating todos in bulk: {e}", exc_info=True)
+            raise BaseAppException("Could not create todos. Please try again later.") from e
+
     async def list_todos(
         self,
         current_user: User,
@@ -169,6 +632,22 @@ class TodoService:
     ) -> Dict[str, Any]:
         """List todos with filtering and pagination.
 
+        Pages are cut over root todos only; the subtasks of the page are then
+        loaded with a single ``parent_id IN (...)`` query, so the number of
+        queries per page does not depend on how many subtasks exist.
+
+        When ``pagination.cursor`` is set the page is located with a keyset
+        predicate on ``(order_by column, id)`` instead of an OFFSET, so deep
+        pages cost the same as the first one and are stable under inserts.
+
+        With a search term, ``order_by="relevance"`` ranks matches through the
+        configured search backend and each root todo carries ``highlights``
+        offsets into its title.
+
+        ``total_count`` comes from a short-lived per-user cache and is skipped
+        entirely when ``pagination.include_total`` is false; ``has_more`` is
+        always derived by fetching one row past the page.
+
         Args:
             current_user (User): Current authenticated user
             filters (TodoFilter): Filter criteria
@@ -178,59 +657,259 @@ class TodoService:
             Dict[str, Any]: Paginated list of todos with metadata
 
         Raises:
+            ValidationException: If the cursor is malformed
             BaseAppException: If retrieval fails
         """
         try:
-            parent = aliased(Todo, name="t")
-            subtask = aliased(Todo, name="st")
+            db_query = self._apply_filters(select(Todo), Todo, filters, current_user.id)
 
-            db_query = (
-                select(parent, subtask)
-                .join_from(parent, subtask, subtask.parent_id == parent.id, isouter=True)
-                .where((parent.user_id == current_user.id) & (parent.parent_id.is_(None)))
-            )
+            # Get total count of root todos for pagination
+            total_records = None
+            if pagination.include_total:
+                total_records = await self._get_total_count(db_query, filters, current_user.id)
 
-            # Apply filters
-            if filters.status:
-                db_query = db_query.where(parent.status == filters.status)
-            if filters.is_bookmarked is not None:
-                db_query = db_query.where(parent.is_bookmarked == filters.is_bookmarked)
-            if filters.parent_id is not None:
-                db_query = db_query.where(parent.parent_id == filters.parent_id)
-            if filters.search and filters.search.strip():
-                search_term = f"%{filters.search.strip()}%"
-                db_query = db_query.where(parent.title.ilike(search_term))
-
-            # Apply ordering
-            order_column = getattr(parent, pagination.order_by, parent.order)
-            if pagination.order_direction == "desc":
-                db_query = db_query.order_by(desc(order_column))
+            # Apply ordering and pagination
+            search_term = self._get_search_term(filters)
+            by_relevance = pagination.order_by == RELEVANCE_ORDER and search_term is not None
+            db_query = db_query.order_by(*self._get_ordering(Todo, pagination, search_term))
+            if pagination.cursor:
+                if by_relevance:
+                    raise ValidationException(message="Cursor pagination is not supported with relevance ordering")
+                cursor_value, cursor_id = self._decode_cursor(pagination.cursor, pagination.order_by)
+                order_column = self._get_order_column(Todo, pagination.order_by)
+                row = tuple_(order_column, Todo.id)
+                position = tuple_(self._cursor_literal(cursor_value, order_column), literal(cursor_id))
+                if pagination.order_direction == "desc":
+                    db_query = db_query.where(row < position)
+                else:
+                    db_query = db_query.where(row > position)
             else:
-                db_query = db_query.order_by(asc(order_column))
-
-            # Get total count for pagination
-            count_query = select(func.count()).select_from(db_query.subquery())
-            total_records = await self.db.execute(count_query)
-            total_records = total_records.scalar_one()
-
-            # Apply pagination
-            db_query = db_query.offset((pagination.page - 1) * pagination.page_size).limit(pagination.page_size)
+                db_query = db_query.offset((pagination.page - 1) * pagination.page_size)
+            # Fetch one extra row to learn whether another page follows
+            db_query = db_query.limit(pagination.page_size + 1)
 
-            # Execute query
+            # Load the page of root todos, then all of their subtasks at once
             result = await self.db.execute(db_query)
-            todo_pairs = result.all()
+            parents = list(result.scalars().all())
+            has_more = len(parents) > pagination.page_size
+            parents = parents[:pagination.page_size]
+            subtasks = await self._get_subtasks([parent.id for parent in parents])
+
+            todos = self._nest_subtasks(parents, subtasks)
+            if search_term:
+                for todo in todos:
+                    todo.highlights = self.search.highlights(todo.title, search_term)
 
-            todos = self._nest_subtasks(todo_pairs)
             return {
                 "items": todos,
                 "total_count": total_records,
-                "page": pagination.page,
-                "page_size": pagination.page_size
+                "page": None if pagination.cursor else pagination.page,
+                "page_size": pagination.page_size,
+                "has_more": has_more,
+                "next_cursor": (
+                    self._encode_cursor(todos[-1], pagination.order_by)
+                    if has_more and not by_relevance else None
+                )
             }
+        except ValidationException:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving todos: {e}", exc_info=True)
             raise BaseAppException("Could not retrieve todos. Please try again later.") from e
 
+    def _encode_sync_token(self, version: int, issued_at: datetime) -> str:
+        """Encode a list version as an opaque sync token.
+
+        Args:
+            version (int): ``TodoListVersion`` the client has synced up to
+            issued_at (datetime): Database time the token was issued, used to
+                expire tokens older than the tombstone retention
+
+        Returns:
+            str: URL-safe sync token
+        """
+        raw = json.dumps({"v": version, "t": issued_at.isoformat()}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def _decode_sync_token(self, sync_token: str) -> Optional[Tuple[int, datetime]]:
+        """Decode a sync token produced by ``_encode_sync_token``.
+
+        Args:
+            sync_token (str): Token issued by a previous sync
+
+        Returns:
+            Optional[Tuple[int, datetime]]: The version and timezone-aware issue
+                time, or None for a timestamp token issued before versions were used
+
+        Raises:
+            ValidationException: If the token is malformed
+        """
+        try:
+            padded = sync_token + "=" * (-len(sync_token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded))
+            issued_at = datetime.fromisoformat(data["t"])
+            if issued_at.tzinfo is None:
+                raise ValueError("sync token without timezone")
+            if "v" not in data:
+                return None
+            if not isinstance(data["v"], int):
+                raise ValueError("sync token version is not an integer")
+            return data["v"], issued_at
+        except (ValueError, TypeError, KeyError, binascii.Error) as e:
+            raise ValidationException(message="Invalid sync token") from e
+
+    async def _get_sync_state(self, user_id: int) -> Tuple[int, datetime]:
+        """Read the user's committed list version and the database time in one query.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+
+        Returns:
+            Tuple[int, datetime]: Version (0 before the first write) and timezone-aware time
+        """
+        version_query = select(TodoListVersion.version).where(TodoListVersion.user_id == user_id)
+        result = await self.db.execute(select(version_query.scalar_subquery(), func.now()))
+        version, now = result.one()
+        if isinstance(now, str):
+            now = datetime.fromisoformat(now)
+        return version or 0, now if now.tzinfo else now.replace(tzinfo=timezone.utc)
+
+    async def list_changes(self, current_user: User, since: Optional[str]) -> TodoChangesResponse:
+        """List todos created, modified or deleted after a sync token.
+
+        Tokens carry the user's ``TodoListVersion``. Every todo and tombstone is
+        stamped with the version of the transaction that wrote it, and a user's
+        writers take versions in commit order, so the changes after a token are
+        exactly the rows stamped with a higher version. A sync with nothing new
+        is a single primary key lookup; otherwise the changes are range scans on
+        ``(user_id, sync_version)``.
+
+        Unlike a clock-based horizon this is unaffected by long transactions: a
+        streaming export writes nothing, and a long import only delays its own
+        user's other writes, which wait on the version row until it commits.
+
+        Args:
+            current_user (User): Current authenticated user
+            since (Optional[str]): Token from the previous sync, None for the first one
+
+        Returns:
+            TodoChangesResponse: Changed todos (subtasks included, flat), tombstones
+                and the token for the next sync. ``reset_required`` asks the client
+                to reload the full list instead: no usable token was given, the
+                token is older than the tombstone retention or too much has changed.
+
+        Raises:
+            ValidationException: If the token is malformed
+            BaseAppException: If retrieval fails
+        """
+        since_state = self._decode_sync_token(since) if since else None
+
+        try:
+            # Read before the changes so nothing committed in between is missed
+            version, now = await self._get_sync_state(current_user.id)
+            reset = TodoChangesResponse(
+                changes=[], deleted=[], sync_token=self._encode_sync_token(version, now), reset_required=True
+            )
+            if since_state is None:
+                return reset
+            synced_version, issued_at = since_state
+            if synced_version == version:
+                return TodoChangesResponse(changes=[], deleted=[], sync_token=reset.sync_token)
+            if (
+                synced_version > version
+                or issued_at < now - timedelta(days=settings.TODO_TOMBSTONE_RETENTION_DAYS)
+            ):
+                return reset
+
+            max_changes = settings.TODO_SYNC_MAX_CHANGES
+            result = await self.db.execute(
+                select(Todo)
+                .where(Todo.user_id == current_user.id, Todo.sync_version > synced_version)
+                .order_by(Todo.sync_version, Todo.id)
+                .limit(max_changes + 1)
+            )
+            changed = list(result.scalars().all())
+            result = await self.db.execute(
+                select(TodoTombstone.todo_id, TodoTombstone.parent_id, TodoTombstone.deleted_at)
+                .where(TodoTombstone.user_id == current_user.id, TodoTombstone.sync_version > synced_version)
+                .order_by(TodoTombstone.sync_version, TodoTombstone.id)
+                .limit(max_changes + 1)
+            )
+            deleted = result.all()
+        except Exception as e:
+            logger.error(f"Error retrieving todo changes: {e}", exc_info=True)
+            raise BaseAppException("Could not retrieve todo changes. Please try again later.") from e
+
+        if len(changed) + len(deleted) > max_changes:
+            return reset
+
+        return TodoChangesResponse(
+            changes=[_to_response(todo) for todo in changed],
+            deleted=[
+                TodoDeleted(id=row.todo_id, parent_id=row.parent_id, deleted_at=row.deleted_at)
+                for row in deleted
+            ],
+            sync_token=reset.sync_token
+        )
+
+    async def get_list_etag(self, current_user: User, filters: TodoFilter, pagination: PaginationParams) -> str:
+        """Compute the ETag of a todo page without running the page query.
+
+        The user's todos are summarized by their ``TodoListVersion``, which
+        triggers bump in the same transaction as every insert, update or
+        delete. Unlike timestamps stamped with the transaction start, it
+        changes with every commit, however the commits interleave. Filters and
+        pagination are part of the key.
+
+        Args:
+            current_user (User): Current authenticated user
+            filters (TodoFilter): Filter criteria of the page
+            pagination (PaginationParams): Pagination parameters of the page
+
+        Returns:
+            str: Quoted ETag header value
+
+        Raises:
+            BaseAppException: If the version lookup fails
+        """
+        try:
+            result = await self.db.execute(
+                select(TodoListVersion.version).where(TodoListVersion.user_id == current_user.id)
+            )
+            version = result.scalar_one_or_none() or 0
+            return make_etag(
+                "list", current_user.id, version,
+                filters.model_dump(mode="json"), pagination.model_dump(mode="json")
+            )
+        except Exception as e:
+            logger.error(f"Error computing todo list version: {e}", exc_info=True)
+            raise BaseAppException("Could not retrieve todos. Please try again later.") from e
+
+    async def get_todo_etag(self, todo_id: int, current_user: User) -> Optional[str]:
+        """Compute the ETag of a single todo from its ``modified_at``.
+
+        Args:
+            todo_id (int): ID of the todo
+            current_user (User): Current authenticated user
+
+        Returns:
+            Optional[str]: Quoted ETag header value, or None if the todo does not exist
+
+        Raises:
+            BaseAppException: If the version lookup fails
+        """
+        try:
+            result = await self.db.execute(
+                select(Todo.modified_at).where(Todo.id == todo_id, Todo.user_id == current_user.id)
+            )
+            modified_at = result.scalar_one_or_none()
+            if modified_at is None:
+                return None
+            return make_etag("todo", todo_id, modified_at)
+        except Exception as e:
+            logger.error(f"Error computing todo version: {e}", exc_info=True)
+            raise BaseAppException("Could not retrieve todo. Please try again later.") from e
+
     async def get_todo(self, todo_id: int, current_user: User) -> TodoResponse:
         """Get a single todo by ID.
 
@@ -249,7 +928,7 @@ class TodoService:
             todo = await self._get_todo_by_id(todo_id, current_user.id)
             if not todo:
                 raise ResourceNotFoundException(message="Todo not found")
-            return TodoResponse(**todo.model_dump())
+            return _to_response(todo)
         except ResourceNotFoundException:
             raise
         except Exception as e:
@@ -257,7 +936,10 @@ class TodoService:
             raise BaseAppException("Could not retrieve todo. Please try again later.") from e
 
     async def update_todo(self, todo_id: int, todo_in: TodoUpdate, current_user: User) -> TodoResponse:
-        """Update an existing todo.
+        """Update an existing todo with a single UPDATE ... RETURNING statement.
+
+        Ownership and the new parent, if any, are checked in the WHERE clause;
+        only when no row is updated is the reason looked up.
 
         Args:
             todo_id (int): ID of the todo to update
@@ -272,26 +954,34 @@ class TodoService:
             ValidationException: If parent todo validation fails
             BaseAppException: If update fails
         """
-        try:
-            todo = await self._get_todo_by_id(todo_id, current_user.id)
-            if not todo:
-                raise ResourceNotFoundException(message="Todo not found")
+        if todo_in.parent_id is not None and todo_in.parent_id == todo_id:
+            raise ValidationException(message="Todo cannot be its own parent")
 
-            # If updating parent_id, verify the new parent exists and belongs to the user
+        try:
+            # UPDATE ... WHERE id = ? AND user_id = ? RETURNING *
+            db_query = update(Todo).where(Todo.id == todo_id, Todo.user_id == current_user.id)
             if todo_in.parent_id is not None:
-                if todo_in.parent_id == todo_id:
-                    raise ValidationException(message="Todo cannot be its own parent")
-                await self._validate_parent_todo(todo_in.parent_id, current_user.id)
+                db_query = db_query.where(self._valid_parent_clause(todo_in.parent_id, current_user.id))
 
-            # Update todo
-            todo_data = todo_in.model_dump(exclude_unset=True)
-            for field, value in todo_data.items():
-                setattr(todo, field, value)
+            result = await self.db.scalars(
+                db_query
+                .values(**todo_in.model_dump(exclude_unset=True))
+                .returning(Todo)
+                .execution_options(synchronize_session=False)
+            )
+            todo = result.one_or_none()
+            if todo is None:
+                # Explain why nothing was updated
+                if not await self._get_todo_by_id(todo_id, current_user.id):
+                    raise ResourceNotFoundException(message="Todo not found")
+                await self._validate_parent_todo(todo_in.parent_id, current_user.id)
+                raise ValidationException(message="Parent todo not found")
 
+            await self._publish_changes(current_user.id, "changed", [todo.id])
             await self.db.commit()
-            await self.db.refresh(todo)
+            self._invalidate_total_count(current_user.id)
 
-            return TodoResponse(**todo.model_dump())
+            return _to_response(todo)
         except IntegrityError as e:
             self._handle_foreign_key_violation(e, todo_in.parent_id)
             raise
@@ -302,7 +992,11 @@ class TodoService:
             raise BaseAppException("Could not update todo. Please try again later.") from e
 
     async def delete_todo(self, todo_id: int, current_user: User) -> None:
-        """Delete a todo.
+        """Delete a todo and its subtasks with a single DELETE statement.
+
+        Subtasks are matched explicitly, rather than left to ``ON DELETE
+        CASCADE``, so every deleted row comes back through RETURNING and gets
+        a tombstone for delta sync.
 
         Args:
             todo_id (int): ID of the todo to delete
@@ -313,80 +1007,371 @@ class TodoService:
             BaseAppException: If deletion fails
         """
         try:
-            todo = await self._get_todo_by_id(todo_id, current_user.id)
-            if not todo:
+            result = await self.db.execute(
+                delete(Todo)
+                .where(Todo.user_id == current_user.id, or_(Todo.id == todo_id, Todo.parent_id == todo_id))
+                .returning(Todo.id, Todo.parent_id)
+            )
+            deleted_rows = result.all()
+            if not any(row.id == todo_id for row in deleted_rows):
                 raise ResourceNotFoundException(message="Todo not found")
             
-            await self.db.delete(todo)
+            await self._record_tombstones(deleted_rows, current_user.id)
+            await self._publish_changes(current_user.id, "deleted", [row.id for row in deleted_rows])
             await self.db.commit()
+            self._invalidate_total_count(current_user.id)
         except ResourceNotFoundException:
             raise
         except Exception as e:
             logger.error(f"Error deleting todo: {e}", exc_info=True)
             raise BaseAppException("Could not delete todo. Please try again later.") from e
 
-    async def reorder_todos(self, reorder_request: TodoReorderRequest, current_user: User) -> List[Todo]:
-        """Reorder a list of todos.
+    async def _record_tombstones(self, deleted_rows: List[Any], user_id: int) -> None:
+        """Insert tombstones for deleted todos in the current transaction.
 
         Args:
-            reorder_request (TodoReorderRequest): Reordering request data
+            deleted_rows (List[Any]): ``(id, parent_id)`` rows returned by a DELETE
+            user_id (int): ID of the user who owned the todos
+        """
+        if not deleted_rows:
+            return
+        await self.db.execute(
+            insert(TodoTombstone).values([
+                {"todo_id": row.id, "parent_id": row.parent_id, "user_id": user_id}
+                for row in deleted_rows
+            ])
+        )
+
+    def _bulk_target_ids(self, selection: TodoBulkSelection, user_id: int) -> Select:
+        """Build a subquery of the todo IDs a bulk request applies to.
+
+        Args:
+            selection (TodoBulkSelection): Either explicit IDs or filter criteria
+            user_id (int): ID of the user who owns the todos
+
+        Returns:
+            Select: Query selecting the targeted todo IDs
+
+        Raises:
+            ValidationException: If not exactly one of ``ids`` and ``filters`` is given
+        """
+        if (selection.ids is None) == (selection.filters is None):
+            raise ValidationException(message="Provide either ids or filters")
+
+        if selection.ids is not None:
+            if len(selection.ids) > settings.TODO_BULK_MAX_ITEMS:
+                raise ValidationException(message=f"At most {settings.TODO_BULK_MAX_ITEMS} todos can be changed at once")
+            return select(Todo.id).where(Todo.id.in_(selection.ids), Todo.user_id == user_id)
+
+        return self._apply_filters(select(Todo.id), Todo, selection.filters, user_id)
+
+    async def update_todos_bulk(self, bulk_request: TodoBulkUpdateRequest, current_user: User) -> TodoBulkResult:
+        """Apply one update to many todos with a single UPDATE statement.
+
+        Args:
+            bulk_request (TodoBulkUpdateRequest): Target todos and the update to apply
             current_user (User): Current authenticated user
 
         Returns:
-            List[Todo]: Reordered todos
+            TodoBulkResult: IDs of the updated todos
 
         Raises:
-            ValidationException: If validation fails
-            ResourceNotFoundException: If parent todo not found
-            BaseAppException: If reordering fails
+            ValidationException: If the selection or parent todo is invalid
+            BaseAppException: If the update fails
+        """
+        try:
+            target_ids = self._bulk_target_ids(bulk_request, current_user.id)
+            todo_data = bulk_request.update.model_dump(exclude_unset=True)
+            if not todo_data:
+                raise ValidationException(message="No fields to update")
+
+            db_query = update(Todo).where(Todo.user_id == current_user.id, Todo.id.in_(target_ids))
+            if bulk_request.update.parent_id is not None:
+                await self._validate_parent_todo(bulk_request.update.parent_id, current_user.id)
+                db_query = db_query.where(Todo.id != bulk_request.update.parent_id)
+
+            result = await self.db.execute(db_query.values(**todo_data).returning(Todo.id))
+            updated_ids = list(result.scalars().all())
+            await self._publish_changes(current_user.id, "changed", updated_ids)
+            await self.db.commit()
+            self._invalidate_total_count(current_user.id)
+
+            return TodoBulkResult(ids=updated_ids)
+        except IntegrityError as e:
+            self._handle_foreign_key_violation(e, bulk_request.update.parent_id)
+            raise
+        except ValidationException:
+            raise
+        except Exception as e:
+            logger.error(f"Error updating todos in bulk: {e}", exc_info=True)
+            raise BaseAppException("Could not update todos. Please try again later.") from e
+
+    async def delete_todos_bulk(self, bulk_request: TodoBulkDeleteRequest, current_user: User) -> TodoBulkResult:
+        """Delete many todos, and their subtasks, with a single DELETE statement.
+
+        Deleted rows are recorded as tombstones for delta sync.
+
+        Args:
+            bulk_request (TodoBulkDeleteRequest): Target todos
+            current_user (User): Current authenticated user
+
+        Returns:
+            TodoBulkResult: IDs of the deleted todos, including subtasks
+
+        Raises:
+            ValidationException: If the selection is invalid
+            BaseAppException: If the deletion fails
         """
         try:
-            # Get all todos that need to be reordered
-            todo_ids = [reorder.todo_id for reorder in reorder_request.reorders]
-            query = select(Todo).where(
-                and_(
-                    Todo.id.in_(todo_ids),
-                    Todo.user_id == current_user.id
+            target_ids = self._bulk_target_ids(bulk_request, current_user.id)
+            result = await self.db.execute(
+                delete(Todo)
+                .where(
+                    Todo.user_id == current_user.id,
+                    or_(Todo.id.in_(target_ids), Todo.parent_id.in_(target_ids))
                 )
+                .returning(Todo.id, Todo.parent_id)
             )
-            result = await self.db.execute(query)
-            todos = result.scalars().all()
+            deleted_rows = result.all()
+            await self._record_tombstones(deleted_rows, current_user.id)
+            await self._publish_changes(current_user.id, "deleted", [row.id for row in deleted_rows])
+            await self.db.commit()
+            self._invalidate_total_count(current_user.id)
 
-            # Verify all todos exist and belong to the user
-            if len(todos) != len(todo_ids):
-                raise ValidationException(message="One or more todos not found")
+            return TodoBulkResult(ids=[row.id for row in deleted_rows])
+        except ValidationException:
+            raise
+        except Exception as e:
+            logger.error(f"Error deleting todos in bulk: {e}", exc_info=True)
+            raise BaseAppException("Could not delete todos. Please try again later.") from e
+
+    def _order_values(self, orders: List[Tuple[int, float]]) -> Any:
+        """Build a ``(VALUES (id, order), ...)`` table for set-based order updates.
+
+        Args:
+            orders (List[Tuple[int, float]]): (todo ID, new order) pairs
+
+        Returns:
+            Any: VALUES construct with ``id`` and ``order`` columns
+        """
+        return values(
+            column("id", Integer),
+            column("order", Float),
+            name="new_orders"
+        ).data(orders)
+
+    async def _renumber_siblings(self, user_id: int, parent_id: Optional[int]) -> List[int]:
+        """Respace the order values of one sibling list with a single UPDATE.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+            parent_id (Optional[int]): Parent of the list, None for root todos
+
+        Returns:
+            List[int]: IDs of the renumbered todos
+        """
+        result = await self.db.execute(
+            select(Todo.id)
+            .where(self._sibling_clause(user_id, parent_id))
+            .order_by(asc(Todo.order), asc(Todo.id))
+        )
+        todo_ids = list(result.scalars().all())
+        if not todo_ids:
+            return todo_ids
+
+        spacing = settings.TODO_ORDER_SPACING
+        new_orders = self._order_values([(todo_id, (i + 1) * spacing) for i, todo_id in enumerate(todo_ids)])
+        await self.db.execute(
+            update(Todo)
+            .where(Todo.id == new_orders.c.id, Todo.user_id == user_id)
+            .values(order=new_orders.c.order)
+            .execution_options(synchronize_session=False)
+        )
+        return todo_ids
+
+    async def rebalance_order(self, user_id: int, parent_id: Optional[int]) -> None:
+        """Respace a sibling list whose order gaps have become too small.
+
+        Args:
+            user_id (int): ID of the user who owns the todos
+            parent_id (Optional[int]): Parent of the list, None for root todos
+        """
+        try:
+            todo_ids = await self._renumber_siblings(user_id, parent_id)
+            await self._publish_changes(user_id, "changed", todo_ids)
+            await self.db.commit()
+        except Exception as e:
+            logger.error(f"Error rebalancing todo order: {e}", exc_info=True)
+
+    async def _get_move_position(self, anchor: Todo, todo_id: int, before: bool) -> Tuple[float, float]:
+        """Compute the order for a todo placed next to ``anchor`` and the gap it splits.
+
+        Args:
+            anchor (Todo): Sibling the todo is placed before or after
+            todo_id (int): ID of the todo being moved
+            before (bool): Place before ``anchor`` if True, after it otherwise
+
+        Returns:
+            Tuple[float, float]: New order value and the width of the gap it was placed in
+        """
+        position = tuple_(Todo.order, Todo.id)
+        anchor_position = tuple_(literal(anchor.order, Float), literal(anchor.id))
+        neighbor_query = select(Todo.order).where(
+            self._sibling_clause(anchor.user_id, anchor.parent_id),
+            Todo.id != todo_id
+        )
+        if before:
+            neighbor_query = neighbor_query.where(position < anchor_position).order_by(desc(Todo.order), desc(Todo.id))
+        else:
+            neighbor_query = neighbor_query.where(position > anchor_position).order_by(asc(Todo.order), asc(Todo.id))
+
+        result = await self.db.execute(neighbor_query.limit(1))
+        neighbor = result.scalar_one_or_none()
+
+        spacing = settings.TODO_ORDER_SPACING
+        if neighbor is None:
+            return (anchor.order - spacing if before else anchor.order + spacing), spacing
+        return (anchor.order + neighbor) / 2, abs(anchor.order - neighbor)
+
+    async def move_todo(
+        self,
+        todo_id: int,
+        move_request: TodoMoveRequest,
+        current_user: User
+    ) -> Tuple[TodoResponse, bool]:
+        """Move a todo directly before or after one of its siblings.
+
+        Only the moved row is written: it gets an order value halfway between
+        its new neighbours. When that gap is exhausted the sibling list is
+        renumbered first; when it is merely getting small the caller is told
+        to schedule a background rebalance.
 
+        Args:
+            todo_id (int): ID of the todo to move
+            move_request (TodoMoveRequest): Sibling to place the todo before or after
+            current_user (User): Current authenticated user
+
+        Returns:
+            Tuple[TodoResponse, bool]: The moved todo and whether its list needs rebalancing
+
+        Raises:
+            ResourceNotFoundException: If the todo or sibling is not found
+            ValidationException: If the request is invalid
+            BaseAppException: If the move fails
+        """
+        if (move_request.before_id is None) == (move_request.after_id is None):
+            raise ValidationException(message="Provide either before_id or after_id")
+
+        before = move_request.before_id is not None
+        anchor_id = move_request.before_id if before else move_request.after_id
+        if anchor_id == todo_id:
+            raise ValidationException(message="Todo cannot be moved relative to itself")
+
+        try:
+            result = await self.db.execute(
+                select(Todo).where(Todo.id.in_([todo_id, anchor_id]), Todo.user_id == current_user.id)
+            )
+            todos = {todo.id: todo for todo in result.scalars().all()}
+            if todo_id not in todos:
+                raise ResourceNotFoundException(message="Todo not found")
+            if anchor_id not in todos:
+                raise ResourceNotFoundException(message="Sibling todo not found")
+            if todos[todo_id].parent_id != todos[anchor_id].parent_id:
+                raise ValidationException(message="Todos must share the same parent to be moved relative to each other")
+
+            anchor = todos[anchor_id]
+            new_order, gap = await self._get_move_position(anchor, todo_id, before)
+            changed_ids = [todo_id]
+            if gap < settings.TODO_ORDER_MIN_GAP:
+                changed_ids = await self._renumber_siblings(current_user.id, anchor.parent_id)
+                await self.db.refresh(anchor)
+                new_order, gap = await self._get_move_position(anchor, todo_id, before)
+
+            result = await self.db.scalars(
+                update(Todo)
+                .where(Todo.id == todo_id, Todo.user_id == current_user.id)
+                .values(order=new_order)
+                .returning(Todo)
+                # The todo is already loaded; refresh it from RETURNING
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            todo = result.one()
+            await self._publish_changes(current_user.id, "changed", changed_ids)
+            await self.db.commit()
+
+            return _to_response(todo), gap < settings.TODO_ORDER_REBALANCE_GAP
+        except (ResourceNotFoundException, ValidationException):
+            raise
+        except Exception as e:
+            logger.error(f"Error moving todo: {e}", exc_info=True)
+            raise BaseAppException("Could not move todo. Please try again later.") from e
+
+    async def reorder_todos(self, reorder_request: TodoReorderRequest, current_user: User) -> List[TodoResponse]:
+        """Reorder a list of todos with a single ``UPDATE ... FROM (VALUES ...)``.
+
+        Args:
+            reorder_request (TodoReorderRequest): Reordering request data
+            current_user (User): Current authenticated user
+
+        Returns:
+            List[TodoResponse]: Reordered todos
+
+        Raises:
+            ValidationException: If validation fails
+            ResourceNotFoundException: If parent todo not found
+            BaseAppException: If reordering fails
+        """
+        try:
             # If parent_id is provided, verify it exists and belongs to the user
             if reorder_request.parent_id is not None:
                 parent = await self._get_todo_by_id(reorder_request.parent_id, current_user.id)
                 if not parent:
                     raise ResourceNotFoundException(message="Parent todo not found")
-                # Verify all todos are subtasks of the specified parent
-                for todo in todos:
-                    if todo.parent_id != reorder_request.parent_id:
-                        raise ValidationException(
-                            message="All todos must be subtasks of the specified parent"
-                        )
-            else:
-                # Verify all todos are root-level todos (no parent)
-                for todo in todos:
-                    if todo.parent_id is not None:
-                        raise ValidationException(
-                            message="All todos must be root-level todos when no parent is specified"
-                        )
 
-            # Create a mapping of todo_id to new order
-            order_mapping = {reorder.todo_id: reorder.new_order for reorder in reorder_request.reorders}
+            todo_ids = {reorder.todo_id for reorder in reorder_request.reorders}
+            new_orders = self._order_values(
+                [(reorder.todo_id, reorder.new_order) for reorder in reorder_request.reorders]
+            )
 
-            # Update todos with new orders
-            for todo in todos:
-                todo.order = order_mapping[todo.id]
+            # Update only todos that belong to the user and to the requested list
+            result = await self.db.scalars(
+                update(Todo)
+                .where(
+                    Todo.id == new_orders.c.id,
+                    self._sibling_clause(current_user.id, reorder_request.parent_id)
+                )
+                .values(order=new_orders.c.order)
+                .returning(Todo)
+                .execution_options(synchronize_session=False)
+            )
+            todos = list(result.all())
 
+            # Verify all todos exist, belong to the user and are in the requested list
+            if len(todos) != len(todo_ids):
+                await self.db.rollback()
+                if reorder_request.parent_id is not None:
+                    message = "All todos must be existing subtasks of the specified parent"
+                else:
+                    message = "All todos must be existing root-level todos when no parent is specified"
+                raise ValidationException(message=message)
+
+            await self._publish_changes(current_user.id, "changed", [todo.id for todo in todos])
             await self.db.commit()
             
-            return todos
+            return [_to_response(todo) for todo in todos]
         except (ValidationException, ResourceNotFoundException):
             raise
         except Exception as e:
             logger.error(f"Error reordering todos: {e}", exc_info=True)
-            raise BaseAppException("Could not reorder todos. Please try again later.") from e 
\ No newline at end of file
+            raise BaseAppException("Could not reorder todos. Please try again later.") from e
+
+
+async def rebalance_todo_order(user_id: int, parent_id: Optional[int]) -> None:
+    """Background task: respace one sibling list in its own session.
+
+    Args:
+        user_id (int): ID of the user who owns the todos
+        parent_id (Optional[int]): Parent of the list, None for root todos
+    """
+    async with AsyncSessionLocal() as db:
+        await TodoService(db).rebalance_order(user_id, parent_id)
@@ -0,0 +1,16 @@
+from typing import Any, Callable
+
+import pytest
+
+
+@pytest.fixture
+def report(request) -> Callable[..., None]:
+    """Print a benchmark's results on one line; run pytest with -s to see them."""
+    def emit(**results: Any) -> None:
+        values = ", ".join(
+            f"{name}={value:.3f}" if isinstance(value, float) else f"{name}={value}"
+            for name, value in results.items()
+        )
+        print(f"\n{request.node.name}: {values}")
+    return emit
+
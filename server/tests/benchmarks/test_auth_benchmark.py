@@ -0,0 +1,45 @@
+"""Per-request authentication overhead with and without the claims fast path."""
+import pytest
+
+from app.core import deps
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import create_access_token
+from tests.benchmarks.timing import summarize, time_calls
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+REQUESTS = 2000
+
+
+async def test_auth_overhead_per_request(db, user, statements, monkeypatch, report):
+    monkeypatch.setattr(deps, "_token_cache", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(deps, "_active_cache", TTLCache(maxsize=100, ttl=60))
+    token = create_access_token(user)
+
+    async def authenticate():
+        await deps._authenticate(db, token)
+        # Each request has its own session, so nothing is reused from the identity map
+        db.expunge_all()
+
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_FAST_PATH", False)
+    statements.clear()
+    slow = summarize(await time_calls(authenticate, REQUESTS))
+    slow_statements = len(statements) / REQUESTS
+
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_FAST_PATH", True)
+    statements.clear()
+    fast = summarize(await time_calls(authenticate, REQUESTS))
+    fast_statements = len(statements) / REQUESTS
+
+    report(
+        lookup_median_ms=slow["median_ms"],
+        lookup_p99_ms=slow["p99_ms"],
+        lookup_queries_per_request=slow_statements,
+        fast_path_median_ms=fast["median_ms"],
+        fast_path_p99_ms=fast["p99_ms"],
+        fast_path_queries_per_request=fast_statements,
+    )
+    assert slow_statements > 0.99
+    assert fast_statements < 0.01
+    assert fast["median_ms"] < slow["median_ms"]
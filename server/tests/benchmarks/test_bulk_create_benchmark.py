@@ -0,0 +1,38 @@
+"""10k todos through the bulk endpoint's service against one create_todo call each."""
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.todos import TodoBulkCreateRequest, TodoCreate
+from app.services.todos import TodoService
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+TODOS = 10000
+
+
+async def test_bulk_create_throughput(db, user, report):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    items = [TodoCreate(title=f"Todo {i}", parent_id=parent.id if i % 2 else None) for i in range(TODOS)]
+
+    started_at = time.perf_counter()
+    for start in range(0, TODOS, settings.TODO_BULK_MAX_ITEMS):
+        batch = items[start:start + settings.TODO_BULK_MAX_ITEMS]
+        response = await service.create_todos_bulk(TodoBulkCreateRequest(items=batch), user)
+        assert len(response.items) == len(batch)
+    bulk_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for item in items:
+        await service.create_todo(item, user)
+    single_seconds = time.perf_counter() - started_at
+
+    report(
+        bulk_seconds=bulk_seconds,
+        bulk_rows_per_s=round(TODOS / bulk_seconds),
+        single_seconds=single_seconds,
+        single_rows_per_s=round(TODOS / single_seconds),
+    )
+    assert bulk_seconds * 5 < single_seconds
@@ -0,0 +1,54 @@
+"""Exporting a million todos streams in constant memory."""
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.todos import Todo
+from app.services.todo_export import stream_todo_export
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+ROOTS = 250_000
+SUBTASKS_PER_ROOT = 3
+SEED_CHUNK = 50_000
+
+
+@pytest.fixture
+async def million_todos(db, user):
+    for start in range(0, ROOTS, SEED_CHUNK):
+        result = await db.scalars(
+            insert(Todo).returning(Todo.id, sort_by_parameter_order=True),
+            [{"title": f"Root {i}", "order": float(i), "user_id": user.id} for i in range(start, start + SEED_CHUNK)]
+        )
+        await db.execute(
+            insert(Todo),
+            [
+                {"title": f"Subtask {i}", "order": float(i), "parent_id": parent_id, "user_id": user.id}
+                for parent_id in result.all() for i in range(SUBTASKS_PER_ROOT)
+            ]
+        )
+        await db.commit()
+
+
+@pytest.mark.parametrize("export_format, nested", [("ndjson", True), ("csv", False)])
+async def test_million_row_export_memory(db, user, million_todos, report, export_format, nested):
+    size = 0
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    try:
+        async for chunk in stream_todo_export(user.id, export_format, nested):
+            size += len(chunk)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    report(
+        rows=ROOTS * (1 + SUBTASKS_PER_ROOT),
+        seconds=time.perf_counter() - started_at,
+        output_mb=size / 1e6,
+        peak_mb=peak / 1e6,
+    )
+    assert size > 50_000_000
+    assert peak < 16_000_000
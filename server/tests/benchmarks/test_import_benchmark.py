@@ -0,0 +1,40 @@
+"""Import throughput in rows per second, against one create_todo call per row."""
+import io
+import time
+
+import orjson
+import pytest
+
+from app.schemas.todos import TodoCreate
+from app.services.todo_import import TodoImportService
+from app.services.todos import TodoService
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+IMPORT_ROWS = 30000
+SINGLE_ROWS = 1000
+
+
+def upload(rows: int) -> io.BytesIO:
+    """NDJSON with one root per three rows and two subtasks under each."""
+    lines = (
+        {"id": i, "title": f"Root {i}"} if i % 3 == 0 else {"parent_id": i - i % 3, "title": f"Subtask {i}"}
+        for i in range(rows)
+    )
+    return io.BytesIO(b"\n".join(orjson.dumps(line) for line in lines))
+
+
+async def test_import_throughput(db, user, report):
+    started_at = time.perf_counter()
+    response = await TodoImportService(db).import_todos(upload(IMPORT_ROWS), "ndjson", False, user)
+    import_rate = response.created / (time.perf_counter() - started_at)
+    assert (response.created, response.error_count) == (IMPORT_ROWS, 0)
+
+    service = TodoService(db)
+    started_at = time.perf_counter()
+    for i in range(SINGLE_ROWS):
+        await service.create_todo(TodoCreate(title=f"Single {i}"), user)
+    single_rate = SINGLE_ROWS / (time.perf_counter() - started_at)
+
+    report(import_rows_per_s=round(import_rate), create_todo_rows_per_s=round(single_rate))
+    assert import_rate > single_rate * 5
@@ -0,0 +1,72 @@
+"""Todo request latency while logins verify passwords, inline and on the hashing pool."""
+import time
+
+import anyio
+import pytest
+
+from app.core.hashing import HashingService
+from app.core.security import get_password_hash, verify_password
+from app.schemas.todos import PaginationParams, TodoCreate, TodoFilter
+from app.services.todos import TodoService
+from tests.benchmarks.timing import summarize
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+CONCURRENT_LOGINS = 16
+PROBE_INTERVAL_S = 0.01
+
+
+async def todo_latency_under_logins(db, user, login):
+    """Durations of back-to-back list_todos calls while ``CONCURRENT_LOGINS`` logins run."""
+    service = TodoService(db)
+    durations = []
+    logins_done = anyio.Event()
+
+    async def logins():
+        async with anyio.create_task_group() as tasks:
+            for _ in range(CONCURRENT_LOGINS):
+                tasks.start_soon(login)
+        logins_done.set()
+
+    async def probe():
+        while not logins_done.is_set():
+            started_at = time.perf_counter()
+            await service.list_todos(user, TodoFilter(), PaginationParams(include_total=False))
+            durations.append((time.perf_counter() - started_at) * 1000)
+            await anyio.sleep(PROBE_INTERVAL_S)
+
+    async with anyio.create_task_group() as tasks:
+        tasks.start_soon(probe)
+        tasks.start_soon(logins)
+    return summarize(durations)
+
+
+async def test_todo_p99_under_concurrent_logins(db, user, report):
+    service = TodoService(db)
+    for i in range(20):
+        await service.create_todo(TodoCreate(title=f"Todo {i}"), user)
+    hashed_password = get_password_hash("correct horse")
+
+    async def inline_login():
+        # What the handlers did before: bcrypt on the event loop
+        verify_password("correct horse", hashed_password)
+        await anyio.sleep(0)
+
+    hashing = HashingService(max_workers=4)
+
+    async def pooled_login():
+        await hashing.verify("correct horse", hashed_password)
+
+    try:
+        inline = await todo_latency_under_logins(db, user, inline_login)
+        pooled = await todo_latency_under_logins(db, user, pooled_login)
+    finally:
+        hashing.shutdown()
+
+    report(
+        inline_median_ms=inline["median_ms"],
+        inline_p99_ms=inline["p99_ms"],
+        pooled_median_ms=pooled["median_ms"],
+        pooled_p99_ms=pooled["p99_ms"],
+    )
+    assert pooled["p99_ms"] < inline["p99_ms"]
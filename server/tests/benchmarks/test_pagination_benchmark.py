@@ -0,0 +1,56 @@
+"""Cursor pages cost the same at page 1000 as at page 1; OFFSET pages do not."""
+import time
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.models.todos import Todo
+from app.schemas.todos import PaginationParams, TodoFilter
+from app.services.todos import TodoService
+from tests.benchmarks.timing import summarize, time_calls
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+PAGE_SIZE = 10
+PAGES = 1000
+
+
+@pytest.fixture
+async def many_todos(db, user):
+    await db.execute(
+        insert(Todo),
+        [{"title": f"Todo {i}", "order": float(i), "user_id": user.id} for i in range(PAGE_SIZE * PAGES)]
+    )
+    # One insert stamps every row with the same second; give each its own
+    await db.execute(text("UPDATE todos SET created_at = datetime(created_at, '-' || id || ' seconds')"))
+    await db.commit()
+
+
+async def test_cursor_latency_is_flat_across_pages(db, user, many_todos, report):
+    service = TodoService(db)
+    durations = []
+    cursor = None
+    for _ in range(PAGES):
+        pagination = PaginationParams(page_size=PAGE_SIZE, cursor=cursor, include_total=False)
+        started_at = time.perf_counter()
+        page = await service.list_todos(user, TodoFilter(), pagination)
+        durations.append((time.perf_counter() - started_at) * 1000)
+        cursor = page["next_cursor"]
+    assert cursor is None
+
+    async def offset_page(number: int):
+        pagination = PaginationParams(page=number, page_size=PAGE_SIZE, include_total=False)
+        return await service.list_todos(user, TodoFilter(), pagination)
+
+    offset_first = summarize(await time_calls(lambda: offset_page(1), 50))
+    offset_last = summarize(await time_calls(lambda: offset_page(PAGES), 50))
+    first = summarize(durations[:50])
+    last = summarize(durations[-50:])
+    report(
+        cursor_first_ms=first["median_ms"],
+        cursor_last_ms=last["median_ms"],
+        offset_first_ms=offset_first["median_ms"],
+        offset_last_ms=offset_last["median_ms"],
+    )
+
+    assert last["median_ms"] < first["median_ms"] * 2 + 1
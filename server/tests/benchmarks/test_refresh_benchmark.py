@@ -0,0 +1,38 @@
+"""Refresh token hashing cost per rotation: bcrypt against the keyed digest."""
+import time
+import uuid
+
+import pytest
+
+from app.core.security import (
+    create_refresh_token,
+    get_password_hash,
+    hash_refresh_token,
+    verify_password,
+    verify_refresh_token_hash,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+BCRYPT_ROTATIONS = 10
+HMAC_ROTATIONS = 20000
+
+
+def rotations_per_second(rotations: int, hash_token, verify_token) -> float:
+    """Rotate refresh tokens the way ``/refresh`` does: verify the old one, hash its successor."""
+    token, _ = create_refresh_token(data={"sub": "1", "jti": str(uuid.uuid4())})
+    token_hash = hash_token(token)
+    started_at = time.perf_counter()
+    for _ in range(rotations):
+        assert verify_token(token, token_hash)
+        token, _ = create_refresh_token(data={"sub": "1", "jti": str(uuid.uuid4())})
+        token_hash = hash_token(token)
+    return rotations / (time.perf_counter() - started_at)
+
+
+async def test_refresh_throughput(report):
+    bcrypt_rate = rotations_per_second(BCRYPT_ROTATIONS, get_password_hash, verify_password)
+    hmac_rate = rotations_per_second(HMAC_ROTATIONS, hash_refresh_token, verify_refresh_token_hash)
+
+    report(bcrypt_refreshes_per_s=bcrypt_rate, hmac_refreshes_per_s=hmac_rate)
+    assert hmac_rate > bcrypt_rate * 100
@@ -0,0 +1,66 @@
+"""Serializing a 500-todo page with nested subtasks: validated and jsonable_encoder against the fast path."""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import ModelJSONResponse
+from app.models.todos import Todo
+from app.schemas.todos import TodoResponse
+from app.services.todos import TodoService
+from tests.benchmarks.timing import summarize, time_calls
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+ROOTS = 500
+SUBTASKS_PER_ROOT = 2
+REPEAT = 50
+
+
+def page_rows():
+    """Root todos and their subtasks as the page queries return them."""
+    now = datetime.now(timezone.utc)
+    parents = [
+        Todo(id=i, user_id=1, title=f"Todo {i}", order=float(i), created_at=now, modified_at=now)
+        for i in range(1, ROOTS + 1)
+    ]
+    subtasks = [
+        Todo(
+            id=ROOTS + i * SUBTASKS_PER_ROOT + j, user_id=1, title=f"Subtask {j}", order=float(j),
+            parent_id=parent.id, created_at=now, modified_at=now
+        )
+        for i, parent in enumerate(parents) for j in range(SUBTASKS_PER_ROOT)
+    ]
+    return parents, subtasks
+
+
+def validated_page(parents, subtasks):
+    """How pages were built before: a dict round trip and full validation per todo."""
+    todos = {parent.id: TodoResponse(**parent.model_dump()) for parent in parents}
+    for sub in subtasks:
+        todos[sub.parent_id].subtasks.append(TodoResponse(**sub.model_dump()))
+    return {"items": list(todos.values()), "total_count": ROOTS, "page": 1, "page_size": ROOTS, "has_more": False}
+
+
+async def test_page_serialization(report):
+    parents, subtasks = page_rows()
+    service = TodoService(None)
+
+    async def before():
+        JSONResponse(jsonable_encoder(validated_page(parents, subtasks)))
+
+    async def after():
+        items = service._nest_subtasks(parents, subtasks)
+        ModelJSONResponse({"items": items, "total_count": ROOTS, "page": 1, "page_size": ROOTS, "has_more": False})
+
+    validated = summarize(await time_calls(before, REPEAT))
+    fast = summarize(await time_calls(after, REPEAT))
+
+    report(
+        validated_median_ms=validated["median_ms"],
+        validated_p99_ms=validated["p99_ms"],
+        fast_median_ms=fast["median_ms"],
+        fast_p99_ms=fast["p99_ms"],
+    )
+    assert fast["median_ms"] * 2 < validated["median_ms"]
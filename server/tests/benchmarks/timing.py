@@ -0,0 +1,22 @@
+"""Timing helpers shared by the benchmarks."""
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+async def time_calls(call: Callable[[], Awaitable[Any]], repeat: int) -> List[float]:
+    """Run ``call`` ``repeat`` times and return each duration in milliseconds."""
+    durations: List[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - started_at) * 1000)
+    return durations
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """Median and p99 of a list of durations."""
+    ordered = sorted(durations)
+    return {
+        "median_ms": ordered[len(ordered) // 2],
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
@@ -0,0 +1,55 @@
+import os
+import tempfile
+from typing import AsyncIterator, Iterator, List
+
+# Point the app at a throwaway SQLite database before any app module is imported
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ["DATABASE_REPLICA_URL"] = ""
+os.environ["DB_STARTUP_MODE"] = "create_all"
+os.environ["TODO_EVENTS_BACKEND"] = "memory"
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.database import AsyncSessionLocal, engine
+from app.models.users import User
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[AsyncSession]:
+    """Session on freshly created tables, dropped again after the test."""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def user(db: AsyncSession) -> User:
+    user = User(username="alice", email="alice@example.com", name="Alice", hashed_password="not-a-hash")
+    db.add(user)
+    await db.commit()
+    return user
+
+
+@pytest.fixture
+def statements() -> Iterator[List[str]]:
+    """SQL statements sent to the database while the test runs."""
+    captured: List[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
@@ -0,0 +1,70 @@
+"""Auth fast path: principals from token claims with a cached active flag."""
+import anyio
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.core import deps
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import create_access_token
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def fast_path(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_FAST_PATH", True)
+    monkeypatch.setattr(deps, "_token_cache", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(deps, "_active_cache", TTLCache(maxsize=100, ttl=60))
+
+
+async def test_fast_path_looks_up_only_the_active_flag_once(db, user, statements, fast_path):
+    token = create_access_token(user)
+
+    first = await deps._authenticate(db, token)
+    second = await deps._authenticate(db, token)
+
+    assert len(statements) == 1
+    assert "is_active" in statements[0] and "hashed_password" not in statements[0]
+    assert (first.id, first.username, first.email) == (user.id, user.username, user.email)
+    assert second.id == user.id
+
+
+async def test_slow_path_loads_the_user_every_time(db, user, statements, monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_FAST_PATH", False)
+    token = create_access_token(user)
+    db.expunge_all()
+
+    for _ in range(2):
+        await deps._authenticate(db, token)
+        db.expunge_all()
+
+    assert len(statements) == 2
+
+
+async def test_orm_deactivation_invalidates_the_cache(db, user, fast_path):
+    token = create_access_token(user)
+    await deps._authenticate(db, token)
+
+    user.is_active = False
+    await db.commit()
+
+    with pytest.raises(HTTPException) as error:
+        await deps._authenticate(db, token)
+    assert error.value.status_code == 400
+
+
+async def test_sql_deactivation_takes_effect_when_the_cache_expires(db, user, fast_path, monkeypatch):
+    monkeypatch.setattr(deps, "_active_cache", TTLCache(maxsize=100, ttl=0.2))
+    token = create_access_token(user)
+    await deps._authenticate(db, token)
+
+    await db.execute(text("UPDATE users SET is_active = false WHERE id = :id"), {"id": user.id})
+    await db.commit()
+
+    # Documented bound: still accepted until the cached flag expires
+    assert (await deps._authenticate(db, token)).id == user.id
+    await anyio.sleep(0.25)
+    with pytest.raises(HTTPException):
+        await deps._authenticate(db, token)
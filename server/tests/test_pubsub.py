@@ -0,0 +1,120 @@
+"""ChangeHub behaviour on the in-process backend, and events tied to the write transaction."""
+import pytest
+
+from app.core.pubsub import RESYNC_EVENT, ChangeHub, InMemoryBackend, PostgresNotifyBackend, PubSubBackend
+from app.schemas.todos import TodoCreate
+from app.services import todos
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+EVENT = {"type": "changed", "ids": [1]}
+
+
+@pytest.fixture
+async def hub():
+    hub = ChangeHub(InMemoryBackend(), queue_size=2)
+    await hub.start()
+    yield hub
+    await hub.stop()
+
+
+def drain(subscription):
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+async def publish(hub, db, user_id, event):
+    await hub.publish(db, user_id, event)
+    await db.commit()
+
+
+async def test_publish_fans_out_to_every_subscriber_of_the_user(hub, db):
+    async with hub.subscribe(1) as first, hub.subscribe(1) as second, hub.subscribe(2) as other:
+        await publish(hub, db, 1, EVENT)
+
+        assert await first.get() == EVENT
+        assert await second.get() == EVENT
+        assert drain(other) == []
+
+
+async def test_overflowing_subscriber_gets_a_single_resync(hub, db):
+    async with hub.subscribe(1) as slow, hub.subscribe(1) as fast:
+        for todo_id in range(3):
+            await publish(hub, db, 1, {"type": "changed", "ids": [todo_id]})
+            drain(fast)
+
+        assert drain(slow) == [RESYNC_EVENT]
+        assert slow.dropped == 3
+
+
+async def test_unsubscribe_stops_delivery(hub, db):
+    async with hub.subscribe(1) as subscription:
+        assert hub.stats()["subscriptions"] == 1
+
+    await publish(hub, db, 1, EVENT)
+
+    assert drain(subscription) == []
+    assert hub.stats()["users"] == 0
+    assert hub.stats()["subscriptions"] == 0
+
+
+async def test_publish_before_start_is_dropped(db):
+    hub = ChangeHub(InMemoryBackend())
+    async with hub.subscribe(1) as subscription:
+        await publish(hub, db, 1, EVENT)
+
+        assert drain(subscription) == []
+
+
+async def test_events_are_delivered_only_when_the_transaction_commits(hub, db):
+    async with hub.subscribe(1) as subscription:
+        await hub.publish(db, 1, EVENT)
+        assert drain(subscription) == []
+
+        await db.commit()
+        assert drain(subscription) == [EVENT]
+
+        await hub.publish(db, 1, {"type": "deleted", "ids": [1]})
+        await db.rollback()
+        await db.commit()
+        assert drain(subscription) == []
+
+
+async def test_failed_writes_publish_nothing(hub, db, user, monkeypatch):
+    monkeypatch.setattr(todos, "change_hub", hub)
+    service = TodoService(db)
+    async with hub.subscribe(user.id) as subscription:
+        created = await service.create_todo(TodoCreate(title="Kept"), user)
+        assert drain(subscription) == [{"type": "changed", "ids": [created.id]}]
+
+        with pytest.raises(Exception):
+            await service.create_todo(TodoCreate(title="Orphan", parent_id=created.id + 100), user)
+        await db.rollback()
+        assert drain(subscription) == []
+
+
+class RecordingSession:
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, statement, parameters):
+        self.executed.append((str(statement), parameters))
+
+
+async def test_postgres_backend_notifies_on_the_writers_connection():
+    session = RecordingSession()
+
+    await PostgresNotifyBackend("postgresql://unused", "todo_changes").publish(session, 7, EVENT)
+
+    assert session.executed == [(
+        "SELECT pg_notify(:channel, :payload)",
+        {"channel": "todo_changes", "payload": '{"user_id":7,"event":{"type":"changed","ids":[1]}}'},
+    )]
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        PubSubBackend()
@@ -0,0 +1,175 @@
+"""Read-your-writes pinning and primary/replica routing of read-only routes."""
+import time
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+from starlette.requests import Request
+
+from app.api.v1 import todos
+from app.core import deps
+from app.core.cache import TTLCache
+from app.core.read_your_writes import (
+    READ_YOUR_WRITES_COOKIE,
+    ReadYourWritesMiddleware,
+    is_pinned_by_client,
+    note_committed_write,
+)
+from app.core.security import create_access_token
+from app.db import database
+from app.models.todos import Todo
+from app.models.users import User
+
+pytestmark = pytest.mark.anyio
+
+
+async def call(app, method="GET", path="/", headers=(), body=b""):
+    """Run one request through ``app`` and return its status, headers and body."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    response_headers = [(name.decode(), value.decode()) for name, value in messages[0]["headers"]]
+    response_body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], response_headers, response_body
+
+
+def endpoint(writes: bool):
+    async def app(scope, receive, send):
+        if writes:
+            note_committed_write()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+    return app
+
+
+def request_with_cookie(value):
+    return Request({"type": "http", "headers": [(b"cookie", f"{READ_YOUR_WRITES_COOKIE}={value}".encode())]})
+
+
+async def test_write_sets_pin_cookie():
+    _, headers, _ = await call(ReadYourWritesMiddleware(endpoint(writes=True)))
+
+    cookies = [value for name, value in headers if name == "set-cookie"]
+    assert len(cookies) == 1
+    assert cookies[0].startswith(f"{READ_YOUR_WRITES_COOKIE}=")
+    assert "HttpOnly" in cookies[0]
+
+
+async def test_read_sets_no_cookie():
+    _, headers, _ = await call(ReadYourWritesMiddleware(endpoint(writes=False)))
+
+    assert [name for name, _ in headers if name == "set-cookie"] == []
+
+
+def test_note_outside_a_request_is_ignored():
+    note_committed_write()
+
+
+def test_pin_cookie_expires():
+    assert is_pinned_by_client(request_with_cookie(time.time() + 60))
+    assert not is_pinned_by_client(request_with_cookie(time.time() - 1))
+    assert not is_pinned_by_client(request_with_cookie("garbage"))
+    assert not is_pinned_by_client(Request({"type": "http", "headers": []}))
+
+
+@pytest.fixture
+async def replica(db, user, tmp_path, monkeypatch):
+    """A second database standing in for the replica, holding one todo the primary lacks."""
+    replica_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db")
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(replica_engine) as session:
+        session.add(User(id=user.id, username=user.username, email=user.email, name=user.name, hashed_password="x"))
+        session.add(Todo(title="On the replica", user_id=user.id))
+        await session.commit()
+
+    monkeypatch.setattr(deps, "ReplicaSessionLocal", sessionmaker(
+        replica_engine, expire_on_commit=False, class_=AsyncSession
+    ))
+    monkeypatch.setattr(database, "_recent_writers", TTLCache(maxsize=100, ttl=60))
+    yield replica_engine
+    await replica_engine.dispose()
+
+
+async def read_session(request, db, user):
+    """The session ``get_read_db`` hands to a read-only route."""
+    sessions = deps.get_read_db(request, db, user)
+    session = await sessions.__anext__()
+    await sessions.aclose()
+    return session
+
+
+async def test_reads_go_to_the_replica(db, user, replica):
+    session = await read_session(Request({"type": "http", "headers": []}), db, user)
+
+    assert session is not db
+    assert session.bind is replica
+
+
+async def test_pinned_client_reads_from_the_primary(db, user, replica):
+    session = await read_session(request_with_cookie(time.time() + 60), db, user)
+
+    assert session is db
+
+
+async def test_recent_writer_on_this_worker_reads_from_the_primary(db, user, replica):
+    database.mark_recent_write(user.id)
+
+    session = await read_session(Request({"type": "http", "headers": []}), db, user)
+
+    assert session is db
+
+
+async def test_reads_use_the_primary_without_a_replica(db, user, monkeypatch):
+    monkeypatch.setattr(deps, "ReplicaSessionLocal", None)
+
+    session = await read_session(Request({"type": "http", "headers": []}), db, user)
+
+    assert session is db
+
+
+async def test_write_pins_the_clients_reads_on_another_worker(db, user, replica):
+    app = FastAPI()
+    app.include_router(todos.router, prefix="/todos")
+    app.add_middleware(ReadYourWritesMiddleware)
+    auth = ("Authorization", f"Bearer {create_access_token(user)}")
+
+    async def list_titles(*headers):
+        status_code, _, body = await call(app, "GET", "/todos", [auth, *headers])
+        assert status_code == 200
+        return [todo["title"] for todo in orjson.loads(body)["items"]]
+
+    assert await list_titles() == ["On the replica"]
+
+    status_code, headers, _ = await call(
+        app, "POST", "/todos", [auth, ("Content-Type", "application/json")], b'{"title": "Just written"}'
+    )
+    assert status_code == 200
+    pin = next(value for name, value in headers if name == "set-cookie").split(";")[0]
+
+    # Another worker has no record of the write; only the cookie pins the read
+    database._recent_writers.clear()
+    assert await list_titles(("Cookie", pin)) == ["Just written"]
+    assert await list_titles() == ["On the replica"]
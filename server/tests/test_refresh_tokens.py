@@ -0,0 +1,52 @@
+"""Refresh tokens are stored as keyed digests; bcrypt rows are recognised for migration."""
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.api.v1.auth import _revoke_refresh_token_cte
+from app.core.config import settings
+from app.core.security import (
+    create_refresh_token,
+    get_password_hash,
+    hash_refresh_token,
+    is_legacy_refresh_token_hash,
+    verify_refresh_token_hash,
+)
+
+
+def new_token() -> str:
+    token, _ = create_refresh_token(data={"sub": "1", "jti": str(uuid.uuid4())})
+    return token
+
+
+def test_digest_is_keyed_and_verified_in_constant_time(monkeypatch):
+    token = new_token()
+    token_hash = hash_refresh_token(token)
+
+    assert token_hash == hash_refresh_token(token)
+    assert not is_legacy_refresh_token_hash(token_hash)
+    assert verify_refresh_token_hash(token, token_hash)
+    assert not verify_refresh_token_hash(new_token(), token_hash)
+
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_HASH_KEY", "another key")
+    assert hash_refresh_token(token) != token_hash
+    assert not verify_refresh_token_hash(token, token_hash)
+
+
+def test_bcrypt_rows_are_legacy():
+    token = new_token()
+    legacy_hash = get_password_hash(token)
+
+    assert is_legacy_refresh_token_hash(legacy_hash)
+    # A bcrypt row never passes the digest check; it goes through bcrypt and is rehashed
+    assert not verify_refresh_token_hash(token, legacy_hash)
+
+
+def test_revocation_returns_the_stored_hash_in_the_same_statement():
+    revoked = _revoke_refresh_token_cte(uuid.uuid4())
+    sql = str(select(revoked.c.user_id, revoked.c.token_hash).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("WITH revoked AS \n(UPDATE refresh_tokens SET is_revoked")
+    assert "RETURNING refresh_tokens.user_id, refresh_tokens.token_hash" in sql
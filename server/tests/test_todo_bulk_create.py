@@ -0,0 +1,82 @@
+"""Bulk create: one parent lookup, one multi-row INSERT and per-item errors."""
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import ValidationException
+from app.schemas.todos import TodoBulkCreateRequest, TodoCreate
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+def verbs(statements):
+    return [statement.split(None, 1)[0].upper() for statement in statements]
+
+
+async def test_statement_count_does_not_grow_with_items(db, user, statements):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    statements.clear()
+
+    items = [TodoCreate(title=f"Todo {i}", parent_id=parent.id if i % 2 else None) for i in range(200)]
+    response = await service.create_todos_bulk(TodoBulkCreateRequest(items=items), user)
+
+    assert len(response.items) == 200 and response.errors == []
+    # Parents and sibling orders are looked up once. PostgreSQL receives the rows as
+    # one multi-row INSERT; SQLite cannot keep RETURNING in parameter order for a
+    # batch, so SQLAlchemy sends it one row at a time inside the same transaction.
+    assert verbs(statements[:2]) == ["SELECT", "SELECT"]
+    assert set(verbs(statements[2:])) == {"INSERT"}
+
+
+async def test_items_are_returned_in_request_order_and_appended_to_siblings(db, user):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    child = await service.create_todo(TodoCreate(title="Child", parent_id=parent.id), user)
+
+    response = await service.create_todos_bulk(
+        TodoBulkCreateRequest(items=[
+            TodoCreate(title="Second child", parent_id=parent.id),
+            TodoCreate(title="Root"),
+            TodoCreate(title="Third child", parent_id=parent.id),
+            TodoCreate(title="Pinned", order=0.5),
+        ]),
+        user
+    )
+
+    assert [todo.title for todo in response.items] == ["Second child", "Root", "Third child", "Pinned"]
+    second, root, third, pinned = response.items
+    assert child.order < second.order < third.order
+    assert root.order > parent.order
+    assert pinned.order == 0.5
+
+
+async def test_invalid_parents_are_reported_per_item(db, user):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    child = await service.create_todo(TodoCreate(title="Child", parent_id=parent.id), user)
+
+    response = await service.create_todos_bulk(
+        TodoBulkCreateRequest(items=[
+            TodoCreate(title="Fine", parent_id=parent.id),
+            TodoCreate(title="Missing parent", parent_id=parent.id + 100),
+            TodoCreate(title="Grandchild", parent_id=child.id),
+        ]),
+        user
+    )
+
+    assert [todo.title for todo in response.items] == ["Fine"]
+    assert [(error.index, error.message) for error in response.errors] == [
+        (1, "Parent todo not found"),
+        (2, "Cannot add subtask to a subtask"),
+    ]
+
+
+async def test_too_many_items_are_rejected(db, user, monkeypatch, statements):
+    monkeypatch.setattr(settings, "TODO_BULK_MAX_ITEMS", 2)
+
+    with pytest.raises(ValidationException):
+        await TodoService(db).create_todos_bulk(
+            TodoBulkCreateRequest(items=[TodoCreate(title=str(i)) for i in range(3)]), user
+        )
+    assert statements == []
@@ -0,0 +1,56 @@
+"""List ETags follow the per-user version that triggers bump on every write."""
+import pytest
+
+from app.models.users import User
+from app.schemas.todos import (
+    PaginationParams,
+    TodoBulkDeleteRequest,
+    TodoCreate,
+    TodoFilter,
+    TodoMoveRequest,
+    TodoUpdate,
+)
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+async def list_etag(service, user):
+    return await service.get_list_etag(user, TodoFilter(), PaginationParams())
+
+
+async def test_every_write_changes_the_list_etag(db, user):
+    service = TodoService(db)
+    etags = [await list_etag(service, user)]
+
+    first = await service.create_todo(TodoCreate(title="First"), user)
+    etags.append(await list_etag(service, user))
+    second = await service.create_todo(TodoCreate(title="Second"), user)
+    etags.append(await list_etag(service, user))
+    await service.update_todo(first.id, TodoUpdate(title="First, renamed"), user)
+    etags.append(await list_etag(service, user))
+    await service.move_todo(second.id, TodoMoveRequest(before_id=first.id), user)
+    etags.append(await list_etag(service, user))
+    await service.delete_todos_bulk(TodoBulkDeleteRequest(ids=[first.id]), user)
+    etags.append(await list_etag(service, user))
+
+    assert len(set(etags)) == len(etags)
+
+
+async def test_list_etag_is_stable_without_writes(db, user):
+    service = TodoService(db)
+    await service.create_todo(TodoCreate(title="Only"), user)
+
+    assert await list_etag(service, user) == await list_etag(service, user)
+
+
+async def test_list_etag_ignores_other_users_writes(db, user):
+    other = User(username="bob", email="bob@example.com", name="Bob", hashed_password="not-a-hash")
+    db.add(other)
+    await db.commit()
+    service = TodoService(db)
+    before = await list_etag(service, user)
+
+    await service.create_todo(TodoCreate(title="Not yours"), other)
+
+    assert await list_etag(service, user) == before
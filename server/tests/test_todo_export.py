@@ -0,0 +1,108 @@
+"""Streaming export: output formats and memory that does not grow with the account."""
+import csv
+import io
+import tracemalloc
+
+import orjson
+import pytest
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.models.todos import Todo, TodoStatus
+from app.schemas.todos import TodoCreate
+from app.services.todo_export import stream_todo_export
+from app.services.todos import TODO_RESPONSE_COLUMNS, TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+async def export(user, export_format, nested=True):
+    return b"".join([chunk async for chunk in stream_todo_export(user.id, export_format, nested)])
+
+
+@pytest.fixture
+async def todos(db, user):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title='Parent, "quoted"'), user)
+    await service.create_todo(TodoCreate(title="Child", parent_id=parent.id, status=TodoStatus.COMPLETED), user)
+    await service.create_todo(TodoCreate(title="Loner", is_bookmarked=True), user)
+    return parent
+
+
+async def test_ndjson_nests_subtasks_under_their_parent(db, user, todos):
+    lines = [orjson.loads(line) for line in (await export(user, "ndjson")).splitlines()]
+
+    assert [(line["title"], [subtask["title"] for subtask in line["subtasks"]]) for line in lines] == [
+        ('Parent, "quoted"', ["Child"]),
+        ("Loner", []),
+    ]
+    assert lines[0]["subtasks"][0]["status"] == "completed"
+    assert lines[0]["subtasks"][0]["parent_id"] == todos.id
+
+
+async def test_flat_ndjson_puts_each_subtask_after_its_parent(db, user, todos):
+    lines = [orjson.loads(line) for line in (await export(user, "ndjson", nested=False)).splitlines()]
+
+    assert [(line["title"], line["parent_id"]) for line in lines] == [
+        ('Parent, "quoted"', None),
+        ("Child", todos.id),
+        ("Loner", None),
+    ]
+    assert set(lines[0]) == set(TODO_RESPONSE_COLUMNS)
+
+
+async def test_csv_has_a_header_and_escaped_cells(db, user, todos):
+    rows = list(csv.DictReader(io.StringIO((await export(user, "csv")).decode())))
+
+    assert [row["title"] for row in rows] == ['Parent, "quoted"', "Child", "Loner"]
+    assert [row["status"] for row in rows] == ["pending", "completed", "pending"]
+    assert rows[0]["parent_id"] == "" and rows[1]["parent_id"] == str(todos.id)
+    assert rows[2]["is_bookmarked"] == "True"
+
+
+async def test_export_includes_only_the_users_todos(db, user):
+    assert await export(user, "ndjson") == b""
+    assert (await export(user, "csv")).decode().strip() == ",".join(TODO_RESPONSE_COLUMNS)
+
+
+async def seed(db, user, roots):
+    """Add ``roots`` root todos with two subtasks each."""
+    result = await db.scalars(
+        insert(Todo).returning(Todo.id, sort_by_parameter_order=True),
+        [{"title": f"Root {i}", "order": float(i), "user_id": user.id} for i in range(roots)]
+    )
+    parent_ids = list(result.all())
+    await db.execute(
+        insert(Todo),
+        [
+            {"title": f"Subtask {i}", "order": float(i), "parent_id": parent_id, "user_id": user.id}
+            for parent_id in parent_ids for i in range(2)
+        ]
+    )
+    await db.commit()
+
+
+async def export_peak_memory(user, export_format):
+    """Peak memory traced while streaming an export, and the number of bytes streamed."""
+    size = 0
+    tracemalloc.start()
+    try:
+        async for chunk in stream_todo_export(user.id, export_format, True):
+            size += len(chunk)
+        return tracemalloc.get_traced_memory()[1], size
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_memory_does_not_grow_with_row_count(db, user, monkeypatch, export_format):
+    monkeypatch.setattr(settings, "TODO_EXPORT_BATCH_SIZE", 50)
+    await seed(db, user, 500)
+    small_peak, small_size = await export_peak_memory(user, export_format)
+
+    # Five times the rows, streamed in 150 batches
+    await seed(db, user, 2000)
+    large_peak, large_size = await export_peak_memory(user, export_format)
+
+    assert large_size > small_size * 4
+    assert large_peak < small_peak * 1.5
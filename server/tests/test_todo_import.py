@@ -0,0 +1,137 @@
+"""Bulk import: reference resolution, per-record errors, dry runs, limits and round trips."""
+import io
+
+import pytest
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.exceptions import ValidationException
+from app.models.todos import Todo, TodoStatus
+from app.models.users import User
+from app.schemas.todos import TodoCreate
+from app.services.todo_export import stream_todo_export
+from app.services.todo_import import TodoImportService
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+async def import_lines(db, user, lines, import_format="ndjson", dry_run=False):
+    data = "\n".join(lines).encode()
+    return await TodoImportService(db).import_todos(io.BytesIO(data), import_format, dry_run, user)
+
+
+async def tree(db, user):
+    """The user's todos as {root title: [subtask titles]}, in list order."""
+    result = await db.execute(
+        select(Todo).where(Todo.user_id == user.id).order_by(Todo.order, Todo.id)
+    )
+    todos = list(result.scalars().all())
+    titles = {todo.id: todo.title for todo in todos}
+    nested = {todo.title: [] for todo in todos if todo.parent_id is None}
+    for todo in todos:
+        if todo.parent_id is not None:
+            nested[titles[todo.parent_id]].append(todo.title)
+    return nested
+
+
+@pytest.fixture
+async def other_user(db):
+    other = User(username="bob", email="bob@example.com", name="Bob", hashed_password="not-a-hash")
+    db.add(other)
+    await db.commit()
+    return other
+
+
+async def test_import_resolves_client_references(db, user):
+    response = await import_lines(db, user, [
+        '{"id": "a", "title": "A"}',
+        '{"id": "b", "parent_id": "a", "title": "B", "status": "completed"}',
+        '{"title": "N", "subtasks": [{"title": "N1"}, {"title": "N2", "is_bookmarked": true}]}',
+    ])
+
+    assert (response.created, response.error_count) == (5, 0)
+    assert await tree(db, user) == {"A": ["B"], "N": ["N1", "N2"]}
+
+
+async def test_invalid_rows_are_reported_and_skipped(db, user):
+    response = await import_lines(db, user, [
+        '{"id": "a", "title": "A"}',
+        "not json",
+        '{"title": "Orphan", "parent_id": "missing"}',
+        '{"title": "Bad status", "status": "bogus"}',
+        "[1]",
+    ])
+
+    assert response.created == 1
+    assert [(error.row, error.message.split(";")[0]) for error in response.errors] == [
+        (2, "Invalid JSON"),
+        (3, "Parent not found"),
+        (4, "status: Input should be 'pending', 'in_progress' or 'completed'"),
+        (5, "Expected a JSON object"),
+    ]
+
+
+async def test_rejected_record_drops_its_nested_subtasks(db, user):
+    response = await import_lines(db, user, [
+        '{"id": "x", "title": "A"}',
+        '{"id": "x", "title": "B", "subtasks": [{"title": "s"}]}',
+    ])
+
+    assert response.created == 1
+    assert [(error.row, error.message) for error in response.errors] == [(2, "Duplicate id 'x'")]
+    assert await tree(db, user) == {"A": []}
+
+
+async def test_dry_run_validates_without_inserting(db, user):
+    response = await import_lines(db, user, [
+        '{"id": "a", "title": "A"}',
+        '{"parent_id": "a", "title": "B"}',
+        '{"parent_id": "zz", "title": "C"}',
+    ], dry_run=True)
+
+    assert response.dry_run is True
+    assert (response.created, response.error_count) == (2, 1)
+    assert (await db.scalars(select(Todo.id))).all() == []
+
+
+async def test_too_many_rows_imports_nothing(db, user, monkeypatch):
+    monkeypatch.setattr(settings, "TODO_IMPORT_MAX_ROWS", 3)
+
+    with pytest.raises(ValidationException):
+        await import_lines(db, user, [f'{{"title": "T{i}"}}' for i in range(4)])
+
+    await db.rollback()
+    assert (await db.scalars(select(Todo.id))).all() == []
+
+
+async def test_imports_append_after_existing_todos_in_batches(db, user, monkeypatch):
+    monkeypatch.setattr(settings, "TODO_IMPORT_BATCH_SIZE", 2)
+    await TodoService(db).create_todo(TodoCreate(title="Existing"), user)
+
+    response = await import_lines(db, user, [
+        '{"id": 1, "title": "P"}',
+        '{"parent_id": 1, "title": "P1"}',
+        '{"parent_id": 1, "title": "P2"}',
+        '{"title": "Q"}',
+    ])
+
+    assert response.created == 4
+    assert await tree(db, user) == {"Existing": [], "P": ["P1", "P2"], "Q": []}
+
+
+@pytest.mark.parametrize("export_format, nested", [("ndjson", True), ("ndjson", False), ("csv", False)])
+async def test_export_round_trips_through_import(db, user, other_user, export_format, nested):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent, with comma"), user)
+    await service.create_todo(TodoCreate(title="Child", parent_id=parent.id, status=TodoStatus.COMPLETED), user)
+    await service.create_todo(TodoCreate(title="Second child", parent_id=parent.id), user)
+    await service.create_todo(TodoCreate(title="Loner", is_bookmarked=True), user)
+
+    exported = b"".join([chunk async for chunk in stream_todo_export(user.id, export_format, nested)])
+    response = await TodoImportService(db).import_todos(io.BytesIO(exported), export_format, False, other_user)
+
+    assert (response.created, response.error_count) == (4, 0)
+    assert await tree(db, other_user) == await tree(db, user)
+    statuses = (await db.scalars(select(Todo.status).where(Todo.user_id == other_user.id))).all()
+    assert sorted(statuses) == sorted((await db.scalars(select(Todo.status).where(Todo.user_id == user.id))).all())
@@ -0,0 +1,52 @@
+"""Sibling-list queries must be able to use the (user_id, parent_id, order, id) index."""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.models.todos import Todo
+from app.schemas.todos import TodoCreate, TodoMoveRequest
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+def compile_postgres(clause) -> str:
+    return str(clause.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+@pytest.mark.parametrize("parent_id, expected", [
+    (None, "todos.parent_id IS NULL"),
+    (7, "todos.parent_id = $2::INTEGER"),
+])
+def test_sibling_clause_compiles_to_an_indexable_predicate(parent_id, expected):
+    sql = compile_postgres(TodoService(None)._sibling_clause(1, parent_id))
+
+    assert "DISTINCT FROM" not in sql
+    assert sql == f"todos.user_id = $1::INTEGER AND {expected}"
+
+
+async def test_create_and_move_use_no_distinct_from(db, user, statements):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    first = await service.create_todo(TodoCreate(title="First", parent_id=parent.id), user)
+    second = await service.create_todo(TodoCreate(title="Second", parent_id=parent.id), user)
+    await service.move_todo(second.id, TodoMoveRequest(before_id=first.id), user)
+
+    assert statements
+    assert not [statement for statement in statements if "DISTINCT FROM" in statement.upper()]
+
+
+@pytest.mark.parametrize("parent_id", [None, 1])
+async def test_move_neighbor_lookup_uses_the_order_index(db, user, parent_id):
+    query = (
+        select(Todo.order)
+        .where(TodoService(db)._sibling_clause(user.id, parent_id))
+        .order_by(Todo.order, Todo.id)
+        .limit(1)
+    )
+    compiled = query.compile(db.bind, compile_kwargs={"literal_binds": True})
+
+    plan = (await db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+
+    assert any("ix_todos_user_id_parent_id_order" in row[-1] for row in plan)
@@ -0,0 +1,92 @@
+"""Cursor pagination walks every ordering in both directions without gaps or repeats."""
+import pytest
+from sqlalchemy import text
+
+from app.models.todos import TodoStatus
+from app.schemas.todos import PaginationParams, TodoCreate, TodoFilter
+from app.services.todos import CURSOR_DECODERS, TodoService
+
+pytestmark = pytest.mark.anyio
+
+STATUSES = [TodoStatus.PENDING, TodoStatus.IN_PROGRESS, TodoStatus.COMPLETED]
+
+
+@pytest.fixture
+async def todos(db, user):
+    service = TodoService(db)
+    created = []
+    for i in range(11):
+        todo = await service.create_todo(
+            TodoCreate(
+                title=f"Todo {i % 4}",
+                status=STATUSES[i % 3],
+                is_bookmarked=i % 2 == 0,
+                order=float(i % 5)
+            ),
+            user
+        )
+        created.append(todo)
+    await service.create_todo(TodoCreate(title="Subtask", parent_id=created[0].id), user)
+    # Spread some timestamps over earlier seconds, leaving ties between the rest,
+    # the way SQLite itself writes them
+    await db.execute(text(
+        "UPDATE todos SET created_at = datetime(created_at, '-' || (id % 3) || ' seconds'), "
+        "modified_at = datetime(modified_at, '-' || (id % 4) || ' minutes')"
+    ))
+    await db.commit()
+    return created
+
+
+async def walk(service, user, filters, order_by, order_direction, page_size=3):
+    """Collect root todo IDs page by page, following ``next_cursor``."""
+    ids = []
+    cursor = None
+    for _ in range(20):
+        page = await service.list_todos(
+            user,
+            filters,
+            PaginationParams(
+                page_size=page_size,
+                order_by=order_by,
+                order_direction=order_direction,
+                cursor=cursor,
+                include_total=False
+            )
+        )
+        ids.extend(todo.id for todo in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+    raise AssertionError("Pagination did not terminate")
+
+
+async def single_page(service, user, filters, order_by, order_direction):
+    page = await service.list_todos(
+        user,
+        filters,
+        PaginationParams(page_size=100, order_by=order_by, order_direction=order_direction)
+    )
+    return [todo.id for todo in page["items"]]
+
+
+@pytest.mark.parametrize("order_direction", ["asc", "desc"])
+@pytest.mark.parametrize("order_by", list(CURSOR_DECODERS))
+async def test_cursor_pages_match_a_single_page(db, user, todos, order_by, order_direction):
+    service = TodoService(db)
+
+    ids = await walk(service, user, TodoFilter(), order_by, order_direction)
+
+    assert len(ids) == len(todos)
+    assert ids == await single_page(service, user, TodoFilter(), order_by, order_direction)
+
+
+@pytest.mark.parametrize("order_direction", ["asc", "desc"])
+async def test_cursor_pages_respect_filters(db, user, todos, order_direction):
+    service = TodoService(db)
+    filters = TodoFilter(status=TodoStatus.PENDING, is_bookmarked=True)
+
+    ids = await walk(service, user, filters, "created_at", order_direction, page_size=1)
+
+    expected = {todo.id for todo in todos if todo.status == TodoStatus.PENDING and todo.is_bookmarked}
+    assert sorted(ids) == sorted(expected)
+    assert ids == await single_page(service, user, filters, "created_at", order_direction)
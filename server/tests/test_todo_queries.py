@@ -0,0 +1,73 @@
+"""Pin the todo write paths to their minimum number of database round trips."""
+import pytest
+from sqlmodel import select
+
+from app.models.todos import Todo, TodoTombstone
+from app.schemas.todos import TodoCreate, TodoUpdate
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+def verbs(statements):
+    return [statement.split(None, 1)[0].upper() for statement in statements]
+
+
+async def test_create_todo_is_a_single_insert(db, user, statements):
+    todo = await TodoService(db).create_todo(TodoCreate(title="Write tests"), user)
+
+    assert verbs(statements) == ["INSERT"]
+    assert todo.id is not None
+    assert todo.created_at is not None
+
+
+async def test_create_subtask_validates_parent_in_the_insert(db, user, statements):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    statements.clear()
+
+    subtask = await service.create_todo(TodoCreate(title="Child", parent_id=parent.id), user)
+
+    assert verbs(statements) == ["INSERT"]
+    assert subtask.parent_id == parent.id
+
+
+async def test_update_todo_is_a_single_update(db, user, statements):
+    service = TodoService(db)
+    todo = await service.create_todo(TodoCreate(title="Draft"), user)
+    statements.clear()
+
+    updated = await service.update_todo(todo.id, TodoUpdate(title="Final", is_bookmarked=True), user)
+
+    assert verbs(statements) == ["UPDATE"]
+    assert updated.title == "Final"
+    assert updated.is_bookmarked is True
+
+
+async def test_update_todo_parent_is_a_single_update(db, user, statements):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    todo = await service.create_todo(TodoCreate(title="Child"), user)
+    statements.clear()
+
+    updated = await service.update_todo(todo.id, TodoUpdate(parent_id=parent.id), user)
+
+    assert verbs(statements) == ["UPDATE"]
+    assert updated.parent_id == parent.id
+
+
+async def test_delete_todo_issues_no_subtask_select(db, user, statements):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    for title in ("First", "Second"):
+        await service.create_todo(TodoCreate(title=title, parent_id=parent.id), user)
+    statements.clear()
+
+    await service.delete_todo(parent.id, user)
+
+    # One DELETE removes the parent and its subtasks, one INSERT tombstones them
+    assert verbs(statements) == ["DELETE", "INSERT"]
+    assert "todo_tombstones" in statements[1]
+    assert (await db.scalars(select(Todo.id))).all() == []
+    tombstones = (await db.scalars(select(TodoTombstone.todo_id))).all()
+    assert len(tombstones) == 3 and parent.id in tombstones
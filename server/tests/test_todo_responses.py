@@ -0,0 +1,38 @@
+"""Responses built without re-validation encode exactly like the validated models."""
+import json
+
+import orjson
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import ModelJSONResponse
+from app.models.todos import TodoStatus
+from app.schemas.todos import PaginationParams, TodoCreate, TodoFilter, TodoResponse
+from app.services.todos import TodoService, _to_response
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_constructed_response_matches_the_validated_one(db, user):
+    todo = await TodoService(db).create_todo(TodoCreate(title="Check", status=TodoStatus.COMPLETED), user)
+    loaded = await TodoService(db)._get_todo_by_id(todo.id, user.id)
+
+    # The validating path every service method used before
+    assert _to_response(loaded).model_dump() == TodoResponse(**loaded.model_dump()).model_dump()
+
+
+@pytest.mark.parametrize("search", [None, "task"])
+async def test_orjson_page_matches_the_standard_encoder(db, user, search):
+    service = TodoService(db)
+    for i in range(3):
+        parent = await service.create_todo(TodoCreate(title=f"Task {i}", is_bookmarked=bool(i % 2)), user)
+        await service.create_todo(TodoCreate(title=f"Subtask {i}", parent_id=parent.id), user)
+    pagination = PaginationParams(order_by="relevance" if search else "created_at")
+    page = await service.list_todos(user, TodoFilter(search=search, parent_id=None), pagination)
+
+    fast = orjson.loads(ModelJSONResponse(page).body)
+    standard = json.loads(JSONResponse(jsonable_encoder(page)).body)
+
+    assert fast == standard
+    assert [len(item["subtasks"]) for item in fast["items"]] == [1, 1, 1]
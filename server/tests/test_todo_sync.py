@@ -0,0 +1,125 @@
+"""Delta sync: changes and tombstones after a version token, and when clients must reload."""
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import ValidationException
+from app.models.users import User
+from app.schemas.todos import TodoCreate, TodoUpdate
+from app.services.todos import TodoService
+
+pytestmark = pytest.mark.anyio
+
+
+async def initial_token(service, user):
+    response = await service.list_changes(user, None)
+    assert response.reset_required
+    return response.sync_token
+
+
+async def test_first_sync_asks_for_a_full_reload(db, user):
+    response = await TodoService(db).list_changes(user, None)
+
+    assert response.reset_required
+    assert response.changes == [] and response.deleted == []
+
+
+async def test_changes_after_the_token_are_returned_once(db, user):
+    service = TodoService(db)
+    kept = await service.create_todo(TodoCreate(title="Kept"), user)
+    token = await initial_token(service, user)
+
+    created = await service.create_todo(TodoCreate(title="New"), user)
+    await service.update_todo(kept.id, TodoUpdate(title="Kept, renamed"), user)
+    response = await service.list_changes(user, token)
+
+    assert not response.reset_required
+    assert [(todo.id, todo.title) for todo in response.changes] == [(created.id, "New"), (kept.id, "Kept, renamed")]
+    assert response.deleted == []
+
+    again = await service.list_changes(user, response.sync_token)
+    assert (again.changes, again.deleted, again.reset_required) == ([], [], False)
+
+
+async def test_deletes_come_back_as_tombstones(db, user):
+    service = TodoService(db)
+    parent = await service.create_todo(TodoCreate(title="Parent"), user)
+    child = await service.create_todo(TodoCreate(title="Child", parent_id=parent.id), user)
+    token = await initial_token(service, user)
+
+    await service.delete_todo(parent.id, user)
+    response = await service.list_changes(user, token)
+
+    assert response.changes == []
+    assert sorted((deleted.id, deleted.parent_id) for deleted in response.deleted) == [
+        (parent.id, None),
+        (child.id, parent.id),
+    ]
+
+
+async def test_sync_without_changes_is_one_lookup(db, user, statements):
+    service = TodoService(db)
+    await service.create_todo(TodoCreate(title="Only"), user)
+    token = await initial_token(service, user)
+    statements.clear()
+
+    response = await service.list_changes(user, token)
+
+    assert (response.changes, response.deleted, response.reset_required) == ([], [], False)
+    assert len(statements) == 1
+    assert "todo_list_versions" in statements[0]
+
+
+async def test_other_users_changes_are_not_returned(db, user):
+    other = User(username="bob", email="bob@example.com", name="Bob", hashed_password="not-a-hash")
+    db.add(other)
+    await db.commit()
+    service = TodoService(db)
+    token = await initial_token(service, user)
+
+    await service.create_todo(TodoCreate(title="Not yours"), other)
+    response = await service.list_changes(user, token)
+
+    assert (response.changes, response.reset_required) == ([], False)
+
+
+async def test_too_many_changes_ask_for_a_reload(db, user, monkeypatch):
+    monkeypatch.setattr(settings, "TODO_SYNC_MAX_CHANGES", 2)
+    service = TodoService(db)
+    token = await initial_token(service, user)
+    for title in ("One", "Two", "Three"):
+        await service.create_todo(TodoCreate(title=title), user)
+
+    response = await service.list_changes(user, token)
+
+    assert response.reset_required and response.changes == []
+    assert not (await service.list_changes(user, response.sync_token)).reset_required
+
+
+async def test_tokens_older_than_the_tombstone_retention_ask_for_a_reload(db, user):
+    service = TodoService(db)
+    await service.create_todo(TodoCreate(title="Before"), user)
+    await initial_token(service, user)
+    await service.create_todo(TodoCreate(title="After"), user)
+    issued_at = datetime.now(timezone.utc) - timedelta(days=settings.TODO_TOMBSTONE_RETENTION_DAYS + 1)
+
+    response = await service.list_changes(user, service._encode_sync_token(1, issued_at))
+
+    assert response.reset_required
+
+
+async def test_timestamp_tokens_ask_for_a_reload(db, user):
+    raw = json.dumps({"t": datetime.now(timezone.utc).isoformat()}).encode()
+
+    response = await TodoService(db).list_changes(user, base64.urlsafe_b64encode(raw).decode())
+
+    assert response.reset_required
+
+
+@pytest.mark.parametrize("token", ["garbage", base64.urlsafe_b64encode(b'{"v": "1", "t": "x"}').decode()])
+async def test_malformed_tokens_are_rejected(db, user, token):
+    with pytest.raises(ValidationException):
+        await TodoService(db).list_changes(user, token)